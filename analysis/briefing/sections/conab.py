@@ -2,7 +2,8 @@
 
 import pandas as pd
 
-from pipeline.query import read_brazil_estimates, read_psd
+from analysis.loaders import load_psd
+from pipeline.query import read_brazil_estimates
 
 
 def format() -> str:  # noqa: A001
@@ -12,7 +13,7 @@ def format() -> str:  # noqa: A001
     if brazil.empty:
         return "BRAZIL CROP ESTIMATES (CONAB): No data"
 
-    psd = read_psd()
+    psd = load_psd()
 
     for commodity in brazil["commodity"].unique():
         subset = brazil[brazil["commodity"] == commodity]
@@ -9,8 +9,8 @@ import logging
 
 import pandas as pd
 
+from analysis.loaders import load_dce_futures
 from analysis.spreads import compute_dce_crush_margin
-from pipeline.query import read_dce_futures
 from pipeline.units import to_metric_tons
 
 logger = logging.getLogger(__name__)
@@ -21,7 +21,7 @@ def format(  # noqa: A001
     currency_data: dict[str, pd.DataFrame] | None = None,
 ) -> str:
     lines = ["DCE CHINESE FUTURES (USD/MT):"]
-    dce_data = read_dce_futures()
+    dce_data = load_dce_futures()
 
     if dce_data.empty:
         return "DCE CHINESE FUTURES: No data"
@@ -1,11 +1,13 @@
 """EMERGING MARKETS section — South Africa, India, Nigeria, Brazil deep dive.
 
 Pulls structured data from `analysis.soy_analytics.emerging_markets_analysis`
-(lazy import to avoid a cycle — soy_analytics imports loaders that are
-shared with briefing). The India mandi sub-section is rendered inline at
-the bottom of the block.
+through the cached `load_emerging_markets()`, so the dashboard, this
+section and the snapshot share one run. The India mandi sub-section is
+rendered inline at the bottom of the block.
 """
 
+from analysis.loaders import load_emerging_markets
+
 
 def _format_india_domestic(em_countries: dict) -> str:
     """Inline India mandi domestic bean price + CBOT premium block.
@@ -59,8 +61,7 @@ def format() -> str:  # noqa: A001
     lines = ["EMERGING MARKETS (Soybeans):"]
 
     try:
-        from analysis.soy_analytics import emerging_markets_analysis
-        data = emerging_markets_analysis()
+        data = load_emerging_markets()
     except Exception:
         return "EMERGING MARKETS: Analysis unavailable"
 
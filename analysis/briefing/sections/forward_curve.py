@@ -1,19 +1,18 @@
 """FORWARD CURVE section — contango/backwardation per commodity."""
 
 from analysis.forward_curve import analyze_curve
-from pipeline.query import read_forward_curve
+from analysis.loaders import load_forward_curves
 
 
 def format() -> str:  # noqa: A001
     lines = ["FORWARD CURVE:"]
-    fc_data = read_forward_curve()
+    curves = load_forward_curves()
 
-    if fc_data.empty:
+    if not curves:
         return "FORWARD CURVE: No data"
 
-    for commodity in fc_data["commodity"].unique():
-        subset = fc_data[fc_data["commodity"] == commodity]
-        if subset.empty or len(subset) < 2:
+    for commodity, subset in curves.items():
+        if len(subset) < 2:
             continue
 
         result = analyze_curve(subset)
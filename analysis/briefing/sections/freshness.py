@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 
 import pandas as pd
 
+from analysis.loaders import load_health
 from config import FRESHNESS_WARNING_DAYS, FRESHNESS_WARNING_DAYS_BY_LAYER
 from pipeline.query import read_freshness
 
@@ -50,8 +51,7 @@ def format() -> str:  # noqa: A001 — module-scope name, no conflict with built
         sections.append("DATA FRESHNESS WARNINGS:\n" + "\n".join(layer_warnings))
 
     try:
-        from analysis.health import run_health_check
-        health = run_health_check()
+        health = load_health()
         if health["issues"]:
             sections.append(health["summary"])
     except Exception:
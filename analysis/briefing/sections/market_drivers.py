@@ -8,6 +8,7 @@ indicators applied) produced by the prices section.
 import pandas as pd
 
 from analysis.forward_curve import analyze_curve
+from analysis.loaders import load_forward_curves, load_psd, load_weather
 from config import (
     RSI_OVERBOUGHT,
     RSI_OVERSOLD,
@@ -21,9 +22,6 @@ from pipeline.query import (
     read_economic,
     read_eia_data,
     read_export_sales,
-    read_forward_curve,
-    read_psd,
-    read_weather,
 )
 from pipeline.units import to_metric_tons
 
@@ -74,7 +72,7 @@ def format(  # noqa: A001
                             f"AND RSI at {rsi_val:.0f} — short squeeze risk"
                         )
 
-    weather_data = read_weather()
+    weather_data = load_weather()
     if not weather_data.empty:
         active_alerts = []
         for region in weather_data["region"].unique():
@@ -153,11 +151,11 @@ def format(  # noqa: A001
                             f"demand signal bullish"
                         )
 
-    fc_data = read_forward_curve()
-    if not fc_data.empty:
+    curves = load_forward_curves()
+    if curves:
         for commodity in ["Soybeans", "Corn", "Wheat"]:
-            fc_subset = fc_data[fc_data["commodity"] == commodity]
-            if len(fc_subset) >= 2:
+            fc_subset = curves.get(commodity)
+            if fc_subset is not None and len(fc_subset) >= 2:
                 result = analyze_curve(fc_subset)
                 if result and "backwardation" in result.get("structure", ""):
                     drivers.append(
@@ -265,7 +263,7 @@ def format(  # noqa: A001
 
     brazil_data = read_brazil_estimates()
     if not brazil_data.empty:
-        psd_data_local = read_psd()
+        psd_data_local = load_psd()
         soy_conab = brazil_data[
             (brazil_data["commodity"] == "Soybeans") & (brazil_data["attribute"] == "Production")
         ]
@@ -8,8 +8,8 @@ This section is the source of two cross-section dependencies:
 
 import pandas as pd
 
+from analysis.loaders import technicals_for
 from analysis.signals import detect_all_signals
-from analysis.technical import compute_all_technicals
 from config import RSI_OVERBOUGHT, RSI_OVERSOLD
 from pipeline.units import mt_label, to_metric_tons
 
@@ -36,7 +36,7 @@ def format(price_data: dict[str, pd.DataFrame]) -> tuple[str, list[dict], dict[s
             lines.append(f"  {commodity}: No data")
             continue
 
-        df = compute_all_technicals(df)
+        df = technicals_for(commodity, df)
         enriched[commodity] = df
         latest = df.iloc[-1]
         close = latest["Close"]
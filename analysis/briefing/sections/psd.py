@@ -2,7 +2,7 @@
 
 import pandas as pd
 
-from pipeline.query import read_psd
+from analysis.loaders import load_psd
 
 # Argentina is the #1 soybean meal/oil exporter — its product balance
 # sheets move the soy complex as much as US/Brazil bean supply does.
@@ -40,7 +40,7 @@ def _latest_with_yoy(
 
 def format() -> str:  # noqa: A001
     lines = ["GLOBAL SUPPLY (USDA PSD):"]
-    psd_data = read_psd()
+    psd_data = load_psd()
 
     if psd_data.empty:
         return "GLOBAL SUPPLY (USDA PSD): No data"
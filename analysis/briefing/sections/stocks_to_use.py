@@ -9,13 +9,13 @@ low.
 
 from __future__ import annotations
 
+from analysis.loaders import load_psd
 from analysis.stocks_to_use import (
     HISTORY_WINDOW,
     MIN_HISTORY_YEARS,
     compute_stocks_to_use,
     detect_tight_supply,
 )
-from pipeline.query import read_psd
 
 # US balance sheets shown in the briefing (PSD title-case names). The
 # first four mirror config.WASDE_COMMODITIES; Soybean Meal and Soybean
@@ -33,7 +33,7 @@ _S2U_COMMODITIES = (
 
 def format() -> tuple[str, list[dict]]:  # noqa: A001
     """Return (text, signals) — orchestrator extends the briefing signal list."""
-    psd = read_psd()
+    psd = load_psd()
     stu = compute_stocks_to_use(psd, country="United States")
     if stu.empty:
         return "STOCKS-TO-USE (US): No data", []
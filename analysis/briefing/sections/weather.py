@@ -23,6 +23,7 @@ Agronomic alerts beyond the single-day thresholds:
 
 import pandas as pd
 
+from analysis.loaders import load_weather
 from analysis.zscore import format_zscore, trailing_zscore
 from config import (
     WEATHER_DRY_SPELL_ALERT_DAYS,
@@ -36,7 +37,6 @@ from config import (
     WEATHER_PRECIP_DEFICIT_WINDOW_DAYS,
     WEATHER_SOY_POD_FILL_MONTHS,
 )
-from pipeline.query import read_weather
 
 _LOOKBACK = pd.Timedelta(days=90)
 
@@ -127,7 +127,7 @@ def _annotate(text: str, z: float | None) -> str:
 
 def format() -> str:  # noqa: A001
     lines = ["WEATHER ALERTS:"]
-    weather_data = read_weather()
+    weather_data = load_weather()
 
     if weather_data.empty:
         return "WEATHER ALERTS: No data"
@@ -46,7 +46,14 @@ from analysis.briefing.sections.weather import (
 from analysis.briefing.types import BriefingData
 from analysis.correlations import commodity_correlation_matrix, commodity_vs_currency
 from analysis.forward_curve import analyze_curve, curve_slope
-from analysis.health import run_health_check
+from analysis.loaders import (
+    load_dce_futures,
+    load_emerging_markets,
+    load_forward_curves,
+    load_health,
+    load_psd,
+    load_weather,
+)
 from analysis.nass_crush import latest_crush
 from analysis.seasonal import current_vs_seasonal
 from analysis.spreads import compute_brazil_basis, compute_crush_spread
@@ -63,19 +70,15 @@ from pipeline.query import (
     read_brazil_spot,
     read_cot,
     read_crop_progress,
-    read_dce_futures,
     read_economic,
     read_eia_data,
     read_export_sales,
-    read_forward_curve,
     read_gulf_bids,
     read_inspection_destinations,
     read_inspections,
     read_port_flows,
-    read_psd,
     read_usda,
     read_wasde,
-    read_weather,
     read_worldbank_prices,
 )
 from pipeline.units import to_metric_tons
@@ -382,7 +385,7 @@ def _wasde_block() -> dict[str, dict[str, Any]]:
 
 
 def _stocks_to_use_block() -> dict[str, dict[str, Any]]:
-    psd = read_psd()
+    psd = load_psd()
     if psd.empty:
         return {}
     stu = compute_stocks_to_use(psd, country="United States")
@@ -589,7 +592,7 @@ def _inspections_block() -> dict[str, dict[str, Any]]:
 
 
 def _dce_block(price_data: dict[str, pd.DataFrame]) -> dict[str, dict[str, Any]]:
-    dce = read_dce_futures()
+    dce = load_dce_futures()
     if dce.empty:
         return {}
     out: dict[str, dict[str, Any]] = {}
@@ -611,11 +614,8 @@ def _dce_block(price_data: dict[str, pd.DataFrame]) -> dict[str, dict[str, Any]]
 
 
 def _forward_curve_block() -> dict[str, dict[str, Any]]:
-    curve = read_forward_curve()
-    if curve.empty:
-        return {}
     out: dict[str, dict[str, Any]] = {}
-    for commodity, subset in curve.groupby("commodity"):
+    for commodity, subset in sorted(load_forward_curves().items()):
         if len(subset) < 2:
             continue
         result = analyze_curve(subset)
@@ -660,7 +660,7 @@ def _conab_block() -> dict[str, dict[str, Any]]:
     conab = read_brazil_estimates()
     if conab.empty:
         return {}
-    psd = _safe("conab.psd", read_psd, pd.DataFrame())
+    psd = _safe("conab.psd", load_psd, pd.DataFrame())
     out: dict[str, dict[str, Any]] = {}
     for commodity, subset in conab.groupby("commodity"):
         crop_year = subset["crop_year"].max()
@@ -743,7 +743,7 @@ def _cot_block() -> dict[str, dict[str, Any]]:
 
 
 def _weather_block() -> dict[str, dict[str, Any]]:
-    weather = read_weather()
+    weather = load_weather()
     if weather.empty:
         return {}
     out: dict[str, dict[str, Any]] = {}
@@ -776,7 +776,7 @@ def _weather_block() -> dict[str, dict[str, Any]]:
 
 
 def _psd_highlights_block() -> dict[str, dict[str, Any] | None]:
-    psd = read_psd()
+    psd = load_psd()
     if psd.empty:
         return {}
     out: dict[str, dict[str, Any] | None] = {}
@@ -822,11 +822,7 @@ def _worldbank_block() -> dict[str, dict[str, Any]]:
 
 
 def _emerging_markets_block() -> dict[str, Any] | None:
-    # Lazy import mirrors the section — soy_analytics pulls in the whole
-    # loader stack and must not become an import-time dependency here.
-    from analysis.soy_analytics import emerging_markets_analysis
-
-    data = emerging_markets_analysis()
+    data = load_emerging_markets()
     return data or None
 
 
@@ -876,7 +872,7 @@ def _seasonal_block(price_data: dict[str, pd.DataFrame]) -> dict[str, dict[str,
 
 
 def _health_block() -> dict[str, Any] | None:
-    health = run_health_check()
+    health = load_health()
     if not health:
         return None
     issues = health.get("issues", [])
@@ -21,6 +21,7 @@ Key concepts for learning:
       change over time, so we compute correlation over a moving window
 """
 
+import numpy as np
 import pandas as pd
 
 # Minimum overlapping daily-return observations for a correlation to be
@@ -61,7 +62,38 @@ def commodity_correlation_matrix(price_dict: dict[str, pd.DataFrame]) -> pd.Data
         return pd.DataFrame()
 
     combined = pd.DataFrame(returns)
-    return combined.corr(min_periods=MIN_RETURN_OBS)
+    return _pairwise_corr(combined, min_periods=MIN_RETURN_OBS)
+
+
+def _pairwise_corr(df: pd.DataFrame, min_periods: int) -> pd.DataFrame:
+    """
+    Pairwise-complete Pearson correlation of every column pair.
+
+    Same result as ``df.corr(min_periods=...)`` — each pair uses only the
+    rows where both columns are present — but computed for all pairs at
+    once from a handful of matrix products over the zero-filled values
+    and the presence mask, instead of one masked pass per pair.
+
+    The one-pass sum formulation is fine here because inputs are daily
+    returns (mean ~0); don't reuse it on raw price levels.
+    """
+    x = df.to_numpy(dtype=np.float64)
+    present = ~np.isnan(x)
+    xz = np.where(present, x, 0.0)
+    mask = present.astype(np.float64)
+
+    n = mask.T @ mask                # n[i, j]: rows where both i and j exist
+    sum_x = xz.T @ mask              # sum_x[i, j]: Σ x_i over those rows
+    sum_xx = (xz * xz).T @ mask
+    sum_xy = xz.T @ xz
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sum_xy - sum_x * sum_x.T / n
+        var = sum_xx - sum_x * sum_x / n
+        corr = cov / np.sqrt(var * var.T)
+    corr[n < min_periods] = np.nan
+    np.clip(corr, -1.0, 1.0, out=corr)
+    return pd.DataFrame(corr, index=df.columns, columns=df.columns)
 
 
 def commodity_vs_currency(
@@ -139,3 +171,37 @@ def rolling_correlation(
         return pd.Series(dtype=float)
 
     return combined["a"].rolling(window=window).corr(combined["b"])
+
+
+def rolling_correlation_frame(
+    pairs: dict[str, tuple[pd.Series, pd.Series]],
+    window: int = 60,
+) -> pd.DataFrame:
+    """
+    Rolling return correlations for several pairs as one wide DataFrame.
+
+    Each column is `rolling_correlation(a, b, window)` for one pair, so
+    every pair keeps its own overlap (a currency and a future rarely share
+    a holiday calendar). Columns are outer-joined on date.
+
+    Parameters
+    ----------
+    pairs : dict
+        {label: (series_a, series_b)} price series with a DatetimeIndex.
+    window : int
+        Rolling window size in trading days.
+
+    Returns
+    -------
+    pd.DataFrame
+        Date-indexed frame with one column per label. Pairs with less than
+        a full window of overlap are omitted; empty if none qualify.
+    """
+    columns = {}
+    for label, (series_a, series_b) in pairs.items():
+        rc = rolling_correlation(series_a, series_b, window=window)
+        if not rc.empty:
+            columns[label] = rc
+    if not columns:
+        return pd.DataFrame()
+    return pd.concat(columns, axis=1).sort_index()
@@ -0,0 +1,97 @@
+"""
+Derived series pre-computed once per pipeline run.
+
+The Risk Monitor's rolling return correlations are a deterministic
+function of the price and currency tables, but each one is a 60-day
+rolling Pearson over the full history. Rather than recompute them every
+time the dashboard is built, `materialize_derived_series()` runs after
+the pipeline layers and writes them to the `derived_series` table;
+`soy_rolling_correlations()` then reads them back with a single
+SELECT, falling back to computing them when the table has not been
+populated yet (fresh DB, tests) or when the stored rows stop short of the
+latest Soybeans close (materialisation failed, or prices were written
+outside a pipeline run).
+
+Crush spread and the oil/meal and bean/corn ratios are not stored: each
+is a single vectorised expression over closes the analysts have already
+loaded, so a round-trip through SQLite would cost more than it saves.
+"""
+
+import pandas as pd
+
+from analysis.correlations import rolling_correlation_frame
+from analysis.loaders import clear_loader_cache, load_closes, load_currencies
+from pipeline.query import read_derived_series
+from pipeline.store import save_derived_series
+
+CORRELATION_WINDOW = 60
+
+# Stored series_name = prefix + chart label, e.g. "corr_60d:Soybeans vs Corn".
+_CORR_PREFIX = f"corr_{CORRELATION_WINDOW}d:"
+
+# (label, soybean counterpart, source) — source is "currency" or "price".
+_SOY_CORRELATION_PAIRS = (
+    ("Soybeans vs BRL/USD", "BRL/USD", "currency"),
+    ("Soybeans vs Soy Oil", "Soybean Oil", "price"),
+    ("Soybeans vs Corn", "Corn", "price"),
+)
+
+
+def compute_soy_rolling_correlations() -> pd.DataFrame:
+    """Rolling return correlations of Soybeans vs BRL/USD, Soy Oil and Corn.
+
+    Returns a Date-indexed frame with one column per available pair.
+    """
+    closes = load_closes()
+    if "Soybeans" not in closes.columns:
+        return pd.DataFrame()
+    currencies = load_currencies()
+    beans = closes["Soybeans"].dropna()
+
+    pairs = {}
+    for label, other, source in _SOY_CORRELATION_PAIRS:
+        if source == "currency":
+            if other in currencies and not currencies[other].empty:
+                pairs[label] = (beans, currencies[other]["Close"])
+        elif other in closes.columns:
+            pairs[label] = (beans, closes[other].dropna())
+    return rolling_correlation_frame(pairs, window=CORRELATION_WINDOW)
+
+
+def materialize_derived_series() -> int:
+    """Recompute every derived series and replace it in `derived_series`.
+
+    Call after the pipeline layers have written prices and currencies.
+    Returns the number of rows written.
+    """
+    clear_loader_cache()  # read what the layers just wrote, not a stale load
+    correlations = compute_soy_rolling_correlations()
+    total = 0
+    # Every known pair is rewritten, so one that can no longer be computed
+    # (e.g. a source went empty) is cleared rather than left stale.
+    for label, _, _ in _SOY_CORRELATION_PAIRS:
+        series = correlations[label] if label in correlations.columns else pd.Series(dtype=float)
+        total += save_derived_series(_CORR_PREFIX + label, series)
+    return total
+
+
+def _stored_is_current(stored: pd.DataFrame) -> bool:
+    """True when the stored correlations reach the latest Soybeans close."""
+    closes = load_closes()
+    if "Soybeans" not in closes.columns:
+        return False
+    return stored["Date"].max() == closes["Soybeans"].last_valid_index()
+
+
+def soy_rolling_correlations() -> pd.DataFrame:
+    """Stored soy rolling correlations, computed on the fly if missing or stale."""
+    stored = read_derived_series()
+    if not stored.empty:
+        stored = stored[stored["series_name"].str.startswith(_CORR_PREFIX)]
+    if stored.empty or not _stored_is_current(stored):
+        return compute_soy_rolling_correlations()
+
+    wide = stored.pivot(index="Date", columns="series_name", values="value").sort_index()
+    wide.columns = [name.removeprefix(_CORR_PREFIX) for name in wide.columns]
+    order = [label for label, _, _ in _SOY_CORRELATION_PAIRS if label in wide.columns]
+    return wide[order]
@@ -25,6 +25,7 @@ Key concepts for learning:
 
 import logging
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -55,19 +56,17 @@ def analyze_curve(df: pd.DataFrame) -> dict:
         return {}
 
     df = df.sort_values("contract_month").reset_index(drop=True)
-    front = df.iloc[0]["close"]
-    back = df.iloc[-1]["close"]
+    # Positional reads go through the NumPy array rather than per-row iloc.
+    close = df["close"].to_numpy(dtype=np.float64)
+    front = close[0]
+    back = close[-1]
     spread = back - front
     spread_pct = (spread / front) * 100 if front != 0 else 0
 
     # Determine structure by looking at sequential price changes
-    increases = 0
-    decreases = 0
-    for i in range(1, len(df)):
-        if df.iloc[i]["close"] > df.iloc[i - 1]["close"]:
-            increases += 1
-        elif df.iloc[i]["close"] < df.iloc[i - 1]["close"]:
-            decreases += 1
+    steps = np.diff(close)
+    increases = int((steps > 0).sum())
+    decreases = int((steps < 0).sum())
 
     total_moves = increases + decreases
     # The front→back spread sign decides contango vs backwardation — a
@@ -90,8 +89,10 @@ def analyze_curve(df: pd.DataFrame) -> dict:
     else:
         implication = "mixed signals across the curve"
 
-    front_label = df.iloc[0].get("label", "front")
-    back_label = df.iloc[-1].get("label", "back")
+    if "label" in df.columns:
+        front_label, back_label = df["label"].iloc[0], df["label"].iloc[-1]
+    else:
+        front_label, back_label = "front", "back"
 
     summary = (
         f"{structure.title()}: {front_label} {front:.2f} → {back_label} {back:.2f} "
@@ -138,8 +139,8 @@ def curve_slope(df: pd.DataFrame) -> float | None:
     if total_months == 0:
         return None
 
-    price_diff = df.iloc[-1]["close"] - df.iloc[0]["close"]
-    return price_diff / total_months
+    close = df["close"].to_numpy(dtype=np.float64)
+    return (close[-1] - close[0]) / total_months
 
 
 def calendar_spread(df: pd.DataFrame, near_idx: int = 0, far_idx: int = 1) -> dict:
@@ -17,15 +17,20 @@ from datetime import datetime, timezone
 import pandas as pd
 
 from config import (
+    AGRURAL_COMMODITIES,
+    CEPEA_COMMODITIES,
     COMMODITY_TICKERS,
+    CONAB_FARMGATE_SERIES,
     COT_COMMODITIES,
     CURRENCY_TICKERS,
     DB_PATH,
     DCE_CONTRACTS,
     FORWARD_CURVE_CONTRACTS,
     GROWING_REGIONS,
+    MANDI_STATES,
+    SAFEX_COMMODITIES,
 )
-from pipeline.connection import get_connection, is_cloud
+from pipeline.connection import get_read_connection, is_cloud
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +41,21 @@ _STALE_THRESHOLD_DAYS = 3
 # How many identical consecutive Close prices before flagging as "flat"
 _FLAT_PRICE_DAYS = 3
 
+# (table, key column, date column) for every table the freshness checks
+# and the per-commodity status list read.
+_TABLE_SPECS = (
+    ("prices",                "commodity", "Date"),
+    ("cot",                   "commodity", "Date"),
+    ("weather",               "region",    "Date"),
+    ("currencies",            "pair",      "Date"),
+    ("dce_futures",           "commodity", "Date"),
+    ("worldbank_prices",      "commodity", "Date"),
+    ("forward_curve",         "commodity", "fetched_date"),
+    ("india_domestic_prices", "commodity", "Date"),
+    ("brazil_spot_prices",    "commodity", "Date"),
+    ("safex_prices",          "commodity", "Date"),
+)
+
 
 def run_health_check() -> dict:
     """
@@ -57,20 +77,24 @@ def run_health_check() -> dict:
     issues = []
     commodity_status = []
 
+    # Per-key (last date, row count) for every checked table, read once
+    # and shared by the freshness checks and the status list.
+    stats = _read_table_stats()
+
     # --- Check each table for expected commodities ---
-    issues.extend(_check_prices())
-    issues.extend(_check_cot())
-    issues.extend(_check_weather())
-    issues.extend(_check_currencies())
-    issues.extend(_check_dce())
-    issues.extend(_check_forward_curve())
+    issues.extend(_check_prices(stats))
+    issues.extend(_check_cot(stats))
+    issues.extend(_check_weather(stats))
+    issues.extend(_check_currencies(stats))
+    issues.extend(_check_dce(stats))
+    issues.extend(_check_forward_curve(stats))
     issues.extend(_check_flat_prices())
-    issues.extend(_check_india_domestic())
-    issues.extend(_check_brazil_spot())
-    issues.extend(_check_safex())
+    issues.extend(_check_india_domestic(stats))
+    issues.extend(_check_brazil_spot(stats))
+    issues.extend(_check_safex(stats))
 
     # Build per-commodity status for the dashboard
-    commodity_status = _build_commodity_status()
+    commodity_status = _build_commodity_status(stats)
 
     # Build human-readable summary
     summary = _format_summary(issues)
@@ -82,34 +106,70 @@ def run_health_check() -> dict:
     }
 
 
-def _check_table_freshness(table: str, key_col: str, date_col: str,
+def _stats_sql(table: str, key_col: str, date_col: str) -> str:
+    """Per-key last date and row count for one table, tagged with its name."""
+    return (
+        f"SELECT '{table}', {key_col}, MAX({date_col}) AS last_date, COUNT(*) AS cnt "
+        f"FROM {table} GROUP BY {key_col}"
+    )
+
+
+def _read_table_stats() -> dict[str, list[tuple] | None]:
+    """
+    Per-key (key, last_date, count) rows for every table in _TABLE_SPECS.
+
+    All tables are read in one UNION ALL query, which is one round trip on
+    Turso instead of one per table. If that fails, e.g. because a table is
+    missing, each table is queried on its own so only the unreadable ones
+    map to None.
+    """
+    found: dict[str, list[tuple]] = {table: [] for table, _, _ in _TABLE_SPECS}
+    unreadable: set[str] = set()
+    with get_read_connection() as conn:
+        try:
+            rows = conn.execute(
+                " UNION ALL ".join(_stats_sql(*spec) for spec in _TABLE_SPECS)
+            ).fetchall()
+        except Exception:
+            rows = []
+            for spec in _TABLE_SPECS:
+                try:
+                    rows.extend(conn.execute(_stats_sql(*spec)).fetchall())
+                except Exception:
+                    unreadable.add(spec[0])
+
+    for table, key, last_date, count in rows:
+        found[table].append((key, last_date, count))
+    stats: dict[str, list[tuple] | None] = {
+        table: None if table in unreadable else table_rows for table, table_rows in found.items()
+    }
+    return stats
+
+
+def _check_table_freshness(table: str, rows: list[tuple] | None,
                            expected_keys: list[str],
                            stale_exempt: frozenset[str] = frozenset()) -> list[dict]:
     """
-    Check a table for missing or stale commodities.
+    Check a table's per-key stats for missing or stale commodities.
 
-    ``stale_exempt`` keys skip the staleness loop only — for series whose
-    normal cadence is slower than the daily threshold (e.g. weekly).
+    ``rows`` is the table's entry from `_read_table_stats()`; None means
+    the table could not be read. ``stale_exempt`` keys skip the staleness
+    loop only — for series whose normal cadence is slower than the daily
+    threshold (e.g. weekly).
 
     Returns a list of issue dicts.
     """
     issues = []
     today = datetime.now(timezone.utc).date()
 
-    with get_connection() as conn:
-        try:
-            rows = conn.execute(
-                f"SELECT {key_col}, MAX({date_col}) as last_date, COUNT(*) as cnt "
-                f"FROM {table} GROUP BY {key_col}"
-            ).fetchall()
-        except Exception:
-            issues.append({
-                "severity": "critical",
-                "table": table,
-                "commodity": "all",
-                "message": f"Table '{table}' does not exist or is unreadable",
-            })
-            return issues
+    if rows is None:
+        issues.append({
+            "severity": "critical",
+            "table": table,
+            "commodity": "all",
+            "message": f"Table '{table}' does not exist or is unreadable",
+        })
+        return issues
 
     found = {}
     for key, last_date, count in rows:
@@ -146,34 +206,34 @@ def _check_table_freshness(table: str, key_col: str, date_col: str,
     return issues
 
 
-def _check_prices() -> list[dict]:
+def _check_prices(stats: dict) -> list[dict]:
     expected = list(COMMODITY_TICKERS.keys())
-    return _check_table_freshness("prices", "commodity", "Date", expected)
+    return _check_table_freshness("prices", stats["prices"], expected)
 
 
-def _check_cot() -> list[dict]:
+def _check_cot(stats: dict) -> list[dict]:
     expected = list(COT_COMMODITIES.keys())
-    return _check_table_freshness("cot", "commodity", "Date", expected)
+    return _check_table_freshness("cot", stats["cot"], expected)
 
 
-def _check_weather() -> list[dict]:
+def _check_weather(stats: dict) -> list[dict]:
     expected = list(GROWING_REGIONS.keys())
-    return _check_table_freshness("weather", "region", "Date", expected)
+    return _check_table_freshness("weather", stats["weather"], expected)
 
 
-def _check_currencies() -> list[dict]:
+def _check_currencies(stats: dict) -> list[dict]:
     expected = list(CURRENCY_TICKERS.keys())
-    return _check_table_freshness("currencies", "pair", "Date", expected)
+    return _check_table_freshness("currencies", stats["currencies"], expected)
 
 
-def _check_dce() -> list[dict]:
+def _check_dce(stats: dict) -> list[dict]:
     expected = list(DCE_CONTRACTS.keys())
-    return _check_table_freshness("dce_futures", "commodity", "Date", expected)
+    return _check_table_freshness("dce_futures", stats["dce_futures"], expected)
 
 
-def _check_forward_curve() -> list[dict]:
+def _check_forward_curve(stats: dict) -> list[dict]:
     expected = list(FORWARD_CURVE_CONTRACTS.keys())
-    return _check_table_freshness("forward_curve", "commodity", "fetched_date", expected)
+    return _check_table_freshness("forward_curve", stats["forward_curve"], expected)
 
 
 def _check_flat_prices() -> list[dict]:
@@ -185,54 +245,52 @@ def _check_flat_prices() -> list[dict]:
     if not is_cloud() and not os.path.exists(DB_PATH):
         return issues
 
-    with get_connection() as conn:
+    # One windowed query returns the latest rows of every commodity,
+    # instead of a DISTINCT probe plus one query per commodity.
+    with get_read_connection() as conn:
         try:
-            commodities = [r[0] for r in conn.execute(
-                "SELECT DISTINCT commodity FROM prices"
-            ).fetchall()]
+            df = pd.read_sql(
+                "SELECT commodity, Close FROM ("
+                "  SELECT commodity, Date, Close, ROW_NUMBER() OVER ("
+                "    PARTITION BY commodity ORDER BY Date DESC) AS rn"
+                "  FROM prices"
+                ") WHERE rn <= ? ORDER BY commodity, rn",
+                conn,
+                params=(_FLAT_PRICE_DAYS + 1,),
+            )
         except Exception:
             return issues
 
-        for commodity in commodities:
-            try:
-                df = pd.read_sql(
-                    "SELECT Date, Close FROM prices WHERE commodity = ? ORDER BY Date DESC LIMIT ?",
-                    conn,
-                    params=(commodity, _FLAT_PRICE_DAYS + 1),
-                )
-            except Exception:
-                continue
-
-            if len(df) < _FLAT_PRICE_DAYS or "Close" not in df.columns:
-                continue
-
-            recent_closes = df["Close"].dropna().head(_FLAT_PRICE_DAYS)
-            if len(recent_closes) >= _FLAT_PRICE_DAYS and recent_closes.nunique() == 1:
-                issues.append({
-                    "severity": "warning",
-                    "table": "prices",
-                    "commodity": commodity,
-                    "message": f"FLAT — same Close price ({recent_closes.iloc[0]}) "
-                               f"for last {_FLAT_PRICE_DAYS} days (possible stale data)",
-                })
+    for commodity, rows in df.groupby("commodity", sort=False):
+        if len(rows) < _FLAT_PRICE_DAYS:
+            continue
+
+        recent_closes = rows["Close"].dropna().head(_FLAT_PRICE_DAYS)
+        if len(recent_closes) >= _FLAT_PRICE_DAYS and recent_closes.nunique() == 1:
+            issues.append({
+                "severity": "warning",
+                "table": "prices",
+                "commodity": commodity,
+                "message": f"FLAT — same Close price ({recent_closes.iloc[0]}) "
+                           f"for last {_FLAT_PRICE_DAYS} days (possible stale data)",
+            })
 
     return issues
 
 
-def _check_india_domestic() -> list[dict]:
+def _check_india_domestic(stats: dict) -> list[dict]:
     """Check the India mandi bean series for freshness.
 
     Only the live mandi series is expected — the retired NCDEX rows stay
     in the table under their own keys and would emit permanent false
     CRITICALs if listed here.
     """
-    from config import MANDI_STATES
     return _check_table_freshness(
-        "india_domestic_prices", "commodity", "Date", list(MANDI_STATES.values())
+        "india_domestic_prices", stats["india_domestic_prices"], list(MANDI_STATES.values())
     )
 
 
-def _check_brazil_spot() -> list[dict]:
+def _check_brazil_spot(stats: dict) -> list[dict]:
     """Check Brazil domestic soy prices for freshness (daily = >2 days stale).
 
     Expectations are AgRural Paranaguá FOB plus the CEPEA indicators
@@ -241,25 +299,23 @@ def _check_brazil_spot() -> list[dict]:
     (Layer 15b) also lives there but is weekly — the daily staleness
     threshold would flag it constantly, so it is stale-exempt.
     """
-    from config import AGRURAL_COMMODITIES, CEPEA_COMMODITIES, CONAB_FARMGATE_SERIES
     # TODO Phase 2.1: also flag when Paranaguá FOB (AgRural) vs CEPEA Paraná
     # diverges beyond the historical port-vs-farm wedge band — a structural break
     # there is a stronger trade signal than either source's absolute freshness.
     return _check_table_freshness(
-        "brazil_spot_prices", "commodity", "Date",
+        "brazil_spot_prices", stats["brazil_spot_prices"],
         AGRURAL_COMMODITIES + CEPEA_COMMODITIES,
         stale_exempt=frozenset({CONAB_FARMGATE_SERIES}),
     )
 
 
-def _check_safex() -> list[dict]:
+def _check_safex(stats: dict) -> list[dict]:
     """Check JSE SAFEX South Africa prices for freshness (daily = >2 days stale)."""
-    from config import SAFEX_COMMODITIES
     expected = list(SAFEX_COMMODITIES)
-    return _check_table_freshness("safex_prices", "commodity", "Date", expected)
+    return _check_table_freshness("safex_prices", stats["safex_prices"], expected)
 
 
-def _build_commodity_status() -> list[dict]:
+def _build_commodity_status(stats: dict) -> list[dict]:
     """
     Build a list of per-commodity status entries for dashboard display.
 
@@ -269,58 +325,37 @@ def _build_commodity_status() -> list[dict]:
     status_list: list[dict] = []
     today = datetime.now(timezone.utc).date()
 
-    table_specs = [
-        ("prices",                "commodity", "Date"),
-        ("cot",                   "commodity", "Date"),
-        ("weather",               "region",    "Date"),
-        ("currencies",            "pair",      "Date"),
-        ("dce_futures",           "commodity", "Date"),
-        ("worldbank_prices",      "commodity", "Date"),
-        ("forward_curve",         "commodity", "fetched_date"),
-        ("india_domestic_prices", "commodity", "Date"),
-        ("brazil_spot_prices",    "commodity", "Date"),
-        ("safex_prices",          "commodity", "Date"),
-    ]
+    for table, _, _ in _TABLE_SPECS:
+        rows = stats.get(table)
+        if not rows:
+            continue
 
-    if not is_cloud() and not os.path.exists(DB_PATH):
-        return status_list
-
-    with get_connection() as conn:
-        for table, key_col, date_col in table_specs:
-            try:
-                rows = conn.execute(
-                    f"SELECT {key_col}, MAX({date_col}) as last_date, COUNT(*) as cnt "
-                    f"FROM {table} GROUP BY {key_col}"
-                ).fetchall()
-            except Exception:
-                continue
-
-            for key, last_date, count in rows:
-                age_days = None
-                status = "unknown"
-                if last_date:
-                    try:
-                        last_dt = pd.to_datetime(last_date).date()
-                        age_days = (today - last_dt).days
-                        if age_days <= 1:
-                            status = "fresh"
-                        elif age_days <= _STALE_THRESHOLD_DAYS + 2:
-                            status = "aging"
-                        else:
-                            status = "stale"
-                    except Exception:
-                        status = "unknown"
-                else:
-                    status = "missing"
-
-                status_list.append({
-                    "commodity": key,
-                    "table": table,
-                    "last_date": last_date,
-                    "rows": count,
-                    "age_days": age_days,
-                    "status": status,
-                })
+        for key, last_date, count in rows:
+            age_days = None
+            status = "unknown"
+            if last_date:
+                try:
+                    last_dt = pd.to_datetime(last_date).date()
+                    age_days = (today - last_dt).days
+                    if age_days <= 1:
+                        status = "fresh"
+                    elif age_days <= _STALE_THRESHOLD_DAYS + 2:
+                        status = "aging"
+                    else:
+                        status = "stale"
+                except Exception:
+                    status = "unknown"
+            else:
+                status = "missing"
+
+            status_list.append({
+                "commodity": key,
+                "table": table,
+                "last_date": last_date,
+                "rows": count,
+                "age_days": age_days,
+                "status": status,
+            })
 
     return status_list
 
@@ -7,16 +7,73 @@ price and currency frames. This module holds the canonical loader so the
 two consumers don't drift.
 
 The loaders are `@lru_cache`d because a single dashboard run calls them
-5+ times. `clear_loader_cache()` resets the caches between pipeline runs
+5+ times. `Date` arrives already parsed to datetime64 from
+`pipeline.query._read_table`, so it is parsed once per load, not per
+consumer. `clear_loader_cache()` resets the caches between pipeline runs
 or in tests.
+
+Technical indicators are cached separately by `technicals_for()`, keyed
+on a hash of each commodity's full OHLCV frame rather than on the load.
+Clearing the raw loaders therefore only forces indicator recomputation
+for commodities whose data actually changed, and the briefing's PRICES
+section and the analytics desk share one computation.
 """
 
 from functools import lru_cache
 
 import pandas as pd
 
+from analysis.health import run_health_check
 from analysis.technical import compute_all_technicals
-from pipeline.query import read_currencies, read_prices
+from pipeline.connection import close_read_connections
+from pipeline.query import (
+    read_currencies,
+    read_dce_futures,
+    read_forward_curve,
+    read_prices,
+    read_psd,
+    read_weather,
+)
+
+# Columns kept in each per-key frame. The key column itself (`commodity` /
+# `pair`) is dropped: it is redundant with the dict key, and as the only
+# object-dtype column it made every downstream indicator copy pay for a
+# second block.
+_PRICE_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+_CURRENCY_COLUMNS = ["Date", "Open", "High", "Low", "Close"]
+
+# commodity -> (fingerprint, enriched frame). One entry per commodity, so
+# the cache is bounded by the number of tracked markets.
+_technicals_cache: dict[str, tuple[tuple, pd.DataFrame]] = {}
+
+
+def _fingerprint(df: pd.DataFrame) -> tuple:
+    """Identity for a price frame: columns, length, and a hash of every row.
+
+    The cached value is the whole enriched frame (OHLCV included), so the
+    key has to cover every column and date, not just Close. Each row hash
+    mixes in its index, so offsetting edits on different rows still change
+    the key.
+    """
+    if df.empty:
+        return (tuple(df.columns), 0)
+    row_hashes = pd.util.hash_pandas_object(df, index=True)
+    return (tuple(df.columns), len(df), int(row_hashes.sum()))
+
+
+def technicals_for(commodity: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Return `compute_all_technicals(df)`, reusing the last result when unchanged.
+
+    Callers must treat the returned frame as read-only — it is shared with
+    every other caller that asks for the same commodity.
+    """
+    key = _fingerprint(df)
+    hit = _technicals_cache.get(commodity)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    enriched = compute_all_technicals(df)
+    _technicals_cache[commodity] = (key, enriched)
+    return enriched
 
 
 @lru_cache(maxsize=2)
@@ -33,16 +90,30 @@ def load_prices(*, with_technicals: bool = False) -> dict[str, pd.DataFrame]:
     if all_prices.empty:
         return result
 
-    for commodity in all_prices["commodity"].unique():
-        subset = all_prices[all_prices["commodity"] == commodity].copy()
-        subset["Date"] = pd.to_datetime(subset["Date"])
+    # One grouping pass instead of a full-table boolean mask per commodity.
+    for commodity, subset in all_prices.groupby("commodity", sort=False)[_PRICE_COLUMNS]:
         subset = subset.set_index("Date").sort_index()
         if with_technicals:
-            subset = compute_all_technicals(subset)
+            subset = technicals_for(commodity, subset)
         result[commodity] = subset
     return result
 
 
+@lru_cache(maxsize=1)
+def load_closes() -> pd.DataFrame:
+    """Return a wide Date x commodity frame of Close prices.
+
+    Cross-commodity consumers (correlations) want aligned closes, not the
+    per-commodity OHLCV dict; pivoting once here replaces a filter, sort
+    and re-index per commodity on every call. Dates a commodity did not
+    trade are NaN.
+    """
+    all_prices = read_prices()
+    if all_prices.empty:
+        return pd.DataFrame()
+    return all_prices.pivot_table(index="Date", columns="commodity", values="Close").sort_index()
+
+
 @lru_cache(maxsize=1)
 def load_currencies() -> dict[str, pd.DataFrame]:
     """Return a dict[pair] -> DataFrame indexed by Date."""
@@ -51,15 +122,98 @@ def load_currencies() -> dict[str, pd.DataFrame]:
     if all_currencies.empty:
         return result
 
-    for pair in all_currencies["pair"].unique():
-        subset = all_currencies[all_currencies["pair"] == pair].copy()
-        subset["Date"] = pd.to_datetime(subset["Date"])
+    for pair, subset in all_currencies.groupby("pair", sort=False)[_CURRENCY_COLUMNS]:
         subset = subset.set_index("Date").sort_index()
         result[pair] = subset
     return result
 
 
+@lru_cache(maxsize=1)
+def load_forward_curves() -> dict[str, pd.DataFrame]:
+    """Return a dict[commodity] -> latest forward curve, sorted by contract_month.
+
+    The analytics desk, the briefing's FORWARD CURVE and MARKET DRIVERS
+    sections and the snapshot all read the same latest-snapshot table;
+    one grouped load replaces a query plus a full-table mask per consumer.
+    Keys keep the table's first-appearance order.
+    """
+    curves = read_forward_curve()
+    result: dict[str, pd.DataFrame] = {}
+    if curves.empty:
+        return result
+
+    for commodity, subset in curves.groupby("commodity", sort=False):
+        result[commodity] = subset.sort_values("contract_month").reset_index(drop=True)
+    return result
+
+
+@lru_cache(maxsize=1)
+def load_psd() -> pd.DataFrame:
+    """Return the full PSD table.
+
+    The supply and emerging-markets analysts, the snapshot and four
+    briefing sections each filter the same unfiltered read. Treat the
+    frame as read-only; it is shared.
+    """
+    return read_psd()
+
+
+@lru_cache(maxsize=1)
+def load_weather() -> pd.DataFrame:
+    """Return the full weather table (shared, read-only; see `load_psd`)."""
+    return read_weather()
+
+
+@lru_cache(maxsize=1)
+def load_dce_futures() -> pd.DataFrame:
+    """Return every DCE/CZCE series (shared, read-only; see `load_psd`).
+
+    Single-commodity reads (`read_dce_futures(name)`) stay on the query.
+    """
+    return read_dce_futures()
+
+
+@lru_cache(maxsize=1)
+def load_health() -> dict:
+    """Return `run_health_check()` for the current load.
+
+    The briefing's freshness section, the snapshot and the dashboard's
+    health panel each report the same check; it runs a dozen table
+    queries, so one dashboard build should pay for it once. The pipeline
+    itself calls `run_health_check()` directly for a fresh result.
+    """
+    return run_health_check()
+
+
+@lru_cache(maxsize=1)
+def load_emerging_markets() -> dict:
+    """Return `emerging_markets_analysis()` for the current load.
+
+    The dashboard section, the briefing's EMERGING MARKETS block and the
+    archived snapshot all render the same analysis; cache it so one build
+    runs it once. Treat the result as read-only.
+    """
+    # Lazy: soy_analytics imports this module.
+    from analysis.soy_analytics import emerging_markets_analysis
+
+    return emerging_markets_analysis()
+
+
 def clear_loader_cache() -> None:
-    """Reset both loader caches. Call between pipeline runs or in tests."""
+    """Reset the loader caches. Call between pipeline runs or in tests.
+
+    Also closes the cached read connections, so no SQLite handle outlives
+    the run that opened it. The technicals cache is left alone: its entries
+    are keyed on a hash of the full frame they were computed from, so stale
+    ones are never returned.
+    """
+    close_read_connections()
     load_prices.cache_clear()
+    load_closes.cache_clear()
     load_currencies.cache_clear()
+    load_forward_curves.cache_clear()
+    load_psd.cache_clear()
+    load_weather.cache_clear()
+    load_dce_futures.cache_clear()
+    load_health.cache_clear()
+    load_emerging_markets.cache_clear()
@@ -23,12 +23,21 @@ Key concepts for learning:
 """
 
 import logging
+from collections import defaultdict
 from typing import Any
 
 import pandas as pd
 
+from analysis.derived import soy_rolling_correlations
 from analysis.forward_curve import analyze_curve, calendar_spread
-from analysis.loaders import load_currencies, load_prices
+from analysis.loaders import (
+    load_currencies,
+    load_dce_futures,
+    load_forward_curves,
+    load_prices,
+    load_psd,
+    load_weather,
+)
 from analysis.nass_crush import latest_crush
 from analysis.seasonal import current_vs_seasonal, monthly_seasonal
 from analysis.signals import demote_near_roll_signals, detect_all_signals
@@ -58,15 +67,12 @@ from pipeline.query import (
     read_economic,
     read_eia_data,
     read_export_sales,
-    read_forward_curve,
     read_india_domestic,
     read_inspections,
-    read_psd,
     read_safex,
     read_wasde,
-    read_weather,
 )
-from pipeline.units import convert_df_to_mt, mt_label, to_metric_tons
+from pipeline.units import CONVERSION_FACTORS, convert_df_to_mt, mt_label, to_metric_tons
 
 logger = logging.getLogger(__name__)
 
@@ -279,7 +285,7 @@ def command_center() -> dict:
     # CNY/USD rate is available. Continuous main-contract legs; see
     # analysis.spreads.compute_dce_crush_margin for the roll caveat.
     try:
-        dce_crush = compute_dce_crush_margin(read_dce_futures())
+        dce_crush = compute_dce_crush_margin(load_dce_futures())
         if not dce_crush.empty:
             latest_dce = dce_crush.iloc[-1]
             key_metrics["dce_crush_cny_mt"] = float(latest_dce["crush_cny_mt"])
@@ -317,6 +323,42 @@ def command_center() -> dict:
 # Analyst 2: Supply — balance sheet and production
 # ---------------------------------------------------------------------------
 
+def _summarize_wasde(wasde: pd.DataFrame) -> dict[str, dict[str, dict[str, Any]]]:
+    """Latest estimate + MoM revision per (commodity, attribute).
+
+    WASDE rows include multiple marketing years per release (e.g. 2024/25
+    Est. and 2025/26 Proj. in the same April report). Each pair is pinned
+    to its latest MY so the MoM revision math compares like with like.
+    The pin, sort and split run once over the whole table instead of a
+    pair of boolean masks per (commodity, attribute).
+    """
+    keys = ["commodity", "attribute"]
+    latest_my = wasde.groupby(keys, sort=False)["year"].transform("max")
+    pinned = wasde[wasde["year"] == latest_my].sort_values("reference_period", kind="stable")
+    by_pair = {pair: rows for pair, rows in pinned.groupby(keys, sort=False)}
+
+    summary: dict[str, dict[str, dict[str, Any]]] = {}
+    # Walk pairs in table order so the dashboard lists them as before.
+    for commodity, attribute in wasde[keys].drop_duplicates().itertuples(index=False):
+        attr_rows = by_pair.get((commodity, attribute))
+        if attr_rows is None:
+            continue
+        latest = attr_rows.iloc[-1]
+        entry: dict[str, Any] = {
+            "value": latest.get("value"),
+            "unit": latest.get("unit", ""),
+            "period": latest.get("reference_period", ""),
+            "marketing_year": latest["year"],
+        }
+        if len(attr_rows) >= 2:
+            prev = attr_rows.iloc[-2]
+            if pd.notna(prev.get("value")) and pd.notna(latest.get("value")):
+                entry["revision"] = latest["value"] - prev["value"]
+                entry["prev_value"] = prev["value"]
+        summary.setdefault(commodity, {})[attribute] = entry
+    return summary
+
+
 def supply_analysis() -> dict:
     """
     Build the supply-side picture: WASDE, CONAB, PSD, crop progress.
@@ -332,39 +374,12 @@ def supply_analysis() -> dict:
     wasde_summary = {}
 
     if not wasde_data.empty:
-        for commodity in wasde_data["commodity"].unique():
-            subset = wasde_data[wasde_data["commodity"] == commodity]
-            attrs = {}
-            for attribute in subset["attribute"].unique():
-                attr_rows = subset[subset["attribute"] == attribute]
-                if attr_rows.empty:
-                    continue
-                # WASDE rows include multiple marketing years per release (e.g. 2024/25
-                # Est. and 2025/26 Proj. in the same April report). Pin to the latest
-                # MY so the MoM revision math compares like with like.
-                latest_my = attr_rows["year"].max()
-                attr_rows = attr_rows[attr_rows["year"] == latest_my]
-                attr_rows = attr_rows.sort_values("reference_period")
-                latest = attr_rows.iloc[-1]
-                entry: dict[str, Any] = {
-                    "value": latest.get("value"),
-                    "unit": latest.get("unit", ""),
-                    "period": latest.get("reference_period", ""),
-                    "marketing_year": latest_my,
-                }
-                if len(attr_rows) >= 2:
-                    prev = attr_rows.iloc[-2]
-                    if pd.notna(prev.get("value")) and pd.notna(latest.get("value")):
-                        entry["revision"] = latest["value"] - prev["value"]
-                        entry["prev_value"] = prev["value"]
-                attrs[attribute] = entry
-            if attrs:
-                wasde_summary[commodity] = attrs
+        wasde_summary = _summarize_wasde(wasde_data)
 
     # --- CONAB vs USDA ---
     conab_vs_usda = {}
     brazil = read_brazil_estimates()
-    psd = read_psd()
+    psd = load_psd()
 
     if not brazil.empty:
         soy_conab = brazil[
@@ -514,7 +529,7 @@ def demand_analysis() -> dict:
     china_buying = {}
 
     if not es.empty:
-        for commodity in ["Soybeans", "Soybean Oil", "Soybean Meal"]:
+        for commodity in SOY_LEGS:
             subset = es[es["commodity"] == commodity]
             if subset.empty:
                 continue
@@ -592,7 +607,7 @@ def demand_analysis() -> dict:
                 }
 
     # --- DCE vs CBOT ---
-    dce = read_dce_futures()
+    dce = load_dce_futures()
     dce_comparison = {}
     prices = _load_soy_prices()
 
@@ -634,6 +649,8 @@ def technicals_analysis() -> dict:
     Returns dict with:
         per_leg: dict of DataFrames with full technicals computed
         signals: list of all detected signals
+        signals_by_commodity: the same signals grouped per commodity,
+            each list keeping the severity order of `signals`
     """
     prices = _load_soy_prices()
 
@@ -654,10 +671,15 @@ def technicals_analysis() -> dict:
     severity_order = {"alert": 0, "warning": 1, "info": 2}
     all_signals.sort(key=lambda s: severity_order.get(s.get("severity", "info"), 3))
 
+    signals_by_commodity: dict[str, list[dict]] = defaultdict(list)
+    for signal in all_signals:
+        signals_by_commodity[signal["commodity"]].append(signal)
+
     return {
         "per_leg": per_leg,
         "per_leg_mt": per_leg_mt,
         "signals": all_signals,
+        "signals_by_commodity": dict(signals_by_commodity),
     }
 
 
@@ -670,7 +692,8 @@ def relative_value_analysis() -> dict:
     Relative value analysis: crush margin, oil/meal ratio, soy oil vs palm oil.
 
     Returns dict with:
-        crush: full crush spread DataFrame + current value
+        crush: full crush spread DataFrame, the same spread in USD/MT
+            (series_usd_mt), and current value
         basis: dict with keys primary (str), sources (per-source stats dict),
             and wedge_usd_mt (Paranaguá FOB − CEPEA Paraná in USD/MT, None if
             only one source is available).
@@ -701,11 +724,13 @@ def relative_value_analysis() -> dict:
         try:
             spread = compute_crush_spread(beans, oil, meal)
             if not spread.empty:
-                # Convert crush spread (cents/bu) to USD/MT
-                crush_mt = spread["crush_spread"].apply(lambda x: to_metric_tons(x, "Soybeans"))
+                # Convert crush spread (cents/bu) to USD/MT once, vectorised;
+                # the dashboard reads this series rather than re-deriving it.
+                crush_mt = spread["crush_spread"] * CONVERSION_FACTORS["Soybeans"]
                 last_252 = crush_mt.iloc[-252:] if len(crush_mt) >= 252 else crush_mt
                 result["crush"] = {
                     "series": spread,
+                    "series_usd_mt": crush_mt,
                     "as_of": _asof(spread.iloc[-1].get("Date")),
                     "current_usd_mt": crush_mt.iloc[-1],
                     "current_dollars_bu": spread.iloc[-1]["crush_spread"] / 100,
@@ -903,6 +928,16 @@ def relative_value_analysis() -> dict:
 # Analyst 6: Risk Monitor — threats and positioning
 # ---------------------------------------------------------------------------
 
+def _tail_by_group(df: pd.DataFrame, key: str, sort_col: str, n: int) -> dict[str, pd.DataFrame]:
+    """Last `n` rows per `key` value (ordered by `sort_col`), from a single sort.
+
+    Replaces the per-key ``df[df[key] == k].sort_values(...)`` pattern, which
+    re-masks and re-sorts the whole table once per key.
+    """
+    tails = df.sort_values(sort_col, kind="stable").groupby(key, sort=False).tail(n)
+    return {k: g for k, g in tails.groupby(key, sort=False)}
+
+
 def risk_analysis() -> dict:
     """
     Risk factors: BRL/USD, COT extremes, weather threats.
@@ -911,6 +946,8 @@ def risk_analysis() -> dict:
         currencies: BRL, CNY, ARS latest + changes
         cot: COT positioning for soy complex
         weather_alerts: active weather threats in soy regions
+        correlations: Date-indexed DataFrame of 60d rolling return
+            correlations, one column per pair ("Soybeans vs BRL/USD", ...)
     """
     # --- Currencies ---
     currencies_data = _load_currency_data()
@@ -934,9 +971,11 @@ def risk_analysis() -> dict:
     cot = read_cot()
     cot_summary = {}
     if not cot.empty:
+        # One sort for all legs; each leg only needs its last two reports.
+        cot_by_leg = _tail_by_group(cot[cot["commodity"].isin(SOY_LEGS)], "commodity", "Date", 2)
         for leg in SOY_LEGS:
-            subset = cot[cot["commodity"] == leg].sort_values("Date")
-            if subset.empty:
+            subset = cot_by_leg.get(leg)
+            if subset is None:
                 continue
             latest = subset.iloc[-1]
             entry = {
@@ -953,12 +992,15 @@ def risk_analysis() -> dict:
             cot_summary[leg] = entry
 
     # --- Weather ---
-    weather = read_weather()
+    weather = load_weather()
     weather_alerts = []
     if not weather.empty:
+        weather_by_region = _tail_by_group(
+            weather[weather["region"].isin(SOY_WEATHER_REGIONS)], "region", "Date", 1
+        )
         for region in SOY_WEATHER_REGIONS:
-            subset = weather[weather["region"] == region].sort_values("Date")
-            if subset.empty:
+            subset = weather_by_region.get(region)
+            if subset is None:
                 continue
             latest = subset.iloc[-1]
             precip = latest.get("precipitation", 0)
@@ -990,6 +1032,7 @@ def risk_analysis() -> dict:
         "currencies": currency_summary,
         "cot": cot_summary,
         "weather_alerts": weather_alerts,
+        "correlations": soy_rolling_correlations(),
     }
 
 
@@ -1038,30 +1081,32 @@ def forward_curve_analysis() -> dict:
 
     Returns dict per leg with:
         curve_data: raw forward curve DataFrame
-        analysis: contango/backwardation assessment
+        curve_data_mt: the same curve in USD/MT
+        analysis: contango/backwardation assessment, plus front_price_mt /
+                  back_price_mt
         calendar_spreads: front-month spreads
     """
-    fc = read_forward_curve()
+    curves = load_forward_curves()
     result: dict[str, Any] = {}
 
-    if fc.empty:
-        return result
-
     for leg in SOY_LEGS:
-        subset = fc[fc["commodity"] == leg].sort_values("contract_month")
-        if len(subset) < 2:
+        subset = curves.get(leg)
+        if subset is None or len(subset) < 2:
             continue
 
         curve_analysis = analyze_curve(subset)
         cal_spread = calendar_spread(subset, 0, 1) if len(subset) >= 2 else {}
 
-        # Convert forward curve prices to USD/MT
+        # Convert forward curve prices to USD/MT, front/back quotes included,
+        # so the dashboard only displays them.
         subset_mt = subset.copy()
-        if "close" in subset_mt.columns:
-            from pipeline.units import CONVERSION_FACTORS
-            factor = CONVERSION_FACTORS.get(leg)
-            if factor:
+        factor = CONVERSION_FACTORS.get(leg)
+        if factor:
+            if "close" in subset_mt.columns:
                 subset_mt["close"] = subset_mt["close"] * factor
+            if curve_analysis:
+                curve_analysis["front_price_mt"] = curve_analysis["front_price"] * factor
+                curve_analysis["back_price_mt"] = curve_analysis["back_price"] * factor
 
         result[leg] = {
             "curve_data": subset,
@@ -1143,8 +1188,8 @@ def emerging_markets_analysis() -> dict:
         countries: dict per country with PSD production/stocks/trade,
                    currency trends, and weather alerts
     """
-    psd = read_psd()
-    weather = read_weather()
+    psd = load_psd()
+    weather = load_weather()
     # Shared cached loaders (Date-indexed, sorted) — one DB read for the
     # whole function instead of one per country block.
     prices = load_prices()
@@ -15,6 +15,7 @@ Key concepts for learning:
 
 from typing import cast
 
+import numpy as np
 import pandas as pd
 
 
@@ -77,13 +78,21 @@ def add_rsi(df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
     avg_gain = gain.rolling(window=period, min_periods=period).mean()
     avg_loss = loss.rolling(window=period, min_periods=period).mean()
 
-    # Use Wilder smoothing after the initial SMA seed value
+    # Use Wilder smoothing after the initial SMA seed value. The recurrence
+    # runs over plain ndarrays: per-element .iloc access on a Series costs
+    # microseconds each and dominated compute_all_technicals().
     first_valid = avg_gain.first_valid_index()
     if first_valid is not None:
         start_loc = cast(int, avg_gain.index.get_loc(first_valid)) + 1
-        for i in range(start_loc, len(avg_gain)):
-            avg_gain.iloc[i] = (avg_gain.iloc[i - 1] * (period - 1) + gain.iloc[i]) / period
-            avg_loss.iloc[i] = (avg_loss.iloc[i - 1] * (period - 1) + loss.iloc[i]) / period
+        ag = avg_gain.to_numpy(dtype=np.float64, copy=True)
+        al = avg_loss.to_numpy(dtype=np.float64, copy=True)
+        g = gain.to_numpy(dtype=np.float64)
+        lo = loss.to_numpy(dtype=np.float64)
+        for i in range(start_loc, len(ag)):
+            ag[i] = (ag[i - 1] * (period - 1) + g[i]) / period
+            al[i] = (al[i - 1] * (period - 1) + lo[i]) / period
+        avg_gain = pd.Series(ag, index=avg_gain.index)
+        avg_loss = pd.Series(al, index=avg_loss.index)
 
     rs = avg_gain / avg_loss
     df["RSI"] = 100 - (100 / (1 + rs))
@@ -110,11 +119,26 @@ def add_price_changes(df: pd.DataFrame) -> pd.DataFrame:
         Same DataFrame with 'daily_pct_change' and 'weekly_pct_change' columns.
     """
     df = df.copy()
-    df["daily_pct_change"] = df["Close"].pct_change() * 100
-    df["weekly_pct_change"] = df["Close"].pct_change(periods=5) * 100
+    close = df["Close"].to_numpy(dtype=np.float64)
+    df["daily_pct_change"] = _pct_change(close, 1) * 100
+    df["weekly_pct_change"] = _pct_change(close, 5) * 100
     return df
 
 
+def _pct_change(close: np.ndarray, periods: int) -> np.ndarray:
+    """
+    Fractional change over ``periods`` rows, NaN-padded at the front.
+
+    Same result as ``Series.pct_change(periods)`` but as one ndarray
+    division — no index alignment or intermediate Series.
+    """
+    out = np.full(len(close), np.nan)
+    if len(close) > periods:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[periods:] = close[periods:] / close[:-periods] - 1
+    return out
+
+
 def calculate_macd(
     df: pd.DataFrame,
     fast: int = 12,
@@ -153,13 +177,16 @@ def calculate_macd(
     pd.DataFrame
         Same DataFrame with 'MACD', 'MACD_Signal', 'MACD_Histogram' columns.
     """
-    df = df.copy()
-    ema_fast = df["Close"].ewm(span=fast, adjust=False).mean()
-    ema_slow = df["Close"].ewm(span=slow, adjust=False).mean()
-    df["MACD"] = ema_fast - ema_slow
-    df["MACD_Signal"] = df["MACD"].ewm(span=signal, adjust=False).mean()
-    df["MACD_Histogram"] = df["MACD"] - df["MACD_Signal"]
-    return df
+    close = df["Close"]
+    # The EMA recurrences themselves are cheap; most of the cost is building
+    # and inserting intermediate Series, so work on ndarrays and add all
+    # three columns in one assign() (which also returns a new frame).
+    macd = (
+        close.ewm(span=fast, adjust=False).mean().to_numpy()
+        - close.ewm(span=slow, adjust=False).mean().to_numpy()
+    )
+    macd_signal = pd.Series(macd).ewm(span=signal, adjust=False).mean().to_numpy()
+    return df.assign(MACD=macd, MACD_Signal=macd_signal, MACD_Histogram=macd - macd_signal)
 
 
 def calculate_bollinger(df: pd.DataFrame, window: int = 20, num_std: float = 2.0) -> pd.DataFrame:
@@ -193,8 +220,8 @@ def calculate_bollinger(df: pd.DataFrame, window: int = 20, num_std: float = 2.0
         Same DataFrame with 'BB_Upper', 'BB_Middle', 'BB_Lower', 'BB_Width' columns.
     """
     df = df.copy()
-    df["BB_Middle"] = df["Close"].rolling(window=window).mean()
-    rolling_std = df["Close"].rolling(window=window).std()
+    mean, rolling_std = _rolling_mean_std(df["Close"].to_numpy(dtype=np.float64), [window])[window]
+    df["BB_Middle"] = mean
     df["BB_Upper"] = df["BB_Middle"] + (num_std * rolling_std)
     df["BB_Lower"] = df["BB_Middle"] - (num_std * rolling_std)
     # BB_Width as a percentage of middle band — useful for detecting squeezes
@@ -229,18 +256,66 @@ def calculate_volatility(df: pd.DataFrame, windows: list[int] | None = None) ->
     if windows is None:
         windows = [20, 60]
     df = df.copy()
-    daily_returns = df["Close"].pct_change()
+    daily_returns = _pct_change(df["Close"].to_numpy(dtype=np.float64), 1)
+    # All windows are read off one set of prefix sums.
+    stats = _rolling_mean_std(daily_returns, windows)
     for w in windows:
-        df[f"HV_{w}"] = daily_returns.rolling(window=w).std() * (252 ** 0.5) * 100
+        df[f"HV_{w}"] = stats[w][1] * (252 ** 0.5) * 100
     return df
 
 
+def _rolling_mean_std(
+    values: np.ndarray, windows: list[int]
+) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+    """
+    Trailing rolling mean and sample std (ddof=1) for several window sizes.
+
+    Builds prefix sums of x and x² once; each window's statistics are then
+    differences of those sums, so extra windows cost no further pass over
+    the data. Matches ``Series.rolling(w).mean()/.std()``: a window
+    containing any NaN yields NaN.
+
+    Values are centred on their overall mean before squaring. Variance is
+    shift-invariant, and centring keeps the E[x²] − E[x]² subtraction from
+    cancelling catastrophically on price levels in the hundreds or
+    thousands.
+    """
+    n = len(values)
+    present = ~np.isnan(values)
+    centre = float(values[present].mean()) if present.any() else 0.0
+    x = np.where(present, values - centre, 0.0)
+
+    zero = np.zeros(1)
+    s1 = np.concatenate([zero, np.cumsum(x)])
+    s2 = np.concatenate([zero, np.cumsum(x * x)])
+    count = np.concatenate([zero, np.cumsum(present)])
+
+    out: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    for w in windows:
+        mean = np.full(n, np.nan)
+        std = np.full(n, np.nan)
+        if n >= w:
+            sum1 = s1[w:] - s1[:-w]
+            sum2 = s2[w:] - s2[:-w]
+            full = (count[w:] - count[:-w]) == w
+            m = sum1 / w
+            var = np.maximum(sum2 - sum1 * m, 0.0) / (w - 1) if w > 1 else np.full(len(m), np.nan)
+            mean[w - 1:] = np.where(full, m + centre, np.nan)
+            std[w - 1:] = np.where(full, np.sqrt(var), np.nan)
+        out[w] = (mean, std)
+    return out
+
+
 def compute_all_technicals(df: pd.DataFrame) -> pd.DataFrame:
     """
     Convenience function: runs all technical indicators on a price DataFrame.
 
     Returns a new DataFrame with moving averages, RSI, MACD, Bollinger Bands,
     historical volatility, and price change columns added.
+
+    Indicators are computed in float64. Downcasting inputs to float32 buys
+    nothing here: pandas' rolling and ewm kernels upcast to float64
+    internally, so it would only add conversions and lose precision.
     """
     df = add_moving_averages(df)
     df = add_rsi(df)
@@ -2,10 +2,19 @@
 
 All functions return go.Figure objects, used by the static HTML generator
 (scripts/generate_html.py).
+
+Dense daily time series use `go.Scattergl` (WebGL) so pan/zoom stays
+smooth on multi-year histories. Sparse charts (forward curve, seasonal
+marker) stay on SVG `go.Scatter`: browsers cap live WebGL contexts at
+~16 per page, so GL is reserved for the charts that need it. The crush
+chart's profit/loss fills are SVG too, since they rely on NaN gaps.
 """
 
+import math
 from datetime import datetime
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -36,9 +45,33 @@ COLORS = {
 
 MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-
-# Shared light editorial layout defaults applied to every figure
+# Array form for vectorised month-number -> label lookups.
+MONTH_NAMES_NP = np.array(MONTH_NAMES)
+
+# Technical charts keep this many trailing sessions at daily resolution;
+# older history is shown as weekly bars. 15y of daily candles is ~3,800
+# bars per leg — far more than a chart is wide — and dominated page weight.
+TECHNICAL_DAILY_BARS = 504  # ~2 trading years
+
+# Ceiling on candles sent to the browser per technical chart. Candlestick
+# traces are drawn as one SVG path per candle; when weekly history would
+# still exceed this, the older part is collapsed to monthly instead.
+TECHNICAL_MAX_BARS = 2000
+
+# Point budget for the indicator line traces on a technical chart. Lines
+# are decimated with LTTB; candles and bars are not (see _reduce_history).
+TECHNICAL_LINE_POINTS = 800
+
+# Point budget per trace for the single-series daily line charts (crush,
+# basis, ratios, correlations). 15y of daily data is ~3,800 points per
+# line; LTTB keeps the visible shape at roughly the chart's pixel width.
+SERIES_LINE_POINTS = 1000
+
+# Shared light editorial layout defaults applied to every figure.
+# A constant uirevision keeps a reader's zoom/pan and legend toggles when
+# plotly.js re-plots a figure in place (responsive relayout, Plotly.react).
 _BASE_LAYOUT = dict(
+    uirevision="mirror-market",
     paper_bgcolor=COLORS["card"],
     plot_bgcolor=COLORS["surface"],
     font=dict(color=COLORS["text"], family="Inter, sans-serif", size=12),
@@ -50,45 +83,228 @@ _BASE_LAYOUT = dict(
 
 
 # ---------------------------------------------------------------------------
-# Color helpers
+# Formatting helpers
 # ---------------------------------------------------------------------------
-def chg_color(val: float | None) -> str:
-    """Return bullish/bearish color based on positive/negative value."""
-    if pd.isna(val):
-        return COLORS["neutral"]
-    return COLORS["bullish"] if val >= 0 else COLORS["bearish"]
-
-
 def delta_str(val: float | None) -> str:
-    """Format a number as +X.X% or -X.X%."""
-    if pd.isna(val):
+    """Format a number as +X.X% or -X.X% ("N/A" for None/NaN).
+
+    Called once per metric card, so it checks scalars directly rather
+    than going through pd.isna.
+    """
+    if val is None or (isinstance(val, (float, np.floating)) and math.isnan(val)):
         return "N/A"
     return f"{val:+.1f}%"
 
 
+# ---------------------------------------------------------------------------
+# Data reduction helpers
+# ---------------------------------------------------------------------------
+def _period_ohlc(df: pd.DataFrame, freq: str) -> pd.DataFrame:
+    """Aggregate a daily OHLC(V) + indicator frame to one row per `freq` period.
+
+    OHLC aggregate as a candle should (first/max/min/last). Volume is the
+    period *mean* so aggregated and daily bars share a scale on mixed
+    charts. Indicator columns take the period's last value — the daily
+    indicator as of the period close, not an indicator recomputed on
+    aggregated bars. Each row is labelled with the period's last actual
+    trading date.
+    """
+    ohlc = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "mean"}
+    spec = {col: ohlc.get(col, "last") for col in df.columns}
+    periods = df.index.to_period(freq)
+    out = df.groupby(periods).agg(spec)
+    out.index = pd.DatetimeIndex(df.index.to_series().groupby(periods).max().to_numpy(), name=df.index.name)
+    return out
+
+
+def _weekly_ohlc(df: pd.DataFrame) -> pd.DataFrame:
+    """One candle per week (see `_period_ohlc`)."""
+    return _period_ohlc(df, "W")
+
+
+def _reduce_history(
+    df: pd.DataFrame,
+    daily_bars: int = TECHNICAL_DAILY_BARS,
+    max_bars: int = TECHNICAL_MAX_BARS,
+) -> pd.DataFrame:
+    """Keep the last `daily_bars` rows daily and collapse older history.
+
+    Older history is weekly, or monthly when weekly candles would push the
+    total past `max_bars`.
+    """
+    if len(df) <= daily_bars:
+        return df
+    older, recent = df.iloc[:-daily_bars], df.iloc[-daily_bars:]
+    reduced = _weekly_ohlc(older)
+    if len(reduced) + len(recent) > max_bars:
+        reduced = _period_ohlc(older, "M")
+    return pd.concat([reduced, recent])
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Row positions chosen by Largest-Triangle-Three-Buckets downsampling.
+
+    Always keeps the first and last point; from each of the `n_out - 2`
+    interior buckets keeps the point forming the largest triangle with the
+    previously kept point and the next bucket's mean, which preserves the
+    peaks and troughs a plain stride would drop. Returns every position
+    when the series already fits the budget. NaN y-values are never
+    selected over a finite neighbour.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+
+    prev = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nxt_lo, nxt_hi = hi, edges[b + 2] if b + 2 < len(edges) else n
+        nx = x[nxt_lo:nxt_hi].mean()
+        ny = np.nanmean(y[nxt_lo:nxt_hi]) if np.isfinite(y[nxt_lo:nxt_hi]).any() else y[prev]
+        area = np.abs(
+            (x[prev] - nx) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (ny - y[prev])
+        )
+        prev = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        keep[b + 1] = prev
+    return keep
+
+
+def _decimate_lines(df: pd.DataFrame, n_out: int = TECHNICAL_LINE_POINTS) -> pd.DataFrame:
+    """Rows of `df` selected by LTTB on Close, shared by every line trace.
+
+    Using one index set for all indicators keeps paired traces (the
+    Bollinger band fill) on common x values.
+    """
+    idx = _lttb_indices(df.index.asi8, df["Close"].to_numpy(), n_out)
+    return df.iloc[idx]
+
+
+def _decimate_series(x, y, n_out: int = SERIES_LINE_POINTS) -> tuple[pd.DatetimeIndex, np.ndarray]:
+    """LTTB-decimated (dates, values) for one dense daily line."""
+    dates = pd.DatetimeIndex(x)
+    values = np.asarray(y, dtype=np.float64)
+    idx = _lttb_indices(dates.asi8, values, n_out)
+    return dates[idx], values[idx]
+
+
+def _day_axis(dates) -> np.ndarray | pd.DatetimeIndex:
+    """Date-only x values for a trace when every timestamp is a midnight.
+
+    Plotly serialises datetimes as full "YYYY-MM-DDTHH:MM:SS" strings,
+    which outweigh the base64-packed y values; "YYYY-MM-DD" plots on the
+    same date axis at about half the bytes. Intraday timestamps are
+    returned unchanged.
+    """
+    dates = pd.DatetimeIndex(dates)
+    if not dates.equals(dates.normalize()):
+        return dates
+    return dates.strftime("%Y-%m-%d").to_numpy()
+
+
+# ---------------------------------------------------------------------------
+# Reference guides
+# ---------------------------------------------------------------------------
+# Full-width lines and bands on single-axis charts, as plain layout dicts.
+# They match what fig.add_hline / add_hrect emit there, but skip those
+# helpers' per-call subplot scan and re-validation, several ms per guide.
+
+def _hline(y: float, color: str, dash: str = "dash",
+           label: str | None = None, label_color: str | None = None) -> tuple[dict, dict | None]:
+    """(shape, annotation or None) for a horizontal line labelled at its right end."""
+    shape = dict(type="line", xref="x domain", x0=0, x1=1, yref="y", y0=y, y1=y,
+                 line=dict(color=color, dash=dash))
+    if label is None:
+        return shape, None
+    return shape, dict(text=label, font=dict(color=label_color), showarrow=False,
+                       xref="x domain", x=1, xanchor="right", yref="y", y=y, yanchor="bottom")
+
+
+def _hrect(y0: float, y1: float, fillcolor: str,
+           label: str, label_color: str) -> tuple[dict, dict]:
+    """(shape, annotation) for a horizontal band labelled inside its top-right corner."""
+    shape = dict(type="rect", xref="x domain", x0=0, x1=1, yref="y", y0=y0, y1=y1,
+                 fillcolor=fillcolor, line=dict(width=0))
+    return shape, dict(text=label, font=dict(color=label_color), showarrow=False,
+                       xref="x domain", x=1, xanchor="right", yref="y", y=y1, yanchor="top")
+
+
+def _guide_layout(guides: list[tuple[dict, dict | None]]) -> dict:
+    """`shapes` / `annotations` layout entries for a list of guides, in order."""
+    layout = {}
+    if guides:
+        layout["shapes"] = [shape for shape, _ in guides]
+    annotations = [ann for _, ann in guides if ann is not None]
+    if annotations:
+        layout["annotations"] = annotations
+    return layout
+
+
 # ---------------------------------------------------------------------------
 # Chart builders
 # ---------------------------------------------------------------------------
 
-def build_technical_chart(df: pd.DataFrame, leg_name: str) -> go.Figure:
-    """Candlestick + RSI + MACD subplots for one soy leg.
+@lru_cache(maxsize=1)
+def _technical_skeleton() -> go.Figure:
+    """Empty price/RSI/MACD subplot figure shared by every technical chart.
 
-    Expects df with DatetimeIndex and columns: Open, High, Low, Close,
-    Volume, MA_20, MA_50, MA_200, BB_Upper, BB_Lower, RSI, MACD,
-    MACD_Signal, MACD_Histogram.
+    Holds everything that does not depend on the data: the subplot grid,
+    the RSI 70/30 guides and the base layout. Callers must copy it with
+    `go.Figure(...)` before adding traces; the first subplot title is a
+    placeholder for the leg name.
     """
     fig = make_subplots(
         rows=3, cols=1,
         shared_xaxes=True,
         vertical_spacing=0.03,
         row_heights=[0.6, 0.2, 0.2],
-        subplot_titles=(leg_name, "RSI", "MACD"),
+        subplot_titles=("Price", "RSI", "MACD"),
     )
+    fig.add_hline(y=70, line_dash="dash", line_color=COLORS["bearish"], row=2, col=1,
+                  exclude_empty_subplots=False)
+    fig.add_hline(y=30, line_dash="dash", line_color=COLORS["bullish"], row=2, col=1,
+                  exclude_empty_subplots=False)
+
+    base = {**_BASE_LAYOUT}
+    base["legend"] = dict(orientation="h", yanchor="bottom", y=1.02, bgcolor="rgba(0,0,0,0)", font=dict(size=11))
+    fig.update_layout(
+        height=900,
+        xaxis_rangeslider_visible=False,
+        showlegend=True,
+        yaxis_title="USD/MT",
+        **base,
+    )
+    return fig
+
+
+def build_technical_chart(df: pd.DataFrame, leg_name: str) -> go.Figure:
+    """Candlestick + RSI + MACD subplots for one soy leg.
+
+    Expects df with DatetimeIndex and columns: Open, High, Low, Close,
+    Volume, MA_20, MA_50, MA_200, BB_Upper, BB_Lower, RSI, MACD,
+    MACD_Signal, MACD_Histogram.
+
+    History older than the last TECHNICAL_DAILY_BARS sessions is drawn as
+    weekly (or, past TECHNICAL_MAX_BARS, monthly) bars (see
+    `_reduce_history`), and indicator lines are LTTB-
+    decimated to TECHNICAL_LINE_POINTS (see `_decimate_lines`).
+    """
+    df = _reduce_history(df)
+    lines = _decimate_lines(df)
+    x, line_x = _day_axis(df.index), _day_axis(lines.index)
+    fig = go.Figure(_technical_skeleton())
+    fig.layout.annotations[0].text = leg_name
+    fig.layout.uirevision = leg_name
 
     # Candlestick
     fig.add_trace(
         go.Candlestick(
-            x=df.index, open=df["Open"], high=df["High"],
+            x=x, open=df["Open"], high=df["High"],
             low=df["Low"], close=df["Close"], name="Price",
             increasing_line_color=COLORS["bullish"],
             decreasing_line_color=COLORS["bearish"],
@@ -101,30 +317,30 @@ def build_technical_chart(df: pd.DataFrame, leg_name: str) -> go.Figure:
     for ma, color in ma_colors.items():
         if ma in df.columns:
             fig.add_trace(
-                go.Scatter(x=df.index, y=df[ma], name=ma, line=dict(width=1, color=color)),
+                go.Scattergl(x=line_x, y=lines[ma], name=ma, line=dict(width=1, color=color)),
                 row=1, col=1,
             )
 
     # Bollinger Bands
     if "BB_Upper" in df.columns and "BB_Lower" in df.columns:
         fig.add_trace(
-            go.Scatter(x=df.index, y=df["BB_Upper"], name="BB Upper",
-                       line=dict(width=1, dash="dot", color=COLORS["text_dim"])),
+            go.Scattergl(x=line_x, y=lines["BB_Upper"], name="BB Upper",
+                         line=dict(width=1, dash="dot", color=COLORS["text_dim"])),
             row=1, col=1,
         )
         fig.add_trace(
-            go.Scatter(x=df.index, y=df["BB_Lower"], name="BB Lower",
-                       line=dict(width=1, dash="dot", color=COLORS["text_dim"]),
-                       fill="tonexty", fillcolor="rgba(155,163,158,0.12)"),
+            go.Scattergl(x=line_x, y=lines["BB_Lower"], name="BB Lower",
+                         line=dict(width=1, dash="dot", color=COLORS["text_dim"]),
+                         fill="tonexty", fillcolor="rgba(155,163,158,0.12)"),
             row=1, col=1,
         )
 
     # Volume
     if "Volume" in df.columns:
-        vol_colors = [COLORS["bullish"] if c >= o else COLORS["bearish"]
-                      for c, o in zip(df["Close"], df["Open"], strict=False)]
+        vol_colors = np.where(df["Close"].to_numpy() >= df["Open"].to_numpy(),
+                              COLORS["bullish"], COLORS["bearish"])
         fig.add_trace(
-            go.Bar(x=df.index, y=df["Volume"], name="Volume",
+            go.Bar(x=x, y=df["Volume"], name="Volume",
                    marker_color=vol_colors, opacity=0.3),
             row=1, col=1,
         )
@@ -132,47 +348,65 @@ def build_technical_chart(df: pd.DataFrame, leg_name: str) -> go.Figure:
     # RSI
     if "RSI" in df.columns:
         fig.add_trace(
-            go.Scatter(x=df.index, y=df["RSI"], name="RSI",
-                       line=dict(color=COLORS["info"])),
+            go.Scattergl(x=line_x, y=lines["RSI"], name="RSI",
+                         line=dict(color=COLORS["info"])),
             row=2, col=1,
         )
-        fig.add_hline(y=70, line_dash="dash", line_color=COLORS["bearish"], row=2, col=1)
-        fig.add_hline(y=30, line_dash="dash", line_color=COLORS["bullish"], row=2, col=1)
 
     # MACD
     if "MACD" in df.columns:
         fig.add_trace(
-            go.Scatter(x=df.index, y=df["MACD"], name="MACD",
-                       line=dict(color=COLORS["info"])),
+            go.Scattergl(x=line_x, y=lines["MACD"], name="MACD",
+                         line=dict(color=COLORS["info"])),
             row=3, col=1,
         )
         if "MACD_Signal" in df.columns:
             fig.add_trace(
-                go.Scatter(x=df.index, y=df["MACD_Signal"], name="Signal",
-                           line=dict(color=COLORS["soy_oil"])),
+                go.Scattergl(x=line_x, y=lines["MACD_Signal"], name="Signal",
+                             line=dict(color=COLORS["soy_oil"])),
                 row=3, col=1,
             )
         if "MACD_Histogram" in df.columns:
-            hist_colors = [COLORS["bullish"] if v >= 0 else COLORS["bearish"]
-                           for v in df["MACD_Histogram"]]
+            hist_colors = np.where(df["MACD_Histogram"].to_numpy() >= 0,
+                                   COLORS["bullish"], COLORS["bearish"])
             fig.add_trace(
-                go.Bar(x=df.index, y=df["MACD_Histogram"], name="Histogram",
+                go.Bar(x=x, y=df["MACD_Histogram"], name="Histogram",
                        marker_color=hist_colors),
                 row=3, col=1,
             )
-
-    base = {**_BASE_LAYOUT}
-    base["legend"] = dict(orientation="h", yanchor="bottom", y=1.02, bgcolor="rgba(0,0,0,0)", font=dict(size=11))
-    fig.update_layout(
-        height=900,
-        xaxis_rangeslider_visible=False,
-        showlegend=True,
-        yaxis_title="USD/MT",
-        **base,
-    )
     return fig
 
 
+def _split_sign(values) -> tuple[np.ndarray, np.ndarray]:
+    """Positive and negative parts of a series, for paired tozeroy fills.
+
+    Gaps become 0 so neither fill draws there.
+    """
+    v = np.nan_to_num(np.asarray(values, dtype=np.float64), nan=0.0)
+    return np.clip(v, 0.0, None), np.clip(v, None, 0.0)
+
+
+def _split_at_zero(x, values) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split a date series into NaN-masked positive and negative sides.
+
+    A point interpolated onto y=0 is inserted at every sign change, so
+    each side ends exactly on the axis. Drawn as two line + tozeroy
+    traces, the two halves read as one continuous line and neither fill
+    spills across zero. Existing gaps stay NaN on both sides.
+
+    Returns (x, positive, negative) with x as datetime64[ns].
+    """
+    xi = pd.DatetimeIndex(x).as_unit("ns").asi8
+    v = np.asarray(values, dtype=np.float64)
+    a, b = v[:-1], v[1:]
+    i = np.flatnonzero(a * b < 0)
+    t = a[i] / (a[i] - b[i])
+    xc = xi[i] + np.round(t * (xi[i + 1] - xi[i])).astype(np.int64)
+    xs = np.insert(xi, i + 1, xc).view("datetime64[ns]")
+    ys = np.insert(v, i + 1, 0.0)
+    return xs, np.where(ys >= 0, ys, np.nan), np.where(ys <= 0, ys, np.nan)
+
+
 def build_crush_spread_chart(
     spread_df: pd.DataFrame,
     spread_mt: pd.Series,
@@ -186,41 +420,34 @@ def build_crush_spread_chart(
         crush: dict with keys avg_1y, min_1y, max_1y
     """
     fig = go.Figure()
+    guides = []
 
     if crush.get("min_1y") is not None:
-        fig.add_hline(y=crush["avg_1y"], line_dash="dot", line_color=COLORS["info"],
-                      annotation_text=f"1Y avg: ${crush['avg_1y']:,.1f}",
-                      annotation_font_color=COLORS["text_muted"])
-        fig.add_hrect(y0=crush["min_1y"], y1=crush["max_1y"],
-                      fillcolor="rgba(47,93,143,0.07)", line_width=0,
-                      annotation_text="1Y range",
-                      annotation_font_color=COLORS["text_dim"])
-
-    fig.add_trace(
-        go.Scatter(
-            x=spread_df["Date"], y=spread_mt,
-            mode="lines", name="Crush Spread",
-            line=dict(color=COLORS["text"], width=2),
-        )
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=spread_df["Date"],
-            y=[max(0, v) for v in spread_mt],
-            fill="tozeroy", fillcolor="rgba(31,122,61,0.12)",
-            line=dict(width=0), name="Profitable",
-        )
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=spread_df["Date"],
-            y=[min(0, v) for v in spread_mt],
-            fill="tozeroy", fillcolor="rgba(194,59,46,0.10)",
-            line=dict(width=0), name="Negative",
+        guides.append(_hline(crush["avg_1y"], COLORS["info"], "dot",
+                             f"1Y avg: ${crush['avg_1y']:,.1f}", COLORS["text_muted"]))
+        guides.append(_hrect(crush["min_1y"], crush["max_1y"], "rgba(47,93,143,0.07)",
+                             "1Y range", COLORS["text_dim"]))
+
+    # The spread line is drawn by the two zone traces themselves; each
+    # side is NaN where the other applies, so no third line trace is needed.
+    # SVG rather than WebGL: a Scattergl tozeroy fill is not reliably broken
+    # at NaN gaps and can bridge across segments. The series is already
+    # decimated, so SVG stays cheap.
+    x, profit, loss = _split_at_zero(*_decimate_series(spread_df["Date"], spread_mt))
+    for y, fillcolor, name in (
+        (profit, "rgba(31,122,61,0.12)", "Profitable"),
+        (loss, "rgba(194,59,46,0.10)", "Negative"),
+    ):
+        fig.add_trace(
+            go.Scatter(
+                x=x, y=y, mode="lines", connectgaps=False,
+                fill="tozeroy", fillcolor=fillcolor,
+                line=dict(color=COLORS["text"], width=2), name=name,
+            )
         )
-    )
-    fig.add_hline(y=0, line_dash="dash", line_color=COLORS["text_dim"])
-    fig.update_layout(height=350, xaxis_title="", yaxis_title="USD/MT", **_BASE_LAYOUT)
+    guides.append(_hline(0, COLORS["text_dim"]))
+    fig.update_layout(height=350, xaxis_title="", yaxis_title="USD/MT",
+                      **_guide_layout(guides), **_BASE_LAYOUT)
     return fig
 
 
@@ -259,41 +486,38 @@ def build_basis_chart(
         secondary_df = None
 
     fig = go.Figure()
+    guides = []
 
     if stats.get("min_1y") is not None:
-        fig.add_hline(
-            y=stats["avg_1y"], line_dash="dot", line_color=COLORS["info"],
-            annotation_text=f"1Y avg: ${stats['avg_1y']:+,.1f}",
-            annotation_font_color=COLORS["text_muted"],
-        )
-        fig.add_hrect(
-            y0=stats["min_1y"], y1=stats["max_1y"],
-            fillcolor="rgba(47,93,143,0.07)", line_width=0,
-            annotation_text="1Y range",
-            annotation_font_color=COLORS["text_dim"],
-        )
+        guides.append(_hline(stats["avg_1y"], COLORS["info"], "dot",
+                             f"1Y avg: ${stats['avg_1y']:+,.1f}", COLORS["text_muted"]))
+        guides.append(_hrect(stats["min_1y"], stats["max_1y"], "rgba(47,93,143,0.07)",
+                             "1Y range", COLORS["text_dim"]))
 
-    primary_series = primary_df["basis_usd_mt"]
+    primary_dates, primary_series = _decimate_series(primary_df["Date"], primary_df["basis_usd_mt"])
+    primary_x = _day_axis(primary_dates)
     fig.add_trace(
-        go.Scatter(
-            x=primary_df["Date"], y=primary_series,
+        go.Scattergl(
+            x=primary_x, y=primary_series,
             mode="lines", name=primary_label,
             line=dict(color=COLORS["text"], width=2),
         )
     )
     if secondary_df is not None:
+        secondary_x, secondary_y = _decimate_series(secondary_df["Date"], secondary_df["basis_usd_mt"])
         fig.add_trace(
-            go.Scatter(
-                x=secondary_df["Date"], y=secondary_df["basis_usd_mt"],
+            go.Scattergl(
+                x=_day_axis(secondary_x), y=secondary_y,
                 mode="lines", name=secondary_label,
                 line=dict(color=COLORS["text_muted"], width=1.5, dash="dash"),
             )
         )
+    premium, discount = _split_sign(primary_series)
     # Discount zone (negative basis = export-competitive Brazil) — primary only.
     fig.add_trace(
-        go.Scatter(
-            x=primary_df["Date"],
-            y=[min(0, v) for v in primary_series],
+        go.Scattergl(
+            x=primary_x,
+            y=discount,
             fill="tozeroy", fillcolor="rgba(31,122,61,0.12)",
             line=dict(width=0), name="Brazilian discount",
             showlegend=False,
@@ -301,16 +525,17 @@ def build_basis_chart(
     )
     # Premium zone (positive basis = domestic pull) — primary only.
     fig.add_trace(
-        go.Scatter(
-            x=primary_df["Date"],
-            y=[max(0, v) for v in primary_series],
+        go.Scattergl(
+            x=primary_x,
+            y=premium,
             fill="tozeroy", fillcolor="rgba(194,59,46,0.10)",
             line=dict(width=0), name="Brazilian premium",
             showlegend=False,
         )
     )
-    fig.add_hline(y=0, line_dash="dash", line_color=COLORS["text_dim"])
-    fig.update_layout(height=350, xaxis_title="", yaxis_title="USD/MT", **_BASE_LAYOUT)
+    guides.append(_hline(0, COLORS["text_dim"]))
+    fig.update_layout(height=350, xaxis_title="", yaxis_title="USD/MT",
+                      **_guide_layout(guides), **_BASE_LAYOUT)
     return fig
 
 
@@ -321,18 +546,18 @@ def build_oil_meal_ratio_chart(omr: dict) -> go.Figure:
         omr: dict with keys series (pd.Series), avg_60d, min_1y, max_1y
     """
     fig = go.Figure()
+    guides = []
     if omr.get("min_1y") is not None:
-        fig.add_hrect(y0=omr["min_1y"], y1=omr["max_1y"],
-                      fillcolor="rgba(176,94,16,0.07)", line_width=0,
-                      annotation_text="1Y range",
-                      annotation_font_color=COLORS["text_dim"])
+        guides.append(_hrect(omr["min_1y"], omr["max_1y"], "rgba(176,94,16,0.07)",
+                             "1Y range", COLORS["text_dim"]))
+    x, y = _decimate_series(omr["series"].index, omr["series"])
     fig.add_trace(
-        go.Scatter(x=omr["series"].index, y=omr["series"], mode="lines",
-                   name="Oil/Meal Ratio", line=dict(color=COLORS["soy_oil"]))
+        go.Scattergl(x=_day_axis(x), y=y, mode="lines",
+                     name="Oil/Meal Ratio", line=dict(color=COLORS["soy_oil"]))
     )
-    fig.add_hline(y=omr["avg_60d"], line_dash="dash", line_color=COLORS["text_dim"],
-                  annotation_text="60d avg", annotation_font_color=COLORS["text_muted"])
-    fig.update_layout(height=300, **_BASE_LAYOUT)
+    guides.append(_hline(omr["avg_60d"], COLORS["text_dim"], label="60d avg",
+                         label_color=COLORS["text_muted"]))
+    fig.update_layout(height=300, **_guide_layout(guides), **_BASE_LAYOUT)
     return fig
 
 
@@ -343,18 +568,18 @@ def build_bean_corn_ratio_chart(bcr: dict) -> go.Figure:
         bcr: dict with keys series (pd.Series), avg_1y, min_1y, max_1y
     """
     fig = go.Figure()
+    guides = []
     if bcr.get("min_1y") is not None:
-        fig.add_hrect(y0=bcr["min_1y"], y1=bcr["max_1y"],
-                      fillcolor="rgba(138,90,43,0.07)", line_width=0,
-                      annotation_text="1Y range",
-                      annotation_font_color=COLORS["text_dim"])
+        guides.append(_hrect(bcr["min_1y"], bcr["max_1y"], "rgba(138,90,43,0.07)",
+                             "1Y range", COLORS["text_dim"]))
+    x, y = _decimate_series(bcr["series"].index, bcr["series"])
     fig.add_trace(
-        go.Scatter(x=bcr["series"].index, y=bcr["series"], mode="lines",
-                   name="Bean/Corn Ratio", line=dict(color=COLORS["soy_meal"]))
+        go.Scattergl(x=_day_axis(x), y=y, mode="lines",
+                     name="Bean/Corn Ratio", line=dict(color=COLORS["soy_meal"]))
     )
-    fig.add_hline(y=bcr["avg_1y"], line_dash="dash", line_color=COLORS["text_dim"],
-                  annotation_text="1Y avg", annotation_font_color=COLORS["text_muted"])
-    fig.update_layout(height=300, **_BASE_LAYOUT)
+    guides.append(_hline(bcr["avg_1y"], COLORS["text_dim"], label="1Y avg",
+                         label_color=COLORS["text_muted"]))
+    fig.update_layout(height=300, **_guide_layout(guides), **_BASE_LAYOUT)
     return fig
 
 
@@ -377,30 +602,26 @@ def build_cot_chart(cot: dict) -> go.Figure:
     return fig
 
 
-def build_correlations_chart(
-    pairs: list[tuple[str, pd.Series, pd.Series]],
-    rolling_correlation_fn,
-    window: int = 60,
-) -> go.Figure:
+def build_correlations_chart(correlations: pd.DataFrame, window: int = 60) -> go.Figure:
     """Rolling correlation line chart for multiple pairs.
 
     Args:
-        pairs: list of (label, series_a, series_b) tuples
-        rolling_correlation_fn: the rolling_correlation function from analysis.correlations
-        window: rolling window size
+        correlations: Date-indexed frame, one column per pair, as returned
+            by analysis.correlations.rolling_correlation_frame
+        window: rolling window size the correlations were computed with
     """
     fig = go.Figure()
     pair_colors = [COLORS["bearish"], COLORS["soy_oil"], COLORS["info"]]
-    for i, (label, sa, sb) in enumerate(pairs):
-        rc = rolling_correlation_fn(sa, sb, window=window)
-        if not rc.empty:
-            fig.add_trace(
-                go.Scatter(x=rc.index, y=rc, mode="lines", name=label,
-                           line=dict(color=pair_colors[i % len(pair_colors)], width=2))
-            )
-    fig.add_hline(y=0, line_dash="dash", line_color=COLORS["text_dim"])
-    fig.update_layout(height=400, yaxis_title="60d Rolling Correlation",
-                      yaxis_range=[-1, 1], **_BASE_LAYOUT)
+    for i, label in enumerate(correlations.columns):
+        rc = correlations[label].dropna()
+        x, y = _decimate_series(rc.index, rc)
+        fig.add_trace(
+            go.Scattergl(x=_day_axis(x), y=y, mode="lines", name=label,
+                         line=dict(color=pair_colors[i % len(pair_colors)], width=2))
+        )
+    fig.update_layout(height=400, yaxis_title=f"{window}d Rolling Correlation",
+                      yaxis_range=[-1, 1], **_guide_layout([_hline(0, COLORS["text_dim"])]),
+                      **_BASE_LAYOUT)
     return fig
 
 
@@ -416,20 +637,21 @@ def build_forward_curve_chart(
         leg: commodity name
         unit: y-axis unit label
     """
+    close = curve_df_mt["close"].to_numpy(dtype=np.float64)
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
-            x=curve_df_mt["label"], y=curve_df_mt["close"],
+            x=curve_df_mt["label"].to_numpy(), y=close,
             mode="lines+markers", name=leg,
             line=dict(width=3, color=COLORS["accent"]),
             marker=dict(size=10, color=COLORS["accent"]),
         )
     )
-    front_price_mt = curve_df_mt.iloc[0]["close"]
-    fig.add_hline(y=front_price_mt, line_dash="dash", line_color=COLORS["text_dim"],
-                  annotation_text=f"Front: {front_price_mt:,.1f}",
-                  annotation_font_color=COLORS["text_muted"])
-    fig.update_layout(height=350, xaxis_title="Contract", yaxis_title=unit, **_BASE_LAYOUT)
+    front_price_mt = close[0]
+    front = _hline(front_price_mt, COLORS["text_dim"], label=f"Front: {front_price_mt:,.1f}",
+                   label_color=COLORS["text_muted"])
+    fig.update_layout(height=350, xaxis_title="Contract", yaxis_title=unit,
+                      **_guide_layout([front]), **_BASE_LAYOUT)
     return fig
 
 
@@ -438,6 +660,7 @@ def build_seasonal_chart(
     vs_seasonal: dict,
     leg: str,
     unit: str = "USD/MT",
+    current_month: int | None = None,
 ) -> go.Figure:
     """Monthly seasonal bar chart with error bars and current price marker.
 
@@ -446,32 +669,38 @@ def build_seasonal_chart(
         vs_seasonal: dict with current_price key
         leg: commodity name
         unit: y-axis unit label
+        current_month: calendar month (1-12) for the current-price marker;
+            defaults to this month. Pass it when building several legs.
     """
-    labels = [MONTH_NAMES[m - 1] for m in monthly["month"]]
+    labels = MONTH_NAMES_NP[monthly["month"].to_numpy() - 1]
+    avg = monthly["avg_close"].to_numpy(dtype=np.float64)
     fig = go.Figure()
 
     fig.add_trace(
         go.Bar(
             x=labels,
-            y=monthly["avg_close"],
+            y=avg,
             name="Avg Close",
             marker_color=COLORS["info"],
             error_y=dict(
                 type="data",
                 symmetric=False,
-                array=monthly["max_close"] - monthly["avg_close"],
-                arrayminus=monthly["avg_close"] - monthly["min_close"],
+                array=monthly["max_close"].to_numpy(dtype=np.float64) - avg,
+                arrayminus=avg - monthly["min_close"].to_numpy(dtype=np.float64),
                 color="rgba(47,93,143,0.3)",
             ),
         )
     )
 
     if vs_seasonal:
-        current_month_idx = datetime.now().month - 1
-        if current_month_idx < len(labels):
+        if current_month is None:
+            current_month = datetime.now().month
+        # Months without enough history are dropped from `monthly`, so look
+        # the month up rather than indexing the labels by position.
+        if (monthly["month"] == current_month).any():
             fig.add_trace(
                 go.Scatter(
-                    x=[labels[current_month_idx]],
+                    x=[MONTH_NAMES[current_month - 1]],
                     y=[vs_seasonal["current_price"]],
                     mode="markers",
                     name="Current",
@@ -103,31 +103,38 @@ def _aggregate_national(df: pd.DataFrame) -> pd.DataFrame:
     return grouped
 
 
+# Aggregated column → (attribute, unit), in the order rows are emitted per
+# (crop_year, commodity).
+_LONG_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "production": ("Production", "1000 MT"),
+    "area": ("Area", "1000 HA"),
+    "yield_kg_ha": ("Yield", "KG/HA"),
+}
+
+
 def _melt_to_long(grouped: pd.DataFrame, report_date: str) -> pd.DataFrame:
     """Reshape aggregated DataFrame into the long format the pipeline expects."""
-    rows: list[dict[str, object]] = []
-    for _, row in grouped.iterrows():
-        commodity_en = _COMMODITY_MAP[row["produto_norm"]]
-        crop_year = row["ano_agricola"]
-
-        for attr, value, unit in (
-            ("Production", row["production"], "1000 MT"),
-            ("Area", row["area"], "1000 HA"),
-            ("Yield", row["yield_kg_ha"], "KG/HA"),
-        ):
-            if pd.isna(value):
-                continue
-            rows.append({
-                "source": "CONAB",
-                "commodity": commodity_en,
-                "crop_year": crop_year,
-                "attribute": attr,
-                "value": float(value),
-                "unit": unit,
-                "report_date": report_date,
-            })
-
-    return pd.DataFrame(rows)
+    long = grouped.melt(
+        id_vars=["ano_agricola", "produto_norm"],
+        value_vars=list(_LONG_ATTRIBUTES),
+        var_name="column",
+        ignore_index=False,
+    )
+    # melt stacks column by column; a stable sort on the original row
+    # position restores Production, Area, Yield per (crop_year, commodity).
+    long = long.sort_index(kind="stable")
+    long["value"] = pd.to_numeric(long["value"], errors="coerce")
+    long = long.dropna(subset=["value"])
+
+    return pd.DataFrame({
+        "source": "CONAB",
+        "commodity": long["produto_norm"].map(_COMMODITY_MAP),
+        "crop_year": long["ano_agricola"],
+        "attribute": long["column"].map({c: a for c, (a, _) in _LONG_ATTRIBUTES.items()}),
+        "value": long["value"].astype(float),
+        "unit": long["column"].map({c: u for c, (_, u) in _LONG_ATTRIBUTES.items()}),
+        "report_date": report_date,
+    }).reset_index(drop=True)
 
 
 def fetch_conab_estimates() -> pd.DataFrame:
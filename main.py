@@ -22,6 +22,7 @@ import json
 import logging
 import sys
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -93,7 +94,7 @@ from pipeline.store import (
     save_inspection_destinations,
     save_inspections,
     save_port_flows,
-    save_price_data,
+    save_price_data_bulk,
     save_psd_data,
     save_safex,
     save_usda_data,
@@ -115,6 +116,11 @@ CRITICAL_LAYERS = ("prices", "fred")
 DISABLED_LAYERS: frozenset[str] = frozenset()
 
 
+# Dict-layer fetches are network-bound and independent of each other, so
+# they run ahead on a thread pool while clean/save stay serial, in layer
+# order (SQLite has a single writer).
+_FETCH_WORKERS = 4
+
 # Layers hard-failed during the current run() — transport/parse/shape
 # failures, not quiet empties. Feeds the systemic-outage backstop.
 _HARD_FAILURES: set[str] = set()
@@ -214,17 +220,56 @@ class DictLayer:
     label: str                                  # "Layer 4" — for log prefixes
     desc: str                                   # human description for logs
     fetch: Callable[[], dict]
-    save: Callable[[str, Any], None]            # (name, frame) -> None
+    # (name, frame) -> None. Omitted when `save_all` writes the whole dict.
+    save: Callable[[str, Any], None] | None = None
     clean: Callable[[str, Any], Any] | None = None  # (name, frame) -> frame
     # API-key-gated layers: fetch() returns {} when the key isn't set.
     # Logged as skipped — no freshness row, matching "the layer never ran".
     skip_msg: str | None = None
+    # Fetches through yf.download, whose module-global result buffers are
+    # not thread-safe — these layers are fetched one at a time, in order,
+    # by a single task on the fetch pool.
+    yahoo: bool = False
+    # Writes the whole cleaned dict in one transaction; used instead of
+    # the per-name `save` loop when set.
+    save_all: Callable[[dict], None] | None = None
+
+    def __post_init__(self) -> None:
+        if (self.save is None) == (self.save_all is None):
+            raise ValueError(f"DictLayer {self.key!r} needs exactly one of save / save_all")
+
 
+def _fetch_layer(layer: DictLayer) -> dict:
+    """Run one layer's fetch(), logging when it actually starts."""
+    logger.info("[%s] Fetching %s ...", layer.label, layer.desc)
+    return layer.fetch()
 
-def _run_dict_layer(layer: DictLayer) -> bool:
+
+def _fetch_serially(layers: list[DictLayer], futures: dict[str, Future]) -> None:
+    """Fetch `layers` one after another, resolving each layer's future.
+
+    Runs as a single task on the shared fetch pool, so the yahoo layers
+    never enter yf.download from two threads at once.
+    """
+    for layer in layers:
+        future = futures[layer.key]
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(_fetch_layer(layer))
+        except Exception as exc:
+            future.set_exception(exc)
+
+
+def _run_dict_layer(layer: DictLayer, pending: Future | None = None) -> bool:
+    """Clean, save and finalize one layer.
+
+    `pending` is the layer's prefetched fetch() result; without it the
+    layer fetches inline. A fetch exception re-raises from
+    `pending.result()` and is handled like an inline failure.
+    """
     try:
-        logger.info("[%s] Fetching %s ...", layer.label, layer.desc)
-        data = layer.fetch()
+        data = pending.result() if pending is not None else _fetch_layer(layer)
 
         if not data and layer.skip_msg:
             logger.info("[%s] %s", layer.label, layer.skip_msg)
@@ -232,11 +277,13 @@ def _run_dict_layer(layer: DictLayer) -> bool:
 
         if layer.clean is not None and data:
             logger.info("[Cleaning] Processing %s data ...", layer.key)
-            for name in data:
-                data[name] = layer.clean(name, data[name])
+            data = {name: layer.clean(name, df) for name, df in data.items()}
 
-        for name, df in data.items():
-            layer.save(name, df)
+        if layer.save_all is not None:
+            layer.save_all(data)
+        elif layer.save is not None:
+            for name, df in data.items():
+                layer.save(name, df)
 
         return _finalize_layer(layer.key, data)
     except Exception:
@@ -329,8 +376,9 @@ def run() -> int:
         DictLayer(
             "prices", "Layer 1", "commodity futures prices",
             fetch=lambda: fetch_prices(),
-            save=lambda n, d: save_price_data(n, d),
             clean=lambda n, d: clean_ohlcv(d, label=n),
+            yahoo=True,
+            save_all=lambda data: save_price_data_bulk(data),
         ),
         DictLayer(
             "usda", "Layer 2", "USDA soybean data",
@@ -371,6 +419,7 @@ def run() -> int:
             fetch=lambda: fetch_currencies(),
             save=lambda n, d: save_currency_data(n, d),
             clean=lambda n, d: clean_ohlcv(d, label=n),
+            yahoo=True,
         ),
         DictLayer(
             "worldbank", "Layer 8", "World Bank Pink Sheet prices",
@@ -396,6 +445,7 @@ def run() -> int:
             fetch=lambda: fetch_all_forward_curves(),
             save=lambda n, d: save_forward_curve(n, d),
             clean=lambda n, d: clean_forward_curve(d),
+            yahoo=True,
         ),
         DictLayer(
             "wasde", "Layer 12", "WASDE monthly estimates",
@@ -411,8 +461,17 @@ def run() -> int:
             skip_msg="EIA skipped (EIA_API_KEY not set)",
         ),
     ]
-    for layer in dict_layers:
-        results[layer.key] = _run_dict_layer(layer)
+    yahoo_layers = [layer for layer in dict_layers if layer.yahoo]
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS, thread_name_prefix="fetch") as pool:
+        # The yahoo layers share one worker, fetched in order; the rest
+        # take the remaining workers as they free up.
+        pending: dict[str, Future] = {layer.key: Future() for layer in yahoo_layers}
+        pool.submit(_fetch_serially, yahoo_layers, pending)
+        pending.update(
+            {layer.key: pool.submit(_fetch_layer, layer) for layer in dict_layers if not layer.yahoo}
+        )
+        for layer in dict_layers:
+            results[layer.key] = _run_dict_layer(layer, pending[layer.key])
 
     # ── Layer 14: USDA Crush/Processing + Export Inspections ──────
     # Custom: two sources (QuickStats CRUSHED + AMS text report) sharing
@@ -558,6 +617,13 @@ def run() -> int:
     except Exception:
         logger.exception("Per-commodity freshness update failed")
 
+    # ── Materialise derived series (rolling correlations) ───────
+    try:
+        from analysis.derived import materialize_derived_series
+        materialize_derived_series()
+    except Exception:
+        logger.exception("Derived-series materialisation failed")
+
     # ── Run data health check ─────────────────────────────────
     try:
         from analysis.health import run_health_check
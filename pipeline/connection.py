@@ -6,7 +6,9 @@ Provides a single get_connection() function that returns either:
   - A local SQLite connection as fallback
 
 This allows the same SQL code to work both locally and on cloud platforms
-where the filesystem is ephemeral.
+where the filesystem is ephemeral. get_read_connection() is the read-side
+variant used by pipeline/query.py: a reused, query-only handle locally,
+closed by close_read_connections().
 
 Key concepts for learning:
     - Environment variables control which database backend is used
@@ -18,6 +20,7 @@ Key concepts for learning:
 import logging
 import os
 import sqlite3
+import threading
 
 from config import DB_PATH, STORAGE_DIR, TURSO_AUTH_TOKEN, TURSO_DATABASE_URL
 
@@ -72,6 +75,61 @@ def get_connection():
     return sqlite3.connect(DB_PATH)
 
 
+# Per-thread read connections, tagged with the DB path and generation they
+# were opened under. sqlite3 connections are bound to their creating thread
+# by default, so one per thread keeps concurrent readers independent
+# without extra locking. Every handle is also registered in
+# _read_connections so close_read_connections() can close them all.
+_read_local = threading.local()
+_read_lock = threading.Lock()
+_read_connections: list[sqlite3.Connection] = []
+_read_generation = 0
+
+
+def get_read_connection():
+    """
+    Get a long-lived connection for read-only queries.
+
+    Local SQLite: opened once per thread (and DB path) with
+    ``PRAGMA query_only`` and reused by every read_* call, so a dashboard
+    build pays the connect + schema load once instead of per query. The
+    handle stays open until close_read_connections(): ``with conn:`` on a
+    sqlite3 connection only commits, it never closes.
+
+    Turso: defers to get_connection(), whose replica sync on connect is
+    what makes just-written rows visible.
+    """
+    if is_cloud():
+        return get_connection()
+    cached = getattr(_read_local, "conn", None)
+    if cached is not None and cached[0] == DB_PATH and cached[1] == _read_generation:
+        return cached[2]
+    os.makedirs(STORAGE_DIR, exist_ok=True)
+    # check_same_thread=False only so close_read_connections() may close the
+    # handle from another thread; queries still run on the owning thread.
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.execute("PRAGMA query_only = ON")
+    with _read_lock:
+        _read_connections.append(conn)
+        _read_local.conn = (DB_PATH, _read_generation, conn)
+    return conn
+
+
+def close_read_connections() -> None:
+    """Close every cached read connection, on all threads.
+
+    Call between pipeline runs or in tests, when no read is in flight.
+    The next get_read_connection() on any thread opens a fresh handle.
+    """
+    global _read_generation
+    with _read_lock:
+        conns = _read_connections[:]
+        _read_connections.clear()
+        _read_generation += 1
+    for conn in conns:
+        conn.close()
+
+
 def maybe_sync(conn) -> None:
     """Sync a libsql connection after writes; no-op for plain sqlite3.
 
@@ -16,7 +16,7 @@ from typing import Any
 import pandas as pd
 
 from config import DB_PATH
-from pipeline.connection import get_connection, is_cloud
+from pipeline.connection import get_read_connection, is_cloud
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +56,7 @@ def _read_table(
         return pd.DataFrame()
 
     base = sql or f"SELECT * FROM {table}"  # noqa: S608 — table names are literals below
-    with get_connection() as conn:
+    with get_read_connection() as conn:
         try:
             if filter_value is not None:
                 df = pd.read_sql(
@@ -72,9 +72,10 @@ def _read_table(
             logger.warning("Read failed for %s: %s", table, exc)
             return pd.DataFrame()
 
+    # Writers store ISO dates (store._date), so skip per-call format inference.
     for col in date_cols:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col])
+            df[col] = pd.to_datetime(df[col], format="ISO8601")
 
     return df
 
@@ -234,6 +235,11 @@ def read_safex(commodity: str | None = None) -> pd.DataFrame:
     return _read_table("safex_prices", "commodity", commodity)
 
 
+def read_derived_series(series_name: str | None = None) -> pd.DataFrame:
+    """Read pre-computed derived series (analysis/derived.py) from SQLite."""
+    return _read_table("derived_series", "series_name", series_name)
+
+
 def read_freshness() -> pd.DataFrame:
     """
     Read data freshness timestamps for all layers.
@@ -247,7 +253,7 @@ def read_freshness() -> pd.DataFrame:
     if not is_cloud() and not os.path.exists(DB_PATH):
         return pd.DataFrame()
 
-    with get_connection() as conn:
+    with get_read_connection() as conn:
         try:
             df = pd.read_sql("SELECT * FROM data_freshness", conn)
         except (sqlite3.OperationalError, pd.errors.DatabaseError) as exc:
@@ -272,7 +278,7 @@ def read_briefing(briefing_date: str) -> dict[str, Any] | None:
     """
     if not is_cloud() and not os.path.exists(DB_PATH):
         return None
-    with get_connection() as conn:
+    with get_read_connection() as conn:
         try:
             row = conn.execute(
                 "SELECT briefing_date, text, signals_json, snapshot_json, generated_at "
@@ -317,7 +323,7 @@ def read_briefings(
     if clauses:
         sql += " WHERE " + " AND ".join(clauses)
     sql += " ORDER BY briefing_date"
-    with get_connection() as conn:
+    with get_read_connection() as conn:
         try:
             df = pd.read_sql(sql, conn, params=tuple(params) if params else None)
         except (sqlite3.OperationalError, pd.errors.DatabaseError) as exc:
@@ -331,7 +337,7 @@ def read_commodity_freshness() -> pd.DataFrame:
     if not is_cloud() and not os.path.exists(DB_PATH):
         return pd.DataFrame()
 
-    with get_connection() as conn:
+    with get_read_connection() as conn:
         try:
             df = pd.read_sql("SELECT * FROM commodity_freshness", conn)
         except (sqlite3.OperationalError, pd.errors.DatabaseError) as exc:
@@ -329,6 +329,17 @@ CREATE TABLE IF NOT EXISTS briefings (
 );
 """
 
+# Series computed from other tables (rolling correlations), rewritten in
+# full by analysis/derived.py after each pipeline run.
+_CREATE_DERIVED_SERIES = """
+CREATE TABLE IF NOT EXISTS derived_series (
+    series_name TEXT    NOT NULL,
+    Date        TEXT    NOT NULL,
+    value       REAL,
+    PRIMARY KEY (series_name, Date)
+);
+"""
+
 
 # Bundle for callers that need every table's DDL in one iterable.
 ALL_SCHEMAS = (
@@ -358,6 +369,7 @@ ALL_SCHEMAS = (
     _CREATE_BRAZIL_SPOT,
     _CREATE_SAFEX,
     _CREATE_BRIEFINGS,
+    _CREATE_DERIVED_SERIES,
 )
 
 
@@ -408,5 +420,7 @@ UNIQUE_INDEXES = (
     "ON safex_prices (Date, commodity);",
     "CREATE UNIQUE INDEX IF NOT EXISTS ux_briefings_date "
     "ON briefings (briefing_date);",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_derived_series_name_date "
+    "ON derived_series (series_name, Date);",
 )
 
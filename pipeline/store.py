@@ -198,6 +198,7 @@ def clear_database():
         "eia_energy", "brazil_estimates", "data_freshness",
         "commodity_freshness", "india_domestic_prices",
         "brazil_spot_prices", "safex_prices", "briefings",
+        "derived_series",
     ]
     with get_connection() as conn:
         for table in tables:
@@ -267,15 +268,32 @@ def _str_cols(df: pd.DataFrame, *cols: str, default: str = "") -> pd.DataFrame:
 # --- save_* functions -------------------------------------------------------
 
 
+def _price_rows(name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Shape one commodity's Date-indexed OHLCV into 'prices' columns."""
+    df = df.reset_index().copy()
+    df["commodity"] = name
+    df["Date"] = _date(df["Date"])
+    return df[["commodity", "Date", "Open", "High", "Low", "Close", "Volume"]]
+
+
 def save_price_data(name: str, df: pd.DataFrame):
     """Write OHLCV → 'prices'."""
     if df.empty:
         return
-    df = df.reset_index().copy()
-    df["commodity"] = name
-    df["Date"] = _date(df["Date"])
-    df = df[["commodity", "Date", "Open", "High", "Low", "Close", "Volume"]]
-    _save("prices", df, ["commodity", "Date"], f"prices/{name}")
+    _save("prices", _price_rows(name, df), ["commodity", "Date"], f"prices/{name}")
+
+
+def save_price_data_bulk(data: dict[str, pd.DataFrame]):
+    """Write every commodity's OHLCV → 'prices' in one transaction.
+
+    One connection, commit and (on Turso) sync for the whole layer instead
+    of one per commodity. Empty frames are skipped.
+    """
+    frames = [_price_rows(name, df) for name, df in data.items() if not df.empty]
+    if not frames:
+        return
+    _save("prices", pd.concat(frames, ignore_index=True), ["commodity", "Date"],
+          f"prices/{len(frames)} commodities")
 
 
 # Series whose FRED id was replaced with one on a different index base.
@@ -648,6 +666,32 @@ def save_safex(commodity: str, df: pd.DataFrame):
 # --- Briefing archive -------------------------------------------------------
 
 
+def save_derived_series(name: str, series: pd.Series) -> int:
+    """Replace one derived series (Date-indexed) → 'derived_series'.
+
+    Derived values are recomputed from full history each run, so the old
+    rows are deleted in the same transaction instead of upserted — a
+    recomputed series that got shorter must not keep a stale tail.
+    """
+    df = series.dropna().reset_index()
+    df.columns = ["Date", "value"]
+    df.insert(0, "series_name", name)
+    df["Date"] = _date(df["Date"])
+    with get_connection() as conn:
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DELETE FROM derived_series WHERE series_name = ?", (name,))
+            n = upsert_dataframe(conn, "derived_series", df, ["series_name", "Date"])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            logger.error("Transaction failed for derived_series/%s — rolled back", name)
+            raise
+        maybe_sync(conn)
+    logger.info("Saved %d rows for derived_series/%s", n, name)
+    return n
+
+
 def save_briefing(
     briefing_date: str,
     text: str,
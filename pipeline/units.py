@@ -89,6 +89,14 @@ def to_metric_tons(value: float, commodity: str) -> float | None:
     return value * factor
 
 
+# OHLC plus the technical indicator columns that are in price units.
+_PRICE_UNIT_COLUMNS = [
+    "Open", "High", "Low", "Close",
+    "MA_20", "MA_50", "MA_200",
+    "BB_Upper", "BB_Lower", "BB_Middle",
+]
+
+
 def convert_df_to_mt(df: pd.DataFrame, commodity: str) -> pd.DataFrame:
     """
     Convert OHLC price columns in a DataFrame from native units to USD/MT.
@@ -112,21 +120,11 @@ def convert_df_to_mt(df: pd.DataFrame, commodity: str) -> pd.DataFrame:
     if factor is None:
         return df.copy()
 
-    result = df.copy()
-    for col in ["Open", "High", "Low", "Close"]:
-        if col in result.columns:
-            result[col] = result[col] * factor
-
-    # Also convert technical indicator columns that are in price units
-    price_columns = [
-        "MA_20", "MA_50", "MA_200",
-        "BB_Upper", "BB_Lower", "BB_Middle",
-    ]
-    for col in price_columns:
-        if col in result.columns:
-            result[col] = result[col] * factor
-
-    return result
+    # One block multiply and a single assign, instead of a column write per
+    # indicator on a fresh copy of the whole enriched frame.
+    cols = [c for c in _PRICE_UNIT_COLUMNS if c in df.columns]
+    scaled = df[cols] * factor
+    return df.assign(**{c: scaled[c] for c in cols})
 
 
 def mt_label(commodity: str) -> str:
@@ -10,9 +10,11 @@ and renders a single index.html via Jinja2.
 
 import base64
 import html as html_lib
+import io
 import logging
+import re
 import sys
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pandas as pd
@@ -22,7 +24,20 @@ from jinja2 import Environment, FileSystemLoader
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.charts import (  # noqa: E402  (must follow sys.path.insert above)
+from analysis.briefing import generate_briefing  # noqa: E402  (must follow sys.path.insert above)
+from analysis.loaders import load_emerging_markets, load_health  # noqa: E402
+from analysis.soy_analytics import (  # noqa: E402
+    SOY_LEGS,
+    command_center,
+    demand_analysis,
+    forward_curve_analysis,
+    relative_value_analysis,
+    risk_analysis,
+    seasonal_analysis,
+    supply_analysis,
+    technicals_analysis,
+)
+from app.charts import (  # noqa: E402
     COLORS,
     build_basis_chart,
     build_bean_corn_ratio_chart,
@@ -35,6 +50,8 @@ from app.charts import (  # noqa: E402  (must follow sys.path.insert above)
     build_technical_chart,
     delta_str,
 )
+from pipeline.query import read_freshness  # noqa: E402
+from scripts.generate_players import generate_players_page  # noqa: E402
 from scripts.validate_players import validate_players  # noqa: E402
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -58,6 +75,18 @@ SECTIONS = [
     {"id": "about", "no": "10", "name": "About"},
 ]
 
+# Plotly.js config for every embedded chart: no hover toolbar, charts
+# resize with their container. Hover and zoom stay on.
+PLOT_CONFIG = {"displayModeBar": False, "responsive": True}
+
+# Command Center FX cards: (label, key_metrics key, value format, change
+# key or None). Each card's as-of date is stored under "<key>_date".
+_FX_KEY_METRICS = (
+    ("BRL/USD", "brl_usd", "{:.4f}", "brl_weekly_chg"),
+    ("Dollar Index", "dollar_index", "{:.2f}", None),
+    ("CNY/USD", "cny_usd", "{:.4f}", None),
+)
+
 LEG_COLORS = {
     "Soybeans": COLORS["soybean"],
     "Soybean Oil": COLORS["soy_oil"],
@@ -78,21 +107,29 @@ def _safe_call(fn, label: str):
         return None
 
 
-def _fig_to_html(fig) -> str:
-    """Convert a Plotly figure to an embeddable HTML div."""
-    return fig.to_html(full_html=False, include_plotlyjs=False)
+def _fig_to_html(fig, div_id: str | None = None) -> str:
+    """Convert a Plotly figure to an embeddable HTML div.
+
+    Without `div_id` Plotly picks a random one, so the page differs on
+    every build; per-leg charts pass a stable id instead.
+    """
+    return fig.to_html(full_html=False, include_plotlyjs=False, config=PLOT_CONFIG, div_id=div_id)
 
 
-def _to_data_uri(text: str, mime: str = "text/plain") -> str:
-    """Encode text as a base64 data URI for download links."""
-    b64 = base64.b64encode(text.encode("utf-8")).decode("ascii")
-    return f"data:{mime};base64,{b64}"
+def _leg_chart_id(prefix: str, leg: str) -> str:
+    """Stable DOM id for a per-leg chart, e.g. curve-soybean-oil."""
+    return f"{prefix}-{leg.lower().replace(' ', '-')}"
 
 
 def _csv_data_uri(df: pd.DataFrame) -> str:
-    """Encode a DataFrame as a CSV data URI."""
-    csv_str = df.to_csv(index=True)
-    return _to_data_uri(csv_str, "text/csv")
+    """Encode a DataFrame as a base64 CSV data URI for download links.
+
+    The CSV is written straight into a bytes buffer, so no intermediate
+    str is built and re-encoded before base64.
+    """
+    buf = io.BytesIO()
+    df.to_csv(buf, index=True)
+    return f"data:text/csv;base64,{base64.b64encode(buf.getvalue()).decode('ascii')}"
 
 
 def _esc(text) -> str:
@@ -102,13 +139,42 @@ def _esc(text) -> str:
     return html_lib.escape(str(text))
 
 
+def _metric_card(label: str, value: str, delta: str | None = None,
+                 delta_class: str = "muted", val_class: str = "",
+                 caption: str = "") -> str:
+    """One `.mc` metric card as a single string.
+
+    `label` and `value` are inserted as-is (escape them first); `caption`
+    is pre-rendered HTML appended after the delta line.
+    """
+    val_cls = f"mc-val {val_class}" if val_class else "mc-val"
+    delta_html = f'<div class="mc-delta {delta_class}">{delta}</div>' if delta is not None else ""
+    return (
+        f'<div class="mc"><div class="mc-label">{label}</div>'
+        f'<div class="{val_cls}">{value}</div>{delta_html}{caption}</div>'
+    )
+
+
+def _vs_direction(pct: float) -> tuple[str, str]:
+    """CSS class and word for a signed deviation: up/Above, down/Below or muted/Flat."""
+    if pct > 0:
+        return "up", "Above"
+    if pct < 0:
+        return "down", "Below"
+    return "muted", "Flat"
+
+
+def _metric_grid(cards: list[str], cols: int) -> str:
+    """A row of metric cards as one HTML block."""
+    return "\n".join([f'<div class="grid grid-{cols}">', *cards, '</div>'])
+
+
 # ---------------------------------------------------------------------------
 # Freshness indicators
 # ---------------------------------------------------------------------------
 def _build_freshness_items() -> list[dict]:
     """Build data freshness sidebar items."""
     try:
-        from pipeline.query import read_freshness
         freshness = read_freshness()
     except Exception:
         return []
@@ -116,12 +182,18 @@ def _build_freshness_items() -> list[dict]:
     if freshness.empty:
         return []
 
-    now = datetime.now(timezone.utc)
+    # Ages are computed for every layer in one vectorised pass; the loop
+    # below only formats.
+    ages = datetime.now(timezone.utc) - pd.to_datetime(freshness["last_success"], utc=True)
+    age_days = ages.dt.days
+    age_hours = ages.dt.total_seconds() // 3600
+    statuses = freshness["status"] if "status" in freshness.columns else [None] * len(freshness)
+
     items = []
-    for _, row in freshness.iterrows():
-        layer = row["layer_name"]
-        last = row["last_success"]
-        row_status = str(row.get("status") or "success")
+    for layer, days, hours, raw_status in zip(
+        freshness["layer_name"], age_days, age_hours, statuses, strict=True
+    ):
+        row_status = str(raw_status or "success")
 
         # An intentionally disabled layer must not read as fresh or as an
         # outage — it gets its own bucket and is excluded from counts.
@@ -129,23 +201,22 @@ def _build_freshness_items() -> list[dict]:
             items.append({"name": layer, "status": "disabled", "age": "disabled"})
             continue
 
-        if pd.notna(last):
-            last_dt = pd.to_datetime(last, utc=True)
-            age = now - last_dt
+        if pd.notna(days):
+            days = int(days)
             if row_status == "failed":
                 # Last run failed: show the age of the last GOOD run, never
                 # a green badge — the old code rendered a dead layer "0h ago".
                 status = "old"
-                age_str = f"failed · last good {age.days}d ago"
-            elif age < timedelta(days=1):
+                age_str = f"failed · last good {days}d ago"
+            elif days < 1:
                 status = "fresh"
-                age_str = f"{int(age.total_seconds() // 3600)}h ago"
-            elif age < timedelta(days=7):
+                age_str = f"{int(hours)}h ago"
+            elif days < 7:
                 status = "stale"
-                age_str = f"{age.days}d ago"
+                age_str = f"{days}d ago"
             else:
                 status = "old"
-                age_str = f"{age.days}d ago"
+                age_str = f"{days}d ago"
         else:
             status = "old"
             age_str = "failed · never succeeded" if row_status == "failed" else "never"
@@ -222,36 +293,17 @@ def _build_command_center(data: dict) -> dict | None:
     })
 
     # key_metrics is a flat dict: brl_usd, brl_weekly_chg, dollar_index, cny_usd
-    brl_val = km.get("brl_usd")
-    brl_chg = km.get("brl_weekly_chg")
-    key_metrics.append({
-        "label": "BRL/USD",
-        "value": f"{brl_val:.4f}" if brl_val else "N/A",
-        "val_class": "",
-        "delta": delta_str(brl_chg) if brl_chg is not None else "",
-        "delta_class": "up" if brl_chg and brl_chg >= 0 else "down" if brl_chg else "muted",
-        "as_of": km.get("brl_usd_date") or "",
-    })
-
-    dollar_val = km.get("dollar_index")
-    key_metrics.append({
-        "label": "Dollar Index",
-        "value": f"{dollar_val:.2f}" if dollar_val else "N/A",
-        "val_class": "",
-        "delta": "",
-        "delta_class": "muted",
-        "as_of": km.get("dollar_index_date") or "",
-    })
-
-    cny_val = km.get("cny_usd")
-    key_metrics.append({
-        "label": "CNY/USD",
-        "value": f"{cny_val:.4f}" if cny_val else "N/A",
-        "val_class": "",
-        "delta": "",
-        "delta_class": "muted",
-        "as_of": km.get("cny_usd_date") or "",
-    })
+    for label, key, fmt, chg_key in _FX_KEY_METRICS:
+        val = km.get(key)
+        chg = km.get(chg_key) if chg_key else None
+        key_metrics.append({
+            "label": label,
+            "value": fmt.format(val) if val else "N/A",
+            "val_class": "",
+            "delta": delta_str(chg) if chg is not None else "",
+            "delta_class": "up" if chg and chg >= 0 else "down" if chg else "muted",
+            "as_of": km.get(f"{key}_date") or "",
+        })
 
     # DCE board crush (China story) — CNY/MT, USD/MT beneath when available.
     dce_crush = km.get("dce_crush_cny_mt")
@@ -290,10 +342,10 @@ def _build_technicals(data: dict) -> list[dict] | None:
         return None
 
     per_leg_mt = data.get("per_leg_mt", data.get("per_leg", {}))
-    all_signals = data.get("signals", [])
+    signals_by_commodity = data.get("signals_by_commodity", {})
     items = []
 
-    for name in ["Soybeans", "Soybean Oil", "Soybean Meal"]:
+    for name in SOY_LEGS:
         df = per_leg_mt.get(name)
         if df is None or df.empty:
             continue
@@ -301,7 +353,7 @@ def _build_technicals(data: dict) -> list[dict] | None:
         fig = build_technical_chart(df, name)
         chart_html = _fig_to_html(fig)
 
-        leg_signals = [s for s in all_signals if s.get("commodity") == name]
+        leg_signals = signals_by_commodity.get(name, [])
         sig_items = [{
             "severity": s.get("severity", "info"),
             "severity_label": s.get("severity", "info").upper(),
@@ -309,8 +361,7 @@ def _build_technicals(data: dict) -> list[dict] | None:
         } for s in leg_signals]
 
         # CSV download (last 252 trading days)
-        csv_df = df.tail(252)[["Open", "High", "Low", "Close"]].copy()
-        csv_uri = _csv_data_uri(csv_df)
+        csv_uri = _csv_data_uri(df.tail(252)[["Open", "High", "Low", "Close"]])
 
         items.append({
             "name": name,
@@ -325,33 +376,37 @@ def _build_technicals(data: dict) -> list[dict] | None:
 # ---------------------------------------------------------------------------
 # Supply & Demand HTML snippets
 # ---------------------------------------------------------------------------
+def _wasde_attr_line(attr_name: str, info: dict, with_revision: bool) -> str:
+    """One WASDE attribute row: value, unit, optional MoM revision, period."""
+    val = info["value"]
+    unit = info.get("unit", "")
+    rev = info.get("revision") if with_revision else None
+    rev_str = ""
+    if rev is not None and rev != 0:
+        direction = "UP" if rev > 0 else "DOWN"
+        rev_str = f' <span class="{"up" if rev > 0 else "down"}">(revised {direction} {abs(rev):,.0f})</span>'
+    period = info.get("period", "")
+    period_str = f' <span style="color:var(--text-dim);">· {_esc(period)}</span>' if period else ""
+    return f'<div style="font-size:13px; color:var(--text-muted); padding:2px 0;">- {_esc(attr_name)}: <strong style="color:var(--text)">{val:,.0f}</strong> {_esc(unit)}{rev_str}{period_str}</div>'
+
+
 def _build_supply(data: dict) -> dict | None:
     if not data:
         return None
     out = {}
 
-    # WASDE (soy only)
+    # WASDE: one pass splits soy rows (with MoM revisions) from competing crops
     wasde = data.get("wasde", {})
+    soy_lines: list[str] = []
+    competing_lines: list[str] = []
+    for commodity, attrs in wasde.items():
+        is_soy = "SOYBEAN" in commodity.upper()
+        lines = soy_lines if is_soy else competing_lines
+        lines.append(f'<div class="subhdr" style="font-size:14px; margin-top:12px;">{_esc(commodity)}</div>')
+        lines.extend(_wasde_attr_line(attr_name, info, is_soy) for attr_name, info in attrs.items()
+                     if not pd.isna(info.get("value")))
     if wasde:
-        lines = []
-        for commodity, attrs in wasde.items():
-            if "SOYBEAN" not in commodity.upper():
-                continue
-            lines.append(f'<div class="subhdr" style="font-size:14px; margin-top:12px;">{_esc(commodity)}</div>')
-            for attr_name, info in attrs.items():
-                val = info.get("value")
-                if pd.isna(val):
-                    continue
-                rev = info.get("revision")
-                unit = info.get("unit", "")
-                rev_str = ""
-                if rev is not None and rev != 0:
-                    direction = "UP" if rev > 0 else "DOWN"
-                    rev_str = f' <span class="{"up" if rev > 0 else "down"}">(revised {direction} {abs(rev):,.0f})</span>'
-                period = info.get("period", "")
-                period_str = f' <span style="color:var(--text-dim);">· {_esc(period)}</span>' if period else ""
-                lines.append(f'<div style="font-size:13px; color:var(--text-muted); padding:2px 0;">- {_esc(attr_name)}: <strong style="color:var(--text)">{val:,.0f}</strong> {_esc(unit)}{rev_str}{period_str}</div>')
-        out["wasde_html"] = "\n".join(lines) if lines else ""
+        out["wasde_html"] = "\n".join(soy_lines)
 
     # Stocks-to-use (US balance sheet, from PSD)
     stu = data.get("stocks_to_use", {})
@@ -379,28 +434,14 @@ def _build_supply(data: dict) -> dict | None:
         cards.append('</div>')
         out["stocks_to_use_html"] = "\n".join(cards)
 
-    # Competing crops WASDE
+    # Competing crops WASDE, followed by PSD highlights
     if wasde:
-        lines = []
-        for commodity, attrs in wasde.items():
-            if "SOYBEAN" in commodity.upper():
-                continue
-            lines.append(f'<div class="subhdr" style="font-size:14px; margin-top:12px;">{_esc(commodity)}</div>')
-            for attr_name, info in attrs.items():
-                val = info.get("value")
-                if pd.isna(val):
-                    continue
-                unit = info.get("unit", "")
-                period = info.get("period", "")
-                period_str = f' <span style="color:var(--text-dim);">· {_esc(period)}</span>' if period else ""
-                lines.append(f'<div style="font-size:13px; color:var(--text-muted); padding:2px 0;">- {_esc(attr_name)}: <strong style="color:var(--text)">{val:,.0f}</strong> {_esc(unit)}{period_str}</div>')
-        # PSD highlights
         psd = data.get("psd_highlights", [])
         if psd:
-            lines.append('<hr class="divider"><div class="subhdr">Global Supply (PSD)</div>')
+            competing_lines.append('<hr class="divider"><div class="subhdr">Global Supply (PSD)</div>')
             for item in psd:
-                lines.append(f'<div style="font-size:13px; color:var(--text-muted); padding:2px 0;">- {_esc(item["country"])} {_esc(item["commodity"])} {_esc(item["attribute"])}: <strong style="color:var(--text)">{item["value"]:,.0f}</strong> {_esc(item.get("unit", ""))}</div>')
-        out["competing_html"] = "\n".join(lines) if lines else ""
+                competing_lines.append(f'<div style="font-size:13px; color:var(--text-muted); padding:2px 0;">- {_esc(item["country"])} {_esc(item["commodity"])} {_esc(item["attribute"])}: <strong style="color:var(--text)">{item["value"]:,.0f}</strong> {_esc(item.get("unit", ""))}</div>')
+        out["competing_html"] = "\n".join(competing_lines)
 
     # CONAB
     conab = data.get("conab_vs_usda", {})
@@ -655,9 +696,7 @@ def _build_relative_value(data: dict) -> str:
     if spread_df is not None and not spread_df.empty:
         parts.append('<div class="subhdr">Crush Spread</div>')
         try:
-            from pipeline.units import to_metric_tons
-            spread_mt = spread_df["crush_spread"].apply(lambda x: to_metric_tons(x, "Soybeans"))
-            fig = build_crush_spread_chart(spread_df, spread_mt, crush)
+            fig = build_crush_spread_chart(spread_df, crush["series_usd_mt"], crush)
             cur = crush.get("current_usd_mt", 0)
             prof = crush.get("profitable", False)
             crush_asof = crush.get("as_of")
@@ -765,13 +804,13 @@ def _build_relative_value(data: dict) -> str:
             sc = "up" if swk and swk >= 0 else "down" if swk else "muted"
             so_asof = ovp.get("soy_oil_as_of")
             so_d = f'<div class="caption">as of {_esc(so_asof)}</div>' if so_asof else ""
-            cards.append(f'<div class="mc"><div class="mc-label">Soy Oil ({_esc(ovp.get("soy_oil_unit", "USD/MT"))})</div><div class="mc-val">{so:,.2f}</div><div class="mc-delta {sc}">{delta_str(swk)}</div>{so_d}</div>')
+            cards.append(_metric_card(f'Soy Oil ({_esc(ovp.get("soy_oil_unit", "USD/MT"))})', f"{so:,.2f}", delta_str(swk), sc, caption=so_d))
         if po:
             pwk = ovp.get("palm_oil_weekly_chg")
             pc = "up" if pwk and pwk >= 0 else "down" if pwk else "muted"
             po_asof = ovp.get("palm_oil_as_of")
             po_d = f'<div class="caption">as of {_esc(po_asof)}</div>' if po_asof else ""
-            cards.append(f'<div class="mc"><div class="mc-label">Palm Oil ({_esc(ovp.get("palm_oil_unit", "USD/MT"))})</div><div class="mc-val">{po:,.2f}</div><div class="mc-delta {pc}">{delta_str(pwk)}</div>{po_d}</div>')
+            cards.append(_metric_card(f'Palm Oil ({_esc(ovp.get("palm_oil_unit", "USD/MT"))})', f"{po:,.2f}", delta_str(pwk), pc, caption=po_d))
         cards.append('</div>')
         parts.append("\n".join(cards))
 
@@ -787,7 +826,7 @@ def _build_relative_value(data: dict) -> str:
             sc = "up" if swk and swk >= 0 else "down" if swk else "muted"
             so_asof = ovr.get("soy_oil_as_of")
             so_d = f'<div class="caption">as of {_esc(so_asof)}</div>' if so_asof else ""
-            cards.append(f'<div class="mc"><div class="mc-label">Soy Oil (USD/MT)</div><div class="mc-val">{so:,.2f}</div><div class="mc-delta {sc}">{delta_str(swk)}</div>{so_d}</div>')
+            cards.append(_metric_card("Soy Oil (USD/MT)", f"{so:,.2f}", delta_str(swk), sc, caption=so_d))
         if ro:
             rwk = ovr.get("rapeseed_oil_weekly_chg")
             rc = "up" if rwk and rwk >= 0 else "down" if rwk else "muted"
@@ -799,7 +838,7 @@ def _build_relative_value(data: dict) -> str:
             if ro_asof:
                 ro_caption_parts.append(f"as of {_esc(ro_asof)}")
             ro_d = f'<div class="caption">{" · ".join(ro_caption_parts)}</div>' if ro_caption_parts else ""
-            cards.append(f'<div class="mc"><div class="mc-label">CZCE Rapeseed Oil (USD/MT)</div><div class="mc-val">{ro:,.2f}</div><div class="mc-delta {rc}">{delta_str(rwk)}</div>{ro_d}</div>')
+            cards.append(_metric_card("CZCE Rapeseed Oil (USD/MT)", f"{ro:,.2f}", delta_str(rwk), rc, caption=ro_d))
         cards.append('</div>')
         parts.append("\n".join(cards))
         spread = ovr.get("spread_usd_mt")
@@ -836,21 +875,21 @@ def _build_risk_monitor(data: dict) -> str:
     currencies = data.get("currencies", {})
     if currencies:
         parts.append('<div class="subhdr">Key Currencies</div>')
-        pairs = list(currencies.items())
-        for row_start in range(0, len(pairs), 3):
-            row = pairs[row_start:row_start + 3]
-            parts.append(f'<div class="grid grid-{len(row)}">')
-            for pair, info in row:
-                wk = info.get("weekly_chg")
-                wc = "up" if wk and wk >= 0 else "down" if wk else "muted"
-                mo_parts = []
-                if info.get("monthly_chg") is not None:
-                    mo_parts.append(f'30d: {info["monthly_chg"]:+.1f}%')
-                if info.get("as_of"):
-                    mo_parts.append(f'as of {_esc(info["as_of"])}')
-                mo_str = f'<div class="caption">{" · ".join(mo_parts)}</div>' if mo_parts else ""
-                parts.append(f'<div class="mc"><div class="mc-label">{_esc(pair)}</div><div class="mc-val">{info["close"]:.4f}</div><div class="mc-delta {wc}">{delta_str(wk)}</div>{mo_str}</div>')
-            parts.append('</div>')
+        cards = []
+        for pair, info in currencies.items():
+            wk = info.get("weekly_chg")
+            wc = "up" if wk and wk >= 0 else "down" if wk else "muted"
+            mo_parts = []
+            if info.get("monthly_chg") is not None:
+                mo_parts.append(f'30d: {info["monthly_chg"]:+.1f}%')
+            if info.get("as_of"):
+                mo_parts.append(f'as of {_esc(info["as_of"])}')
+            mo_str = f'<div class="caption">{" · ".join(mo_parts)}</div>' if mo_parts else ""
+            cards.append(_metric_card(_esc(pair), f'{info["close"]:.4f}', delta_str(wk), wc, caption=mo_str))
+        # Rows of three; a short last row spans its own width.
+        for i in range(0, len(cards), 3):
+            row = cards[i:i + 3]
+            parts.append(_metric_grid(row, len(row)))
         parts.append('<hr class="divider">')
 
     # COT
@@ -885,34 +924,14 @@ def _build_risk_monitor(data: dict) -> str:
         parts.append('<hr class="divider">')
 
     # Correlations
-    try:
-        from analysis.correlations import rolling_correlation
-        from analysis.loaders import load_currencies, load_prices
-
-        all_prices = load_prices()
-        all_currencies = load_currencies()
-
-        corr_series = {
-            name: all_prices[name]["Close"]
-            for name in ["Soybeans", "Soybean Oil", "Corn"]
-            if name in all_prices and not all_prices[name].empty
-        }
-        brl_df = all_currencies.get("BRL/USD", pd.DataFrame())
-
-        pairs = []
-        if "Soybeans" in corr_series and not brl_df.empty:
-            pairs.append(("Soybeans vs BRL/USD", corr_series["Soybeans"], brl_df["Close"]))
-        if "Soybeans" in corr_series and "Soybean Oil" in corr_series:
-            pairs.append(("Soybeans vs Soy Oil", corr_series["Soybeans"], corr_series["Soybean Oil"]))
-        if "Soybeans" in corr_series and "Corn" in corr_series:
-            pairs.append(("Soybeans vs Corn", corr_series["Soybeans"], corr_series["Corn"]))
-
-        if pairs:
+    correlations = data.get("correlations")
+    if correlations is not None and not correlations.empty:
+        try:
+            fig = build_correlations_chart(correlations)
             parts.append('<div class="subhdr">Rolling Correlations</div>')
-            fig = build_correlations_chart(pairs, rolling_correlation)
             parts.append(f'<div class="chart-box">{_fig_to_html(fig)}</div>')
-    except Exception:
-        log.warning("Correlations section failed", exc_info=True)
+        except Exception:
+            log.warning("Correlations section failed", exc_info=True)
 
     return "\n".join(parts)
 
@@ -920,101 +939,110 @@ def _build_risk_monitor(data: dict) -> str:
 # ---------------------------------------------------------------------------
 # Forward Curves HTML
 # ---------------------------------------------------------------------------
-def _build_forward_curves(data: dict) -> str:
-    if not data:
-        return ""
+def _join_legs(blocks: list[list[str]]) -> str:
+    """Join per-leg HTML parts with a divider between legs, not after each."""
+    return '\n<hr class="divider">\n'.join("\n".join(parts) for parts in blocks if parts)
 
-    parts = []
-    for leg in ["Soybeans", "Soybean Oil", "Soybean Meal"]:
-        if leg not in data:
-            continue
-        leg_data = data[leg]
-        curve_df_mt = leg_data.get("curve_data_mt", leg_data.get("curve_data"))
-        analysis = leg_data.get("analysis", {})
-        cal = leg_data.get("calendar_spread", {})
-        unit = leg_data.get("unit", "USD/MT")
 
-        if curve_df_mt is None or curve_df_mt.empty:
-            continue
+def _render_curve_leg(leg: str, leg_data: dict) -> list[str]:
+    """HTML parts for one leg's forward curve: metrics, chart, front spread."""
+    curve_df_mt = leg_data.get("curve_data_mt", leg_data.get("curve_data"))
+    analysis = leg_data.get("analysis", {})
+    cal = leg_data.get("calendar_spread", {})
+    unit = leg_data.get("unit", "USD/MT")
 
-        parts.append(f'<div class="subhdr">{_esc(leg)}</div>')
-        curve_asof = leg_data.get("as_of")
-        if curve_asof:
-            parts.append(f'<div class="caption">Curve snapshot as of {_esc(curve_asof)}</div>')
-
-        # Metrics
-        if analysis:
-            try:
-                from pipeline.units import to_metric_tons
-                front_mt = to_metric_tons(analysis.get("front_price", 0), leg)
-                back_mt = to_metric_tons(analysis.get("back_price", 0), leg)
-            except Exception:
-                front_mt = analysis.get("front_price", 0)
-                back_mt = analysis.get("back_price", 0)
-            spread_pct = analysis.get("spread_pct", 0)
-            parts.append('<div class="grid grid-4">')
-            parts.append(f'<div class="mc"><div class="mc-label">Structure</div><div class="mc-val">{_esc(analysis.get("structure", "N/A").title())}</div></div>')
-            parts.append(f'<div class="mc"><div class="mc-label">Front</div><div class="mc-val">{front_mt:,.1f}</div></div>')
-            parts.append(f'<div class="mc"><div class="mc-label">Back</div><div class="mc-val">{back_mt:,.1f}</div></div>')
-            parts.append(f'<div class="mc"><div class="mc-label">Spread</div><div class="mc-val">{spread_pct:+.1f}%</div></div>')
-            parts.append('</div>')
-
-        # Chart
-        fig = build_forward_curve_chart(curve_df_mt, leg, unit)
-        parts.append(f'<div class="chart-box">{_fig_to_html(fig)}</div>')
+    if curve_df_mt is None or curve_df_mt.empty:
+        return []
 
-        # Calendar spread
-        if cal:
-            parts.append(f'<div class="caption">Front spread: {_esc(cal.get("near_label", ""))} -> {_esc(cal.get("far_label", ""))}: {cal.get("spread", 0):+.2f} ({cal.get("spread_pct", 0):+.1f}%)</div>')
+    parts = [f'<div class="subhdr">{_esc(leg)}</div>']
+    curve_asof = leg_data.get("as_of")
+    if curve_asof:
+        parts.append(f'<div class="caption">Curve snapshot as of {_esc(curve_asof)}</div>')
 
-        parts.append('<hr class="divider">')
+    # Metrics
+    if analysis:
+        front_mt = analysis.get("front_price_mt", analysis.get("front_price", 0))
+        back_mt = analysis.get("back_price_mt", analysis.get("back_price", 0))
+        spread_pct = analysis.get("spread_pct", 0)
+        parts.append(_metric_grid([
+            _metric_card("Structure", _esc(analysis.get("structure", "N/A").title())),
+            _metric_card("Front", f"{front_mt:,.1f}"),
+            _metric_card("Back", f"{back_mt:,.1f}"),
+            _metric_card("Spread", f"{spread_pct:+.1f}%"),
+        ], 4))
 
-    return "\n".join(parts)
+    # Chart
+    fig = build_forward_curve_chart(curve_df_mt, leg, unit)
+    parts.append(f'<div class="chart-box">{_fig_to_html(fig, _leg_chart_id("curve", leg))}</div>')
+
+    # Calendar spread
+    if cal:
+        parts.append(f'<div class="caption">Front spread: {_esc(cal.get("near_label", ""))} -> {_esc(cal.get("far_label", ""))}: {cal.get("spread", 0):+.2f} ({cal.get("spread_pct", 0):+.1f}%)</div>')
+
+    return parts
+
+
+def _build_forward_curves(data: dict) -> str:
+    if not data:
+        return ""
+
+    blocks = []
+    for leg in SOY_LEGS:
+        leg_data = data.get(leg)
+        if leg_data is not None:
+            blocks.append(_render_curve_leg(leg, leg_data))
+    return _join_legs(blocks)
 
 
 # ---------------------------------------------------------------------------
 # Seasonal HTML
 # ---------------------------------------------------------------------------
+def _render_seasonal_leg(leg: str, leg_data: dict, current_month: int) -> list[str]:
+    """HTML parts for one leg's seasonal view: metrics and monthly chart."""
+    monthly = leg_data.get("monthly")
+    vs_seasonal = leg_data.get("vs_seasonal", {})
+    unit = leg_data.get("unit", "USD/MT")
+
+    parts = [f'<div class="subhdr">{_esc(leg)}</div>']
+
+    # Metrics
+    if vs_seasonal:
+        seasonal_asof = leg_data.get("as_of")
+        seasonal_d = f'<div class="caption">as of {_esc(seasonal_asof)}</div>' if seasonal_asof else ""
+        detrended = vs_seasonal.get("detrended_delta_pct")
+        if detrended is not None:
+            dc, word = _vs_direction(detrended)
+            vs_card = _metric_card("vs Seasonal (detrended)", f"{detrended:+.1f}%",
+                                   f"{word} typical for month", dc, val_class=dc)
+        else:
+            dev = vs_seasonal.get("deviation_pct", 0)
+            dc, _ = _vs_direction(dev)
+            vs_card = _metric_card("vs 15y Avg Level", f"{dev:+.1f}%", "trend not removed", dc, val_class=dc)
+        parts.append(_metric_grid([
+            _metric_card(f"Current ({unit})", f'{vs_seasonal["current_price"]:,.1f}', caption=seasonal_d),
+            _metric_card("Seasonal Avg", f'{vs_seasonal["seasonal_avg"]:,.1f}'),
+            vs_card,
+        ], 3))
+
+    # Chart
+    if monthly is not None and not monthly.empty:
+        fig = build_seasonal_chart(monthly, vs_seasonal, leg, unit, current_month=current_month)
+        parts.append(f'<div class="chart-box">{_fig_to_html(fig, _leg_chart_id("seasonal", leg))}</div>')
+
+    return parts
+
+
 def _build_seasonal(data: dict) -> str:
     if not data:
         return ""
 
-    parts = []
-    for leg in ["Soybeans", "Soybean Oil", "Soybean Meal"]:
-        if leg not in data:
-            continue
-        leg_data = data[leg]
-        monthly = leg_data.get("monthly")
-        vs_seasonal = leg_data.get("vs_seasonal", {})
-        unit = leg_data.get("unit", "USD/MT")
-
-        parts.append(f'<div class="subhdr">{_esc(leg)}</div>')
-
-        # Metrics
-        if vs_seasonal:
-            seasonal_asof = leg_data.get("as_of")
-            seasonal_d = f'<div class="caption">as of {_esc(seasonal_asof)}</div>' if seasonal_asof else ""
-            parts.append('<div class="grid grid-3">')
-            parts.append(f'<div class="mc"><div class="mc-label">Current ({unit})</div><div class="mc-val">{vs_seasonal["current_price"]:,.1f}</div>{seasonal_d}</div>')
-            parts.append(f'<div class="mc"><div class="mc-label">Seasonal Avg</div><div class="mc-val">{vs_seasonal["seasonal_avg"]:,.1f}</div></div>')
-            detrended = vs_seasonal.get("detrended_delta_pct")
-            if detrended is not None:
-                dc = "up" if detrended > 0 else "down"
-                parts.append(f'<div class="mc"><div class="mc-label">vs Seasonal (detrended)</div><div class="mc-val {dc}">{detrended:+.1f}%</div><div class="mc-delta {dc}">{"Above" if detrended > 0 else "Below"} typical for month</div></div>')
-            else:
-                dev = vs_seasonal.get("deviation_pct", 0)
-                dc = "up" if dev > 0 else "down"
-                parts.append(f'<div class="mc"><div class="mc-label">vs 15y Avg Level</div><div class="mc-val {dc}">{dev:+.1f}%</div><div class="mc-delta {dc}">trend not removed</div></div>')
-            parts.append('</div>')
-
-        # Chart
-        if monthly is not None and not monthly.empty:
-            fig = build_seasonal_chart(monthly, vs_seasonal, leg, unit)
-            parts.append(f'<div class="chart-box">{_fig_to_html(fig)}</div>')
-
-        parts.append('<hr class="divider">')
-
-    return "\n".join(parts)
+    current_month = datetime.now().month
+    blocks = []
+    for leg in SOY_LEGS:
+        leg_data = data.get(leg)
+        if leg_data is not None:
+            blocks.append(_render_seasonal_leg(leg, leg_data, current_month))
+    return _join_legs(blocks)
 
 
 # ---------------------------------------------------------------------------
@@ -1024,7 +1052,6 @@ def _build_briefing_text(text: str) -> str:
     """HTML-escape and add color hints to the briefing text."""
     escaped = _esc(text)
     # Colorize directional numbers
-    import re
     escaped = re.sub(r'(\+\d+\.\d+%)', r'<span style="color:var(--bullish)">\1</span>', escaped)
     escaped = re.sub(r'(-\d+\.\d+%)', r'<span style="color:var(--bearish)">\1</span>', escaped)
     # Section headers (lines starting with ---)
@@ -1033,22 +1060,45 @@ def _build_briefing_text(text: str) -> str:
 
 
 def _build_health_html(health: dict) -> str:
+    """Health issues as one summary alert and one table, critical rows in red."""
     if not health:
         return ""
     issues = health.get("issues", [])
     if not issues:
         return '<div class="alert alert-ok">All data sources healthy</div>'
-    parts = []
-    for issue in issues:
-        sev = issue.get("severity", "warning")
-        cls = "alert-err" if sev == "critical" else "alert-warn"
-        parts.append(f'<div class="alert {cls}">{_esc(issue.get("table", ""))} / {_esc(issue.get("commodity", ""))}: {_esc(issue.get("message", ""))}</div>')
-    return "\n".join(parts)
+    n_critical = sum(1 for issue in issues if issue.get("severity") == "critical")
+    cls = "alert-err" if n_critical else "alert-warn"
+    rows = "".join(
+        ('<tr class="down">' if issue.get("severity") == "critical" else "<tr>")
+        + f'<td>{_esc(issue.get("severity", "warning"))}</td><td>{_esc(issue.get("table", ""))}</td>'
+        f'<td>{_esc(issue.get("commodity", ""))}</td><td>{_esc(issue.get("message", ""))}</td></tr>'
+        for issue in issues
+    )
+    return (
+        f'<div class="alert {cls}">{len(issues)} issue(s), {n_critical} critical</div>'
+        '<table class="dtable"><thead><tr><th>Severity</th><th>Table</th><th>Commodity</th>'
+        f'<th>Message</th></tr></thead><tbody>{rows}</tbody></table>'
+    )
 
 
 # ---------------------------------------------------------------------------
 # Main generation
 # ---------------------------------------------------------------------------
+# Template context key -> (analyst, section builder). Each analyst is
+# called once and its result handed only to its own builder.
+_ANALYST_SECTIONS = {
+    "command_center": (command_center, _build_command_center),
+    "technicals": (technicals_analysis, _build_technicals),
+    "supply": (supply_analysis, _build_supply),
+    "demand": (demand_analysis, _build_demand),
+    "relative_value": (relative_value_analysis, _build_relative_value),
+    "risk_monitor": (risk_analysis, _build_risk_monitor),
+    "seasonal": (seasonal_analysis, _build_seasonal),
+    "forward_curves": (forward_curve_analysis, _build_forward_curves),
+    "emerging_markets": (load_emerging_markets, _build_emerging_markets),
+}
+
+
 def generate():
     """Generate the static HTML dashboard."""
     log.info("Starting HTML generation...")
@@ -1061,38 +1111,17 @@ def generate():
             log.error("players: %s", err)
         raise SystemExit(f"players validation failed with {len(player_errors)} violation(s)")
 
-    # Load analysts
-    from analysis.briefing import generate_briefing
-    from analysis.health import run_health_check
-    from analysis.soy_analytics import (
-        command_center,
-        demand_analysis,
-        emerging_markets_analysis,
-        forward_curve_analysis,
-        relative_value_analysis,
-        risk_analysis,
-        seasonal_analysis,
-        supply_analysis,
-        technicals_analysis,
-    )
-
     # Call all analysts
     log.info("Calling analysts...")
-    cc_data = _safe_call(command_center, "command_center")
-    tech_data = _safe_call(technicals_analysis, "technicals")
-    supply_data = _safe_call(supply_analysis, "supply")
-    demand_data = _safe_call(demand_analysis, "demand")
-    rv_data = _safe_call(relative_value_analysis, "relative_value")
-    risk_data = _safe_call(risk_analysis, "risk")
-    seasonal_data = _safe_call(seasonal_analysis, "seasonal")
-    fc_data = _safe_call(forward_curve_analysis, "forward_curves")
-    em_data = _safe_call(emerging_markets_analysis, "emerging_markets")
+    analyst_data = {
+        key: _safe_call(analyst, key) for key, (analyst, _) in _ANALYST_SECTIONS.items()
+    }
 
     log.info("Generating briefing...")
     briefing_text = _safe_call(generate_briefing, "briefing") or ""
 
     log.info("Running health check...")
-    health = _safe_call(run_health_check, "health")
+    health = _safe_call(load_health, "health")
 
     # Build template context
     log.info("Building template context...")
@@ -1103,17 +1132,11 @@ def generate():
         "generated_at": now.strftime("%Y-%m-%d %H:%M UTC"),
         "masthead": _build_masthead(freshness_items, now),
         "freshness_items": freshness_items,
-        "command_center": _build_command_center(cc_data),
-        "technicals": _build_technicals(tech_data),
-        "supply": _build_supply(supply_data),
-        "demand": _build_demand(demand_data),
-        "emerging_markets": _build_emerging_markets(em_data),
-        "relative_value": _build_relative_value(rv_data),
-        "risk_monitor": _build_risk_monitor(risk_data),
-        "forward_curves": _build_forward_curves(fc_data),
-        "seasonal": _build_seasonal(seasonal_data),
+        **{
+            key: build(analyst_data[key])
+            for key, (_, build) in _ANALYST_SECTIONS.items()
+        },
         "briefing_text": _build_briefing_text(briefing_text) if briefing_text else "",
-        "briefing_uri": _to_data_uri(briefing_text) if briefing_text else "",
         "health_html": _build_health_html(health) if health else "",
     }
 
@@ -1134,7 +1157,6 @@ def generate():
     # already gates the knowledge base, so a failure here is a build bug and
     # must fail the run, not silently ship a dashboard without the page.
     log.info("Generating players page...")
-    from scripts.generate_players import generate_players_page
     generate_players_page()
 
 
@@ -19,6 +19,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from analysis.loaders import clear_loader_cache
 from pipeline import schema
 
 _SCHEMA_CONSTANTS = [
@@ -48,6 +49,7 @@ _SCHEMA_CONSTANTS = [
     schema._CREATE_DATA_FRESHNESS,
     schema._CREATE_COMMODITY_FRESHNESS,
     schema._CREATE_BRIEFINGS,
+    schema._CREATE_DERIVED_SERIES,
 ]
 
 
@@ -104,10 +106,12 @@ def tmp_db(tmp_path: Path) -> sqlite3.Connection:
 def patched_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Temp SQLite file wired into pipeline.store and pipeline.query.
 
-    Creates a fresh DB with all 21 tables, then monkeypatches
-    `get_connection`, `DB_PATH`, `STORAGE_DIR`, and `is_cloud` in both
-    pipeline modules so save_* / read_* functions transparently target
+    Creates a fresh DB with every table, then monkeypatches
+    `get_connection` / `get_read_connection`, `DB_PATH`, `STORAGE_DIR`,
+    and `is_cloud` in both pipeline modules so save_* / read_* functions transparently target
     the temp DB. Returns the DB path so a test can also issue raw SQL.
+    The analysis loader caches are cleared on both sides of the test, so
+    cached table loads never carry over from another test's DB.
     """
     db_path = tmp_path / "test.db"
     conn = sqlite3.connect(str(db_path))
@@ -119,10 +123,13 @@ def patched_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     def _connect() -> sqlite3.Connection:
         return sqlite3.connect(str(db_path))
 
+    monkeypatch.setattr("pipeline.store.get_connection", _connect)
+    monkeypatch.setattr("pipeline.query.get_read_connection", _connect)
     for module in ("pipeline.store", "pipeline.query"):
-        monkeypatch.setattr(f"{module}.get_connection", _connect)
         monkeypatch.setattr(f"{module}.DB_PATH", str(db_path))
         monkeypatch.setattr(f"{module}.is_cloud", lambda: False)
     monkeypatch.setattr("pipeline.store.STORAGE_DIR", str(tmp_path))
 
-    return db_path
+    clear_loader_cache()
+    yield db_path
+    clear_loader_cache()
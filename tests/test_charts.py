@@ -0,0 +1,258 @@
+"""Tests for app.charts data reduction and figure builders.
+
+Figures are checked structurally (trace types, point counts) — the
+rendered look is DESIGN.md's concern, not these tests'.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.technical import compute_all_technicals
+from app import charts
+
+
+@pytest.fixture
+def long_ohlcv(synthetic_ohlcv) -> pd.DataFrame:
+    """~3 years of daily bars: the 300-row fixture tiled with a fresh index."""
+    df = pd.concat([synthetic_ohlcv] * 3, ignore_index=True)
+    df.index = pd.date_range("2022-01-03", periods=len(df), freq="B", name="Date")
+    return compute_all_technicals(df)
+
+
+# ---------------------------------------------------------------------------
+# _weekly_ohlc / _reduce_history
+# ---------------------------------------------------------------------------
+
+
+def test_weekly_ohlc_aggregates_like_a_candle(synthetic_ohlcv):
+    week = synthetic_ohlcv.iloc[:5]  # 2024-01-01 (Mon) .. 2024-01-05 (Fri)
+    out = charts._weekly_ohlc(week)
+
+    assert len(out) == 1
+    row = out.iloc[0]
+    assert out.index[0] == week.index[-1]
+    assert row["Open"] == week["Open"].iloc[0]
+    assert row["High"] == week["High"].max()
+    assert row["Low"] == week["Low"].min()
+    assert row["Close"] == week["Close"].iloc[-1]
+    assert row["Volume"] == pytest.approx(week["Volume"].mean())
+
+
+def test_reduce_history_short_frame_untouched(synthetic_ohlcv):
+    assert charts._reduce_history(synthetic_ohlcv) is synthetic_ohlcv
+
+
+def test_reduce_history_keeps_recent_daily_and_monotonic(long_ohlcv):
+    out = charts._reduce_history(long_ohlcv, daily_bars=100)
+
+    assert out.index.is_monotonic_increasing
+    assert out.index.is_unique
+    pd.testing.assert_frame_equal(out.iloc[-100:], long_ohlcv.iloc[-100:], check_freq=False)
+    assert len(out) < len(long_ohlcv) - 100
+    assert out["High"].max() == long_ohlcv["High"].max()
+
+
+def test_reduce_history_falls_back_to_monthly_over_budget(long_ohlcv):
+    weekly = charts._reduce_history(long_ohlcv, daily_bars=100)
+    capped = charts._reduce_history(long_ohlcv, daily_bars=100, max_bars=len(weekly) - 1)
+
+    assert len(capped) <= len(weekly) - 1
+    assert capped.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(capped.iloc[-100:], long_ohlcv.iloc[-100:], check_freq=False)
+    assert capped["Low"].min() == long_ohlcv["Low"].min()
+
+
+def test_build_technical_chart_reduces_long_history(long_ohlcv):
+    fig = charts.build_technical_chart(long_ohlcv, "Soybeans")
+    candle = next(t for t in fig.data if t.type == "candlestick")
+    assert len(candle.x) < len(long_ohlcv)
+
+
+def test_figures_keep_ui_state_across_replots(long_ohlcv):
+    tech = charts.build_technical_chart(long_ohlcv, "Soybeans")
+    ratio = charts.build_oil_meal_ratio_chart(
+        {"series": long_ohlcv["Close"], "avg_60d": 1.0, "min_1y": None}
+    )
+    assert tech.layout.uirevision == "Soybeans"
+    assert ratio.layout.uirevision is not None
+
+
+def test_technical_charts_do_not_share_state(long_ohlcv):
+    beans = charts.build_technical_chart(long_ohlcv, "Soybeans")
+    oil = charts.build_technical_chart(long_ohlcv, "Soybean Oil")
+
+    assert beans.layout.annotations[0].text == "Soybeans"
+    assert oil.layout.annotations[0].text == "Soybean Oil"
+    assert len(beans.data) == len(oil.data)
+    assert charts._technical_skeleton().data == ()
+    assert {s.y0 for s in oil.layout.shapes} == {70, 30}
+
+
+def test_technical_chart_lines_use_webgl(long_ohlcv):
+    fig = charts.build_technical_chart(long_ohlcv, "Soybeans")
+    line_types = {t.type for t in fig.data if t.type not in ("candlestick", "bar")}
+    assert line_types == {"scattergl"}
+
+
+def test_technical_chart_bar_colors_follow_direction(synthetic_ohlcv):
+    df = compute_all_technicals(synthetic_ohlcv)
+    fig = charts.build_technical_chart(df, "Soybeans")
+    bars = {t.name: t for t in fig.data if t.type == "bar"}
+
+    up = (df["Close"] >= df["Open"]).to_numpy()
+    vol_colors = list(bars["Volume"].marker.color)
+    assert vol_colors == [charts.COLORS["bullish"] if u else charts.COLORS["bearish"] for u in up]
+
+    hist_up = (df["MACD_Histogram"] >= 0).to_numpy()
+    hist_colors = list(bars["Histogram"].marker.color)
+    assert hist_colors == [charts.COLORS["bullish"] if u else charts.COLORS["bearish"] for u in hist_up]
+
+
+def test_daily_traces_send_date_only_x(long_ohlcv):
+    fig = charts.build_technical_chart(long_ohlcv, "Soybeans")
+    candle = next(t for t in fig.data if t.type == "candlestick")
+    assert candle.x[-1] == long_ohlcv.index[-1].strftime("%Y-%m-%d")
+    assert all(isinstance(t.x[0], str) and len(t.x[0]) == 10 for t in fig.data)
+
+
+def test_day_axis_keeps_intraday_timestamps():
+    stamps = pd.DatetimeIndex(["2026-01-05", "2026-01-05 12:00"])
+    assert charts._day_axis(stamps).equals(stamps)
+    assert list(charts._day_axis(stamps[:1])) == ["2026-01-05"]
+
+
+# ---------------------------------------------------------------------------
+# _lttb_indices / _decimate_lines
+# ---------------------------------------------------------------------------
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    x = np.arange(1_000, dtype=float)
+    y = np.sin(x / 50.0)
+    y[437] = 5.0  # isolated spike a stride sampler would likely miss
+    idx = charts._lttb_indices(x, y, 100)
+
+    assert len(idx) == 100
+    assert idx[0] == 0 and idx[-1] == 999
+    assert np.all(np.diff(idx) > 0)
+    assert 437 in idx
+
+
+def test_lttb_within_budget_returns_all():
+    idx = charts._lttb_indices(np.arange(10.0), np.arange(10.0), 50)
+    np.testing.assert_array_equal(idx, np.arange(10))
+
+
+def test_technical_chart_lines_share_decimated_x(synthetic_ohlcv):
+    df = pd.concat([synthetic_ohlcv] * 12, ignore_index=True)  # ~14 years
+    df.index = pd.date_range("2012-01-02", periods=len(df), freq="B", name="Date")
+    fig = charts.build_technical_chart(compute_all_technicals(df), "Soybeans")
+    line_traces = [t for t in fig.data if t.type == "scattergl"]
+    lengths = {len(t.x) for t in line_traces}
+    assert lengths == {charts.TECHNICAL_LINE_POINTS}
+
+
+def test_correlations_chart_uses_webgl(synthetic_ohlcv):
+    from analysis.correlations import rolling_correlation_frame
+
+    close = synthetic_ohlcv["Close"]
+    reversed_close = pd.Series(close.to_numpy()[::-1], index=close.index)
+    corr = rolling_correlation_frame(
+        {"A vs B": (close, close * 1.5 + 3.0), "A vs C": (close, reversed_close)}
+    )
+    fig = charts.build_correlations_chart(corr)
+    assert [t.type for t in fig.data] == ["scattergl", "scattergl"]
+    assert [t.name for t in fig.data] == ["A vs B", "A vs C"]
+
+
+def test_delta_str_formats_and_handles_missing():
+    assert charts.delta_str(1.234) == "+1.2%"
+    assert charts.delta_str(np.float64(-0.05)) == "-0.1%"
+    assert charts.delta_str(3) == "+3.0%"
+    assert charts.delta_str(None) == "N/A"
+    assert charts.delta_str(float("nan")) == "N/A"
+    assert charts.delta_str(np.float32("nan")) == "N/A"
+
+
+def test_dense_line_charts_are_decimated():
+    rng = np.random.default_rng(3)
+    idx = pd.date_range("2011-01-03", periods=3000, freq="B", name="Date")
+    series = pd.Series(np.cumsum(rng.normal(0, 1, len(idx))), index=idx)
+    fig = charts.build_oil_meal_ratio_chart({"series": series, "avg_60d": 1.0, "min_1y": None})
+    crush = charts.build_crush_spread_chart(pd.DataFrame({"Date": idx}), series, {})
+
+    line = fig.data[0]
+    assert len(line.x) == charts.SERIES_LINE_POINTS
+    assert pd.Timestamp(line.x[0]) == series.index[0]
+    assert pd.Timestamp(line.x[-1]) == series.index[-1]
+    assert max(line.y) == series.max()
+    assert all(len(t.x) < len(series) for t in crush.data)
+
+
+def test_sparse_charts_stay_on_svg():
+    # Browsers cap live WebGL contexts per page; a dozen-point curve or a
+    # single marker does not need one.
+    curve = pd.DataFrame({"label": ["F", "H", "K"], "close": [400.0, 405.0, 410.0]})
+    monthly = pd.DataFrame({
+        "month": range(1, 13),
+        "avg_close": [400.0] * 12, "min_close": [390.0] * 12, "max_close": [410.0] * 12,
+    })
+    fc = charts.build_forward_curve_chart(curve, "Soybeans")
+    seasonal = charts.build_seasonal_chart(monthly, {"current_price": 401.0}, "Soybeans")
+
+    assert {t.type for t in fc.data} == {"scatter"}
+    assert {t.type for t in seasonal.data} == {"bar", "scatter"}
+
+
+def test_seasonal_marker_follows_month_not_position():
+    # March has too little history and was dropped from the monthly table.
+    months = [1, 2, 4, 5, 6, 7, 8, 9, 10, 11, 12]
+    monthly = pd.DataFrame({
+        "month": months,
+        "avg_close": [400.0] * 11, "min_close": [390.0] * 11, "max_close": [410.0] * 11,
+    })
+    april = charts.build_seasonal_chart(monthly, {"current_price": 401.0}, "Soybeans", current_month=4)
+    march = charts.build_seasonal_chart(monthly, {"current_price": 401.0}, "Soybeans", current_month=3)
+
+    assert list(april.data[1].x) == ["Apr"]
+    assert len(march.data) == 1
+
+
+def test_crush_chart_fills_split_by_sign():
+    dates = pd.date_range("2026-01-05", periods=4, freq="D")
+    spread_df = pd.DataFrame({"Date": dates})
+    spread_mt = pd.Series([12.0, -4.0, float("nan"), 0.5])
+    fig = charts.build_crush_spread_chart(spread_df, spread_mt, {})
+
+    # SVG: WebGL fills can bridge the NaN gaps between segments.
+    assert [t.type for t in fig.data] == ["scatter", "scatter"]
+    nan = np.nan
+    profit, loss = fig.data[0].y, fig.data[1].y
+    # One zero crossing inserted between 12 and -4, three quarters along.
+    np.testing.assert_array_equal(profit, [12.0, 0.0, nan, nan, 0.5])
+    np.testing.assert_array_equal(loss, [nan, 0.0, -4.0, nan, nan])
+    assert pd.Timestamp(fig.data[0].x[1]) == dates[0] + pd.Timedelta(hours=18)
+
+
+def test_guides_match_plotly_spanning_helpers():
+    import plotly.graph_objects as go
+
+    expected = go.Figure()
+    expected.add_hrect(y0=1.0, y1=3.0, fillcolor="rgba(0,0,0,0.1)", line_width=0,
+                       annotation_text="1Y range", annotation_font_color="#999")
+    expected.add_hline(y=2.0, line_dash="dot", line_color="#111",
+                       annotation_text="avg", annotation_font_color="#555")
+    expected.add_hline(y=0, line_dash="dash", line_color="#999")
+
+    guides = [
+        charts._hrect(1.0, 3.0, "rgba(0,0,0,0.1)", "1Y range", "#999"),
+        charts._hline(2.0, "#111", "dot", "avg", "#555"),
+        charts._hline(0, "#999"),
+    ]
+    actual = go.Figure(layout=charts._guide_layout(guides))
+
+    assert actual.layout.shapes == expected.layout.shapes
+    assert actual.layout.annotations == expected.layout.annotations
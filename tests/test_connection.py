@@ -7,6 +7,9 @@ down the small pure helpers.
 
 from __future__ import annotations
 
+import sqlite3
+import threading
+
 import pytest
 
 from pipeline import connection
@@ -81,3 +84,46 @@ def test_get_connection_raises_when_require_turso_and_libsql_missing(monkeypatch
 
     with pytest.raises(connection.TursoUnavailableError):
         connection.get_connection()
+
+
+def test_get_read_connection_reuses_one_query_only_handle(monkeypatch, tmp_path):
+    monkeypatch.setattr("pipeline.connection.TURSO_DATABASE_URL", None)
+    monkeypatch.setattr("pipeline.connection.TURSO_AUTH_TOKEN", None)
+    monkeypatch.setattr("pipeline.connection.STORAGE_DIR", str(tmp_path))
+    monkeypatch.setattr("pipeline.connection.DB_PATH", str(tmp_path / "a.db"))
+    monkeypatch.setattr(connection, "_read_local", threading.local())
+
+    first = connection.get_read_connection()
+    assert connection.get_read_connection() is first
+    with pytest.raises(sqlite3.OperationalError):
+        first.execute("CREATE TABLE t (x INTEGER)")
+
+    # A different DB path gets its own connection.
+    monkeypatch.setattr("pipeline.connection.DB_PATH", str(tmp_path / "b.db"))
+    second = connection.get_read_connection()
+    assert second is not first
+    connection.close_read_connections()
+
+
+def test_close_read_connections_closes_every_thread_handle(monkeypatch, tmp_path):
+    monkeypatch.setattr("pipeline.connection.TURSO_DATABASE_URL", None)
+    monkeypatch.setattr("pipeline.connection.TURSO_AUTH_TOKEN", None)
+    monkeypatch.setattr("pipeline.connection.STORAGE_DIR", str(tmp_path))
+    monkeypatch.setattr("pipeline.connection.DB_PATH", str(tmp_path / "a.db"))
+    monkeypatch.setattr(connection, "_read_local", threading.local())
+
+    main_conn = connection.get_read_connection()
+    worker_conns = []
+    worker = threading.Thread(target=lambda: worker_conns.append(connection.get_read_connection()))
+    worker.start()
+    worker.join()
+
+    connection.close_read_connections()
+
+    for conn in (main_conn, *worker_conns):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    reopened = connection.get_read_connection()
+    assert reopened is not main_conn
+    assert reopened.execute("SELECT 1").fetchone() == (1,)
+    connection.close_read_connections()
@@ -17,6 +17,7 @@ from analysis.correlations import (
     commodity_correlation_matrix,
     commodity_vs_currency,
     rolling_correlation,
+    rolling_correlation_frame,
 )
 from analysis.seasonal import current_vs_seasonal, monthly_seasonal
 
@@ -58,6 +59,19 @@ def test_matrix_below_min_periods_is_nan():
     assert pd.isna(matrix.loc["A", "B"])
 
 
+def test_matrix_matches_pandas_pairwise_corr_with_gaps():
+    """Staggered starts and holes: each pair must use only its overlap."""
+    frames = {f"C{i}": _trending_df(seed=10 + i) for i in range(4)}
+    frames["C1"] = frames["C1"].iloc[200:]
+    frames["C2"] = frames["C2"].drop(frames["C2"].index[::7])
+
+    matrix = commodity_correlation_matrix(frames)
+
+    returns = pd.DataFrame({k: v["Close"].pct_change() for k, v in frames.items()})
+    expected = returns.corr(min_periods=MIN_RETURN_OBS)
+    pd.testing.assert_frame_equal(matrix, expected, atol=1e-12)
+
+
 def test_matrix_fewer_than_two_series_is_empty():
     assert commodity_correlation_matrix({"A": _trending_df(seed=6)}).empty
     assert commodity_correlation_matrix({}).empty
@@ -101,6 +115,27 @@ def test_rolling_correlation_short_series_is_empty():
     assert rolling_correlation(a["Close"], b["Close"], window=60).empty
 
 
+def test_rolling_correlation_frame_matches_per_pair():
+    """Each column keeps its own pair's overlap, outer-joined on date."""
+    a, b, c = _trending_df(seed=14), _trending_df(seed=15), _trending_df(seed=16)
+    c = c.drop(c.index[::5])
+    frame = rolling_correlation_frame(
+        {"A vs B": (a["Close"], b["Close"]), "A vs C": (a["Close"], c["Close"])}, window=60
+    )
+    assert list(frame.columns) == ["A vs B", "A vs C"]
+    pd.testing.assert_series_equal(
+        frame["A vs C"].dropna(),
+        rolling_correlation(a["Close"], c["Close"], window=60).dropna(),
+        check_names=False,
+    )
+
+
+def test_rolling_correlation_frame_skips_short_pairs():
+    a, short = _trending_df(seed=17), _trending_df(seed=18, n=30)
+    frame = rolling_correlation_frame({"A vs S": (a["Close"], short["Close"])}, window=60)
+    assert frame.empty
+
+
 # ---------------------------------------------------------------------------
 # seasonal — detrended fields
 # ---------------------------------------------------------------------------
@@ -0,0 +1,101 @@
+"""Tests for analysis/derived.py.
+
+Covers:
+  - materialize_derived_series() writes one stored series per soy pair
+  - soy_rolling_correlations() reads the stored series back unchanged
+  - with nothing stored it computes the correlations on the fly
+  - stored rows older than the latest Soybeans close are recomputed
+  - re-materialising clears a pair whose source has gone away
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import derived, loaders
+from pipeline import query, store
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    loaders.clear_loader_cache()
+    yield
+    loaders.clear_loader_cache()
+
+
+def _walk(seed: int, n: int = 150) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2025-01-01", periods=n, freq="B", name="Date")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1.0},
+        index=idx,
+    )
+
+
+def _seed_prices() -> None:
+    store.save_price_data("Soybeans", _walk(1))
+    store.save_price_data("Soybean Oil", _walk(2))
+    store.save_price_data("Corn", _walk(3))
+
+
+def test_materialize_then_read_matches_computed(patched_db):
+    _seed_prices()
+    written = derived.materialize_derived_series()
+
+    computed = derived.compute_soy_rolling_correlations()
+    stored = derived.soy_rolling_correlations()
+
+    assert written == int(computed.notna().sum().sum())
+    assert list(stored.columns) == ["Soybeans vs Soy Oil", "Soybeans vs Corn"]
+    pd.testing.assert_frame_equal(
+        stored, computed.dropna(how="all"), check_freq=False, check_names=False
+    )
+
+
+def test_soy_rolling_correlations_computes_when_nothing_stored(patched_db):
+    _seed_prices()
+    assert query.read_derived_series().empty
+    out = derived.soy_rolling_correlations()
+    assert list(out.columns) == ["Soybeans vs Soy Oil", "Soybeans vs Corn"]
+
+
+def test_stored_correlations_served_when_current(patched_db, monkeypatch):
+    _seed_prices()
+    derived.materialize_derived_series()
+
+    def _fail():
+        raise AssertionError("recomputed although the stored series is current")
+
+    monkeypatch.setattr(derived, "compute_soy_rolling_correlations", _fail)
+    assert not derived.soy_rolling_correlations().empty
+
+
+def test_stale_stored_correlations_are_recomputed(patched_db):
+    _seed_prices()
+    derived.materialize_derived_series()
+
+    # New closes land after materialisation (failed run, manual backfill).
+    for seed, name in ((1, "Soybeans"), (2, "Soybean Oil"), (3, "Corn")):
+        store.save_price_data(name, _walk(seed, n=155))
+    loaders.clear_loader_cache()
+
+    out = derived.soy_rolling_correlations()
+
+    latest = loaders.load_closes()["Soybeans"].last_valid_index()
+    assert out.index.max() == latest
+    pd.testing.assert_frame_equal(out, derived.compute_soy_rolling_correlations())
+
+
+def test_rematerialize_clears_pair_that_went_away(patched_db, monkeypatch):
+    _seed_prices()
+    derived.materialize_derived_series()
+
+    only_oil = derived.compute_soy_rolling_correlations()[["Soybeans vs Soy Oil"]]
+    monkeypatch.setattr(derived, "compute_soy_rolling_correlations", lambda: only_oil)
+    derived.materialize_derived_series()
+
+    names = set(query.read_derived_series()["series_name"])
+    assert names == {"corr_60d:Soybeans vs Soy Oil"}
@@ -82,8 +82,8 @@ def stalled_spot_em(monkeypatch: pytest.MonkeyPatch):
 
     monkeypatch.setattr(soy_analytics, "load_prices", lambda: prices)
     monkeypatch.setattr(soy_analytics, "load_currencies", lambda: currencies)
-    monkeypatch.setattr(soy_analytics, "read_psd", lambda: pd.DataFrame())
-    monkeypatch.setattr(soy_analytics, "read_weather", lambda: pd.DataFrame())
+    monkeypatch.setattr(soy_analytics, "load_psd", lambda: pd.DataFrame())
+    monkeypatch.setattr(soy_analytics, "load_weather", lambda: pd.DataFrame())
     monkeypatch.setattr(
         soy_analytics, "read_brazil_spot", lambda *args: _cepea_df()
     )
@@ -0,0 +1,90 @@
+"""Tests for the small HTML helpers in scripts/generate_html.py.
+
+Every hand-built `.mc` card in the static dashboard now goes through
+`_metric_card`, so its markup must match what the sections used to
+inline. Also covers the leg divider joiner, the embedded chart config,
+the CSV download URIs, and the risk monitor's guarded correlations chart.
+"""
+
+from __future__ import annotations
+
+import base64
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from scripts import generate_html
+
+
+def test_metric_card_full_markup():
+    card = generate_html._metric_card(
+        "BRL/USD", "0.1800", "+1.2%", "up", caption='<div class="caption">as of x</div>'
+    )
+    assert card == (
+        '<div class="mc"><div class="mc-label">BRL/USD</div><div class="mc-val">0.1800</div>'
+        '<div class="mc-delta up">+1.2%</div><div class="caption">as of x</div></div>'
+    )
+
+
+def test_metric_card_value_only_has_no_delta_line():
+    card = generate_html._metric_card("Spread", "+1.5%", val_class="down")
+    assert card == (
+        '<div class="mc"><div class="mc-label">Spread</div>'
+        '<div class="mc-val down">+1.5%</div></div>'
+    )
+
+
+def test_metric_grid_wraps_cards_in_one_block():
+    cards = [generate_html._metric_card("A", "1"), generate_html._metric_card("B", "2")]
+    block = generate_html._metric_grid(cards, 2)
+    assert block.splitlines() == ['<div class="grid grid-2">', *cards, "</div>"]
+
+
+def test_vs_direction_treats_zero_as_flat():
+    assert generate_html._vs_direction(2.5) == ("up", "Above")
+    assert generate_html._vs_direction(-0.1) == ("down", "Below")
+    assert generate_html._vs_direction(0.0) == ("muted", "Flat")
+
+
+def test_join_legs_puts_dividers_between_legs_only():
+    out = generate_html._join_legs([["a1", "a2"], [], ["b1"]])
+    assert out == 'a1\na2\n<hr class="divider">\nb1'
+    assert generate_html._join_legs([]) == ""
+
+
+def test_embedded_charts_hide_the_mode_bar():
+    html = generate_html._fig_to_html(go.Figure())
+    assert '"displayModeBar": false' in html
+
+
+def test_leg_charts_get_stable_div_ids():
+    html = generate_html._fig_to_html(go.Figure(), generate_html._leg_chart_id("curve", "Soybean Oil"))
+    assert 'id="curve-soybean-oil"' in html
+
+
+def test_csv_data_uri_round_trips_the_frame_as_csv():
+    idx = pd.date_range("2026-01-05", periods=2, freq="B", name="Date")
+    df = pd.DataFrame({"Close": [1.5, 2.25]}, index=idx)
+
+    uri = generate_html._csv_data_uri(df)
+
+    prefix = "data:text/csv;base64,"
+    assert uri.startswith(prefix)
+    assert base64.b64decode(uri[len(prefix):]).decode("utf-8") == df.to_csv(index=True)
+
+
+def test_risk_monitor_survives_a_failing_correlations_chart(monkeypatch):
+    def _boom(_frame):
+        raise ValueError("bad frame")
+
+    monkeypatch.setattr(generate_html, "build_correlations_chart", _boom)
+    idx = pd.date_range("2026-01-05", periods=3, freq="B", name="Date")
+    data = {
+        "currencies": {"BRL/USD": {"close": 0.18, "weekly_chg": 1.0}},
+        "correlations": pd.DataFrame({"Soybeans vs Corn": [0.1, 0.2, 0.3]}, index=idx),
+    }
+
+    html = generate_html._build_risk_monitor(data)
+
+    assert "BRL/USD" in html
+    assert "Rolling Correlations" not in html
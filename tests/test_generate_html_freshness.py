@@ -41,8 +41,7 @@ def test_freshness_age_is_non_negative_for_past_timestamp(monkeypatch):
     df["last_success"] = pd.to_datetime(df["last_success"])
     df["last_attempt"] = pd.to_datetime(df["last_attempt"])
 
-    import pipeline.query as query
-    monkeypatch.setattr(query, "read_freshness", lambda: df)
+    monkeypatch.setattr(generate_html, "read_freshness", lambda: df)
 
     items = generate_html._build_freshness_items()
 
@@ -76,8 +75,7 @@ def test_freshness_age_handles_aware_and_naive_timestamps(monkeypatch):
         "status": ["success", "success"],
     })
 
-    import pipeline.query as query
-    monkeypatch.setattr(query, "read_freshness", lambda: df)
+    monkeypatch.setattr(generate_html, "read_freshness", lambda: df)
 
     items = generate_html._build_freshness_items()
 
@@ -118,8 +116,7 @@ def test_freshness_handles_writer_format_against_non_utc_local_clock(monkeypatch
         "status": ["success"],
     })
 
-    import pipeline.query as query
-    monkeypatch.setattr(query, "read_freshness", lambda: df)
+    monkeypatch.setattr(gh, "read_freshness", lambda: df)
 
     fake_aware_utc = datetime(2026, 5, 20, 11, 0, 0, tzinfo=timezone.utc)
     fake_naive_local = datetime(2026, 5, 20, 6, 0, 0)  # CDT-like: UTC - 5h
@@ -0,0 +1,29 @@
+"""Tests for the dashboard's Data Health Check panel.
+
+All issues render as one summary alert plus one table rather than an
+alert block per issue.
+"""
+
+from __future__ import annotations
+
+from scripts import generate_html
+
+
+def test_health_issues_render_as_one_table():
+    health = {"issues": [
+        {"severity": "critical", "table": "prices", "commodity": "Corn", "message": "stale"},
+        {"severity": "warning", "table": "cot", "commodity": "Soybeans", "message": "<gap>"},
+    ]}
+
+    out = generate_html._build_health_html(health)
+
+    assert out.count('<div class="alert') == 1
+    assert "alert-err" in out and "2 issue(s), 1 critical" in out
+    assert out.count("<table") == 1 and out.count("<tr") == 3
+    assert '<tr class="down"><td>critical</td><td>prices</td>' in out
+    assert "&lt;gap&gt;" in out
+
+
+def test_health_without_issues_is_all_clear():
+    assert "All data sources healthy" in generate_html._build_health_html({"issues": []})
+    assert generate_html._build_health_html({}) == ""
@@ -0,0 +1,74 @@
+"""Tests for analysis/health.py.
+
+_check_flat_prices reads the latest rows of every commodity in one
+windowed query; only the most recent _FLAT_PRICE_DAYS closes decide.
+_read_table_stats reads every checked table in one UNION ALL and only
+falls back to per-table queries to pinpoint an unreadable table.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from analysis import health
+
+
+@pytest.fixture
+def health_db(patched_db: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr("analysis.health.get_read_connection", lambda: sqlite3.connect(str(patched_db)))
+    monkeypatch.setattr("analysis.health.DB_PATH", str(patched_db))
+    monkeypatch.setattr("analysis.health.is_cloud", lambda: False)
+    return patched_db
+
+
+def _insert_closes(db: Path, commodity: str, closes: list[float | None]) -> None:
+    conn = sqlite3.connect(str(db))
+    conn.executemany(
+        "INSERT INTO prices (commodity, Date, Close) VALUES (?, ?, ?)",
+        [(commodity, f"2026-07-{day:02d}", c) for day, c in enumerate(closes, start=1)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_flat_prices_flags_only_recent_flat_runs(health_db: Path) -> None:
+    _insert_closes(health_db, "Corn", [440.0, 441.0, 450.0, 450.0, 450.0])
+    _insert_closes(health_db, "Soybeans", [1000.0, 1000.0, 1000.0, 1001.0])
+    _insert_closes(health_db, "Wheat", [550.0, 550.0])
+
+    issues = health._check_flat_prices()
+
+    assert [i["commodity"] for i in issues] == ["Corn"]
+    assert "450.0" in issues[0]["message"]
+
+
+def test_flat_prices_empty_table(health_db: Path) -> None:
+    assert health._check_flat_prices() == []
+
+
+def test_table_stats_reads_every_table_at_once(health_db: Path) -> None:
+    _insert_closes(health_db, "Corn", [440.0, 441.0])
+
+    stats = health._read_table_stats()
+
+    assert set(stats) == {table for table, _, _ in health._TABLE_SPECS}
+    assert stats["prices"] == [("Corn", "2026-07-02", 2)]
+    assert stats["cot"] == []
+
+
+def test_table_stats_marks_only_the_unreadable_table(health_db: Path) -> None:
+    _insert_closes(health_db, "Corn", [440.0])
+    conn = sqlite3.connect(str(health_db))
+    conn.execute("DROP TABLE safex_prices")
+    conn.commit()
+    conn.close()
+
+    stats = health._read_table_stats()
+
+    assert stats["safex_prices"] is None
+    assert stats["prices"] == [("Corn", "2026-07-01", 1)]
+    issues = health._check_safex(stats)
+    assert issues[0]["severity"] == "critical" and issues[0]["commodity"] == "all"
@@ -4,8 +4,15 @@ Covers:
   - empty DB returns empty dicts
   - non-empty DB returns DatetimeIndex-keyed dicts shaped by commodity / pair
   - `with_technicals=True` adds technical indicator columns
+  - load_closes() pivots Close into one aligned Date x commodity frame
+  - load_forward_curves() groups the latest curves by commodity, sorted
   - the two `with_technicals` cache slots are independent
   - clear_loader_cache() resets both caches
+  - load_health() runs the health check once per load
+  - load_psd() / load_weather() / load_dce_futures() read each table once per load
+  - load_emerging_markets() runs the analysis once per load
+  - technicals_for() reuses results for unchanged data, recomputes on any
+    OHLCV revision (not just Close), and survives clear_loader_cache()
   - mutating cached entries between calls reflects (documents current behaviour)
 """
 
@@ -108,6 +115,48 @@ def test_load_prices_caches_separately_for_each_variant(patched_db):
     assert bare is not with_tech
 
 
+def test_load_closes_is_wide_and_aligned(patched_db):
+    store.save_price_data("Soybeans", _make_ohlcv())
+    store.save_price_data("Corn", _make_ohlcv(n=100, start="2024-06-03"))
+
+    closes = loaders.load_closes()
+    by_commodity = loaders.load_prices()
+
+    assert set(closes.columns) == {"Soybeans", "Corn"}
+    assert closes.index.is_monotonic_increasing
+    assert loaders.load_closes() is closes
+    for name, df in by_commodity.items():
+        pd.testing.assert_series_equal(
+            closes[name].dropna(), df["Close"], check_names=False, check_freq=False
+        )
+
+
+def test_load_closes_empty_db(patched_db):
+    assert loaders.load_closes().empty
+
+
+def test_load_forward_curves_groups_and_sorts(patched_db):
+    store.save_forward_curve("Soybeans", pd.DataFrame({
+        "contract_month": ["2025-03", "2024-11", "2025-01"],
+        "label": ["H", "X", "F"],
+        "ticker": ["ZSH25", "ZSX24", "ZSF25"],
+        "close": [1340.0, 1300.0, 1320.0],
+    }))
+    store.save_forward_curve("Corn", pd.DataFrame({
+        "contract_month": ["2024-12"], "label": ["Z"], "ticker": ["ZCZ24"], "close": [430.0],
+    }))
+
+    curves = loaders.load_forward_curves()
+
+    assert set(curves) == {"Soybeans", "Corn"}
+    assert list(curves["Soybeans"]["contract_month"]) == ["2024-11", "2025-01", "2025-03"]
+    assert loaders.load_forward_curves() is curves
+
+
+def test_load_forward_curves_empty_db(patched_db):
+    assert loaders.load_forward_curves() == {}
+
+
 def test_clear_loader_cache_resets_both(patched_db):
     store.save_price_data("Soybeans", _make_ohlcv())
     store.save_currency_data("BRL/USD", _make_currency())
@@ -127,6 +176,103 @@ def test_clear_loader_cache_resets_both(patched_db):
     assert set(first_currencies) == set(second_currencies)
 
 
+def test_load_health_runs_check_once_per_load(monkeypatch):
+    calls = []
+    monkeypatch.setattr(loaders, "run_health_check", lambda: calls.append(1) or {"issues": []})
+
+    first = loaders.load_health()
+    assert loaders.load_health() is first
+    assert len(calls) == 1
+
+    loaders.clear_loader_cache()
+    loaders.load_health()
+    assert len(calls) == 2
+
+
+def test_table_loaders_read_each_table_once_per_load(monkeypatch):
+    calls = []
+    for loader, reader in (
+        ("load_psd", "read_psd"),
+        ("load_weather", "read_weather"),
+        ("load_dce_futures", "read_dce_futures"),
+    ):
+        monkeypatch.setattr(loaders, reader, lambda r=reader: calls.append(r) or pd.DataFrame())
+        first = getattr(loaders, loader)()
+        assert getattr(loaders, loader)() is first
+    assert calls == ["read_psd", "read_weather", "read_dce_futures"]
+
+    loaders.clear_loader_cache()
+    loaders.load_psd()
+    assert calls[-1] == "read_psd" and len(calls) == 4
+
+
+def test_load_emerging_markets_runs_analysis_once_per_load(monkeypatch):
+    from analysis import soy_analytics
+
+    calls = []
+    monkeypatch.setattr(
+        soy_analytics, "emerging_markets_analysis", lambda: calls.append(1) or {"countries": {}}
+    )
+
+    first = loaders.load_emerging_markets()
+    assert loaders.load_emerging_markets() is first
+    assert len(calls) == 1
+
+    loaders.clear_loader_cache()
+    loaders.load_emerging_markets()
+    assert len(calls) == 2
+
+
+def test_technicals_for_reuses_unchanged_and_recomputes_changed():
+    df = _make_ohlcv()
+    first = loaders.technicals_for("Soybeans", df)
+
+    assert loaders.technicals_for("Soybeans", df.copy()) is first
+
+    revised = df.copy()
+    revised.iloc[10, revised.columns.get_loc("Close")] += 1.0
+    assert loaders.technicals_for("Soybeans", revised) is not first
+
+
+def test_technicals_for_recomputes_when_only_volume_changes():
+    df = _make_ohlcv()
+    loaders.technicals_for("Soybeans", df)
+
+    revised = df.copy()
+    revised.iloc[-1, revised.columns.get_loc("Volume")] = 5_000.0
+    revised.iloc[-1, revised.columns.get_loc("High")] *= 1.01
+    out = loaders.technicals_for("Soybeans", revised)
+
+    assert out["Volume"].iloc[-1] == 5_000.0
+    assert out["High"].iloc[-1] == revised["High"].iloc[-1]
+
+
+def test_technicals_for_recomputes_on_offsetting_close_edits():
+    df = _make_ohlcv()
+    first = loaders.technicals_for("Soybeans", df)
+
+    revised = df.copy()
+    close = revised.columns.get_loc("Close")
+    revised.iloc[10, close] += 5.0
+    revised.iloc[20, close] -= 5.0
+    assert revised["Close"].sum() == pytest.approx(df["Close"].sum())
+
+    out = loaders.technicals_for("Soybeans", revised)
+
+    assert out is not first
+    assert out["Close"].iloc[10] == revised["Close"].iloc[10]
+
+
+def test_technicals_survive_clear_loader_cache(patched_db):
+    store.save_price_data("Soybeans", _make_ohlcv())
+    first = loaders.load_prices(with_technicals=True)["Soybeans"]
+
+    loaders.clear_loader_cache()
+    second = loaders.load_prices(with_technicals=True)["Soybeans"]
+
+    assert second is first
+
+
 def test_load_currencies_returns_indexed_dict(patched_db):
     store.save_currency_data("BRL/USD", _make_currency())
     store.save_currency_data("CNY/USD", _make_currency())
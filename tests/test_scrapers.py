@@ -21,6 +21,7 @@ from bs4 import BeautifulSoup
 
 from fetchers.agrural import _parse_agrural_table, fetch_agrural
 from fetchers.cepea import _parse_cepea_tables
+from fetchers.conab import _aggregate_national, _melt_to_long
 from fetchers.conab_precos import _parse_farmgate, _week_end_date
 from fetchers.india_domestic import _extract_soy_prices
 from fetchers.mandi import _aggregate as _mandi_aggregate
@@ -621,6 +622,28 @@ def test_conab_week_end_date_parses_range() -> None:
     assert _week_end_date("garbage") is None
 
 
+def test_conab_estimates_long_rows_keep_per_crop_order() -> None:
+    raw = pd.DataFrame({
+        "ano_agricola": ["2024/25 ", "2024/25", "2025/26", "2025/26"],
+        "uf": ["PR", "MT", "PR", "PR"],
+        "produto": ["SOJA ", "soja", "milho", "feijao"],
+        "area_plantada_mil_ha": ["2.0", "3.0", "0", "1.0"],
+        "producao_mil_t": ["6.0", "9.0", "4.0", "1.0"],
+    })
+    df = _melt_to_long(_aggregate_national(raw), report_date="2026-10-16")
+
+    assert list(zip(df["commodity"], df["crop_year"], df["attribute"], strict=True)) == [
+        ("Soybeans", "2024/25", "Production"),
+        ("Soybeans", "2024/25", "Area"),
+        ("Soybeans", "2024/25", "Yield"),
+        ("Corn", "2025/26", "Production"),
+        ("Corn", "2025/26", "Area"),  # zero area → no yield row
+    ]
+    assert list(df["value"]) == [15.0, 5.0, 3000.0, 4.0, 0.0]
+    assert list(df["unit"][:3]) == ["1000 MT", "1000 HA", "KG/HA"]
+    assert set(df["source"]) == {"CONAB"} and set(df["report_date"]) == {"2026-10-16"}
+
+
 # ── Notícias Agrícolas CEPEA/ESALQ republication (Layer 17) ─────────────────
 
 def _load_noticias_html(name: str = "noticias_agricolas_parana.html") -> str:
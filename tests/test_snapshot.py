@@ -30,7 +30,7 @@ def _patch_health(patched_db: Path, monkeypatch: pytest.MonkeyPatch):
     def _connect() -> sqlite3.Connection:
         return sqlite3.connect(str(patched_db))
 
-    monkeypatch.setattr("analysis.health.get_connection", _connect)
+    monkeypatch.setattr("analysis.health.get_read_connection", _connect)
     clear_loader_cache()
     yield
     clear_loader_cache()
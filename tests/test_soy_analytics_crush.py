@@ -0,0 +1,38 @@
+"""Tests for the relative_value_analysis() crush block.
+
+The analyst converts the crush spread to USD/MT once and hands the
+series to the dashboard; the loader frames it reads are shared via
+lru_cache and must come back untouched.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from analysis import soy_analytics
+from pipeline.units import to_metric_tons
+
+
+def _close_df(closes: list[float]) -> pd.DataFrame:
+    idx = pd.date_range("2026-01-05", periods=len(closes), freq="B", name="Date")
+    return pd.DataFrame({"Close": closes}, index=idx)
+
+
+def test_crush_series_usd_mt_matches_scalar_conversion(monkeypatch):
+    prices = {
+        "Soybeans": _close_df([1000.0, 1010.0, 995.0]),
+        "Soybean Oil": _close_df([45.0, 46.0, 44.5]),
+        "Soybean Meal": _close_df([300.0, 305.0, 298.0]),
+    }
+    before = {k: v.copy() for k, v in prices.items()}
+    monkeypatch.setattr(soy_analytics, "_load_soy_prices", lambda: prices)
+    monkeypatch.setattr(soy_analytics, "_load_currency_data", lambda: {})
+
+    crush = soy_analytics.relative_value_analysis()["crush"]
+
+    expected = [to_metric_tons(v, "Soybeans") for v in crush["series"]["crush_spread"]]
+    assert list(crush["series_usd_mt"]) == pytest.approx(expected)
+    assert crush["current_usd_mt"] == pytest.approx(expected[-1])
+    for name, df in prices.items():
+        pd.testing.assert_frame_equal(df, before[name])
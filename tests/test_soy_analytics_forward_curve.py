@@ -0,0 +1,31 @@
+"""Tests for forward_curve_analysis() unit conversion.
+
+The analyst hands the dashboard the curve and its front/back quotes
+already in USD/MT, so the page only formats them.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from analysis import soy_analytics
+from pipeline.units import CONVERSION_FACTORS
+
+
+def test_front_and_back_quotes_are_converted_with_the_curve(monkeypatch):
+    curve = pd.DataFrame({
+        "contract_month": ["2026-11", "2027-01", "2027-03"],
+        "label": ["Nov 26", "Jan 27", "Mar 27"],
+        "close": [1000.0, 1010.0, 1025.0],
+    })
+    monkeypatch.setattr(soy_analytics, "load_forward_curves", lambda: {"Soybeans": curve})
+
+    leg = soy_analytics.forward_curve_analysis()["Soybeans"]
+
+    factor = CONVERSION_FACTORS["Soybeans"]
+    assert leg["analysis"]["front_price_mt"] == pytest.approx(1000.0 * factor)
+    assert leg["analysis"]["back_price_mt"] == pytest.approx(1025.0 * factor)
+    assert leg["analysis"]["front_price"] == 1000.0
+    assert list(leg["curve_data_mt"]["close"]) == pytest.approx([c * factor for c in curve["close"]])
+    assert list(curve["close"]) == [1000.0, 1010.0, 1025.0]
@@ -0,0 +1,87 @@
+"""Tests for risk_analysis() COT, weather and correlation summaries.
+
+The COT and weather blocks take the latest row(s) per key from a long
+table; rows are inserted out of date order so a summary that trusted
+insertion order instead of sorting would surface the wrong report.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from analysis.loaders import clear_loader_cache
+from analysis.soy_analytics import risk_analysis
+from pipeline import store
+
+
+def _insert_cot(conn: sqlite3.Connection, commodity: str, date: str, spec_net: float) -> None:
+    conn.execute(
+        "INSERT INTO cot (commodity, Date, commercial_net, noncommercial_net, total_open_interest)"
+        " VALUES (?, ?, ?, ?, ?)",
+        (commodity, date, -spec_net, spec_net, 500_000.0),
+    )
+
+
+def test_risk_analysis_cot_uses_latest_two_reports_per_leg(patched_db: Path) -> None:
+    conn = sqlite3.connect(str(patched_db))
+    _insert_cot(conn, "Soybeans", "2026-07-14", 120_000.0)
+    _insert_cot(conn, "Soybeans", "2026-06-30", 90_000.0)
+    _insert_cot(conn, "Soybeans", "2026-07-07", 100_000.0)
+    _insert_cot(conn, "Soybean Oil", "2026-07-14", 40_000.0)
+    _insert_cot(conn, "Corn", "2026-07-21", 1.0)  # not a soy leg
+    conn.commit()
+    conn.close()
+
+    cot = risk_analysis()["cot"]
+
+    assert list(cot) == ["Soybeans", "Soybean Oil"]
+    assert cot["Soybeans"]["spec_net"] == 120_000.0
+    assert cot["Soybeans"]["spec_net_chg"] == 20_000.0
+    assert "spec_net_chg" not in cot["Soybean Oil"]
+
+
+def test_risk_analysis_weather_alert_from_latest_day(patched_db: Path) -> None:
+    conn = sqlite3.connect(str(patched_db))
+    conn.executemany(
+        "INSERT INTO weather (region, Date, temp_max, temp_min, precipitation) VALUES (?, ?, ?, ?, ?)",
+        [
+            ("US Midwest (Iowa)", "2026-07-15", 40.0, 22.0, 5.0),
+            ("US Midwest (Iowa)", "2026-07-14", 28.0, 18.0, 5.0),
+            ("Brazil Parana", "2026-07-14", 45.0, 20.0, 5.0),
+            ("Brazil Parana", "2026-07-15", 25.0, 15.0, 5.0),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    alerts = {a["region"]: a for a in risk_analysis()["weather_alerts"]}
+
+    assert alerts["US Midwest (Iowa)"]["alert"] == "Extreme Heat"
+    assert "Brazil Parana" not in alerts
+
+
+def test_risk_analysis_correlations_frame(patched_db: Path) -> None:
+    rng = np.random.default_rng(3)
+    idx = pd.date_range("2025-01-01", periods=120, freq="B", name="Date")
+    for name in ("Soybeans", "Soybean Oil"):
+        close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, len(idx))))
+        store.save_price_data(
+            name,
+            pd.DataFrame(
+                {"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1.0},
+                index=idx,
+            ),
+        )
+    clear_loader_cache()
+    try:
+        corr = risk_analysis()["correlations"]
+    finally:
+        clear_loader_cache()
+
+    assert list(corr.columns) == ["Soybeans vs Soy Oil"]
+    assert corr.index[-1] == idx[-1]
+    assert corr["Soybeans vs Soy Oil"].dropna().between(-1, 1).all()
@@ -0,0 +1,35 @@
+"""Tests for technicals_analysis() signal grouping.
+
+`signals_by_commodity` lets the dashboard look up a leg's signals
+directly; each per-leg list must keep the global severity order.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from analysis import soy_analytics
+
+
+def test_signals_by_commodity_groups_in_severity_order(monkeypatch):
+    idx = pd.date_range("2026-01-05", periods=3, freq="B", name="Date")
+    frame = pd.DataFrame({"Close": [1.0, 2.0, 3.0]}, index=idx)
+    monkeypatch.setattr(
+        soy_analytics, "_load_soy_prices", lambda: {"Soybeans": frame, "Soybean Oil": frame}
+    )
+    monkeypatch.setattr(
+        soy_analytics,
+        "detect_all_signals",
+        lambda df, leg: [
+            {"commodity": leg, "severity": "info", "type": "a"},
+            {"commodity": leg, "severity": "alert", "type": "b"},
+        ],
+    )
+    monkeypatch.setattr(soy_analytics, "demote_near_roll_signals", lambda signals: signals)
+
+    out = soy_analytics.technicals_analysis()
+
+    grouped = out["signals_by_commodity"]
+    assert set(grouped) == {"Soybeans", "Soybean Oil"}
+    assert [s["severity"] for s in grouped["Soybeans"]] == ["alert", "info"]
+    assert sum(len(v) for v in grouped.values()) == len(out["signals"])
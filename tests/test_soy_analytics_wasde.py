@@ -41,3 +41,28 @@ def test_supply_analysis_pins_wasde_to_latest_marketing_year(patched_db: Path) -
     # MoM within the pinned MY — never the +372 cross-year artifact.
     assert exports["revision"] == pytest.approx(-10.0)
     assert exports["prev_value"] == 1_530.0
+
+
+def test_supply_analysis_wasde_keeps_table_order_per_commodity(patched_db: Path) -> None:
+    conn = sqlite3.connect(str(patched_db))
+    conn.executemany(
+        "INSERT INTO wasde (commodity, year, attribute, value, unit, reference_period)"
+        " VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("SOYBEANS", "2025/26", "Production", 4_300.0, "Million Bushels", "2026-07-15"),
+            ("CORN", "2025/26", "Exports", 2_400.0, "Million Bushels", "2026-07-15"),
+            ("SOYBEANS", "2025/26", "Exports", 1_520.0, "Million Bushels", "2026-07-15"),
+            ("SOYBEANS", "2025/26", "Production", 4_340.0, "Million Bushels", "2026-06-15"),
+            ("SOYBEANS", "2025/26", "Crush", None, "Million Bushels", "2026-07-15"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    wasde = supply_analysis()["wasde"]
+
+    assert list(wasde) == ["SOYBEANS", "CORN"]
+    assert list(wasde["SOYBEANS"]) == ["Production", "Exports", "Crush"]
+    assert wasde["SOYBEANS"]["Production"]["revision"] == pytest.approx(-40.0)
+    assert "revision" not in wasde["SOYBEANS"]["Exports"]
+    assert "revision" not in wasde["CORN"]["Exports"]
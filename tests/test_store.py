@@ -459,6 +459,7 @@ def test_read_briefing_missing_returns_none(patched_db):
     "save_call",
     [
         pytest.param(lambda: store.save_price_data("X", pd.DataFrame()), id="prices"),
+        pytest.param(lambda: store.save_price_data_bulk({"X": pd.DataFrame()}), id="prices_bulk"),
         pytest.param(lambda: store.save_fred_data("X", pd.Series(dtype=float)), id="fred"),
         pytest.param(lambda: store.save_usda_data(pd.DataFrame(), "X"), id="usda"),
         pytest.param(lambda: store.save_crop_progress("X", pd.DataFrame()), id="crop_progress"),
@@ -503,6 +504,21 @@ def test_save_price_data_insert_or_replace_updates_existing_row(patched_db):
     assert out["Close"].iloc[0] == 1500.0
 
 
+def test_save_price_data_bulk_matches_per_commodity_saves(patched_db):
+    store.save_price_data_bulk({
+        "Soybeans": _price_df(["2026-01-01", "2026-01-02"], [1200.0, 1210.0]),
+        "Corn": _price_df(["2026-01-01"], [450.0]),
+        "Wheat": pd.DataFrame(),
+    })
+
+    rows = _fetchall(patched_db, "SELECT commodity, Date, Close FROM prices ORDER BY commodity, Date")
+    assert rows == [
+        ("Corn", "2026-01-01", 450.0),
+        ("Soybeans", "2026-01-01", 1200.0),
+        ("Soybeans", "2026-01-02", 1210.0),
+    ]
+
+
 # ---------------------------------------------------------------------------
 # save_freshness
 # ---------------------------------------------------------------------------
@@ -16,6 +16,7 @@ import pandas.testing as pdt
 import pytest
 
 from analysis.technical import (
+    _rolling_mean_std,
     add_moving_averages,
     add_price_changes,
     add_rsi,
@@ -160,6 +161,20 @@ def test_add_price_changes_does_not_mutate_input():
     pdt.assert_frame_equal(df, before)
 
 
+def test_add_price_changes_matches_pandas_pct_change(synthetic_ohlcv):
+    out = add_price_changes(synthetic_ohlcv)
+    close = synthetic_ohlcv["Close"]
+    pdt.assert_series_equal(out["daily_pct_change"], close.pct_change() * 100, check_names=False)
+    pdt.assert_series_equal(out["weekly_pct_change"], close.pct_change(periods=5) * 100, check_names=False)
+
+
+def test_add_price_changes_shorter_than_window_is_all_nan():
+    df = _monotonic_close(start=100.0, step=1.0, n=3)
+    out = add_price_changes(df)
+    assert out["weekly_pct_change"].isna().all()
+    assert out["daily_pct_change"].iloc[1:].notna().all()
+
+
 # ---------------------------------------------------------------------------
 # calculate_macd
 # ---------------------------------------------------------------------------
@@ -270,6 +285,30 @@ def test_calculate_volatility_does_not_mutate_input():
     pdt.assert_frame_equal(df, before)
 
 
+# ---------------------------------------------------------------------------
+# _rolling_mean_std (shared by Bollinger and volatility)
+# ---------------------------------------------------------------------------
+
+
+def test_rolling_mean_std_matches_pandas_with_gaps(synthetic_ohlcv):
+    close = synthetic_ohlcv["Close"] * 10.0  # price levels in the ~1,000s
+    close.iloc[[40, 41, 150]] = np.nan
+
+    stats = _rolling_mean_std(close.to_numpy(), [20, 60])
+
+    for w in (20, 60):
+        mean, std = stats[w]
+        rolling = close.rolling(window=w)
+        np.testing.assert_allclose(mean, rolling.mean().to_numpy(), rtol=1e-10, equal_nan=True)
+        np.testing.assert_allclose(std, rolling.std().to_numpy(), rtol=1e-8, equal_nan=True)
+
+
+def test_rolling_mean_std_shorter_than_window_is_nan():
+    mean, std = _rolling_mean_std(np.array([1.0, 2.0, 3.0]), [20])[20]
+    assert np.isnan(mean).all()
+    assert np.isnan(std).all()
+
+
 # ---------------------------------------------------------------------------
 # compute_all_technicals
 # ---------------------------------------------------------------------------